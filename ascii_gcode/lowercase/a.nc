@@ -20,4 +20,73 @@ G1 X0.00 Y1.09
 G1 X0.16 Y1.74
 G1 X0.63 Y2.23
 G1 X2.50 Y2.64
-G1 X3.45 Y2.64
\ No newline at end of file
+G1 X3.45 Y2.64
+; variant
+G0 X3.45 Y2.64
+G1 X2.50 Y2.64
+G1 X0.63 Y2.23
+G1 X0.16 Y1.74
+G1 X0.00 Y1.09
+G1 X0.10 Y0.60
+G1 X0.38 Y0.22
+G1 X0.80 Y-0.03
+G1 X1.32 Y-0.11
+G1 X1.74 Y-0.08
+G1 X2.15 Y0.02
+G1 X2.57 Y0.22
+G1 X3.01 Y0.55
+G1 X3.45 Y0.99
+G0 X3.45 Y0.00
+G1 X3.45 Y2.79
+G1 X3.36 Y3.45
+G1 X3.08 Y3.95
+G1 X2.57 Y4.27
+G1 X1.81 Y4.38
+G1 X0.60 Y4.09
+G1 X0.13 Y3.19
+; variant
+G0 X3.45 Y0.99
+G1 X3.01 Y0.55
+G1 X2.57 Y0.22
+G1 X2.15 Y0.02
+G1 X1.74 Y-0.08
+G1 X1.32 Y-0.11
+G1 X0.80 Y-0.03
+G1 X0.38 Y0.22
+G1 X0.10 Y0.60
+G1 X0.00 Y1.09
+G1 X0.16 Y1.74
+G1 X0.63 Y2.23
+G1 X2.50 Y2.64
+G1 X3.45 Y2.64
+G0 X3.45 Y0.00
+G1 X3.45 Y2.79
+G1 X3.36 Y3.45
+G1 X3.08 Y3.95
+G1 X2.57 Y4.27
+G1 X1.81 Y4.38
+G1 X0.60 Y4.09
+G1 X0.13 Y3.19
+; variant
+G0 X3.45 Y0.00
+G1 X3.45 Y2.79
+G1 X3.36 Y3.45
+G1 X3.08 Y3.95
+G1 X2.57 Y4.27
+G1 X1.81 Y4.38
+G1 X0.60 Y4.09
+G1 X0.13 Y3.19
+G0 X3.45 Y2.64
+G1 X2.50 Y2.64
+G1 X0.63 Y2.23
+G1 X0.16 Y1.74
+G1 X0.00 Y1.09
+G1 X0.10 Y0.60
+G1 X0.38 Y0.22
+G1 X0.80 Y-0.03
+G1 X1.32 Y-0.11
+G1 X1.74 Y-0.08
+G1 X2.15 Y0.02
+G1 X2.57 Y0.22
+G1 X3.01 Y0.55
+G1 X3.45 Y0.99
\ No newline at end of file
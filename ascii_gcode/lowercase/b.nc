@@ -17,4 +17,64 @@ G1 X1.53 Y4.34
 G1 X1.17 Y4.21
 G1 X0.80 Y3.97
 G1 X0.44 Y3.59
-G1 X0.00 Y2.74
\ No newline at end of file
+G1 X0.00 Y2.74
+; variant
+G0 X0.00 Y2.74
+G1 X0.44 Y3.59
+G1 X0.80 Y3.97
+G1 X1.17 Y4.21
+G1 X1.53 Y4.34
+G1 X1.87 Y4.38
+G1 X2.58 Y4.22
+G1 X3.09 Y3.78
+G1 X3.41 Y3.08
+G1 X3.52 Y2.18
+G1 X3.39 Y1.23
+G1 X3.03 Y0.51
+G1 X2.49 Y0.05
+G1 X1.82 Y-0.11
+G1 X1.14 Y0.01
+G1 X0.44 Y0.45
+G1 X0.00 Y0.89
+G0 X0.00 Y0.00
+G1 X0.00 Y6.03
+; variant
+G0 X0.00 Y0.89
+G1 X0.44 Y0.45
+G1 X1.14 Y0.01
+G1 X1.82 Y-0.11
+G1 X2.49 Y0.05
+G1 X3.03 Y0.51
+G1 X3.39 Y1.23
+G1 X3.52 Y2.18
+G1 X3.41 Y3.08
+G1 X3.09 Y3.78
+G1 X2.58 Y4.22
+G1 X1.87 Y4.38
+G1 X1.53 Y4.34
+G1 X1.17 Y4.21
+G1 X0.80 Y3.97
+G1 X0.44 Y3.59
+G1 X0.00 Y2.74
+G0 X0.00 Y0.00
+G1 X0.00 Y6.03
+; variant
+G0 X0.00 Y0.00
+G1 X0.00 Y6.03
+G0 X0.00 Y2.74
+G1 X0.44 Y3.59
+G1 X0.80 Y3.97
+G1 X1.17 Y4.21
+G1 X1.53 Y4.34
+G1 X1.87 Y4.38
+G1 X2.58 Y4.22
+G1 X3.09 Y3.78
+G1 X3.41 Y3.08
+G1 X3.52 Y2.18
+G1 X3.39 Y1.23
+G1 X3.03 Y0.51
+G1 X2.49 Y0.05
+G1 X1.82 Y-0.11
+G1 X1.14 Y0.01
+G1 X0.44 Y0.45
+G1 X0.00 Y0.89
\ No newline at end of file
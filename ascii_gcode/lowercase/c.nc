@@ -14,4 +14,21 @@ G1 X1.90 Y-0.11
 G1 X2.47 Y-0.03
 G1 X2.95 Y0.21
 G1 X3.30 Y0.60
-G1 X3.50 Y1.15
\ No newline at end of file
+G1 X3.50 Y1.15
+; variant
+G0 X3.50 Y1.15
+G1 X3.30 Y0.60
+G1 X2.95 Y0.21
+G1 X2.47 Y-0.03
+G1 X1.90 Y-0.11
+G1 X1.13 Y0.04
+G1 X0.53 Y0.47
+G1 X0.14 Y1.18
+G1 X0.00 Y2.14
+G1 X0.14 Y3.09
+G1 X0.52 Y3.79
+G1 X1.12 Y4.23
+G1 X1.90 Y4.38
+G1 X2.48 Y4.30
+G1 X2.95 Y4.06
+G1 X3.30 Y3.66
\ No newline at end of file
@@ -17,4 +17,64 @@ G1 X1.99 Y4.34
 G1 X2.35 Y4.21
 G1 X2.72 Y3.97
 G1 X3.08 Y3.59
-G1 X3.52 Y2.74
\ No newline at end of file
+G1 X3.52 Y2.74
+; variant
+G0 X3.52 Y2.74
+G1 X3.08 Y3.59
+G1 X2.72 Y3.97
+G1 X2.35 Y4.21
+G1 X1.99 Y4.34
+G1 X1.65 Y4.38
+G1 X0.94 Y4.22
+G1 X0.43 Y3.78
+G1 X0.11 Y3.08
+G1 X0.00 Y2.18
+G1 X0.13 Y1.23
+G1 X0.49 Y0.51
+G1 X1.03 Y0.05
+G1 X1.70 Y-0.11
+G1 X2.38 Y0.01
+G1 X3.08 Y0.45
+G1 X3.52 Y0.89
+G0 X3.52 Y0.00
+G1 X3.52 Y6.03
+; variant
+G0 X3.52 Y0.89
+G1 X3.08 Y0.45
+G1 X2.38 Y0.01
+G1 X1.70 Y-0.11
+G1 X1.03 Y0.05
+G1 X0.49 Y0.51
+G1 X0.13 Y1.23
+G1 X0.00 Y2.18
+G1 X0.11 Y3.08
+G1 X0.43 Y3.78
+G1 X0.94 Y4.22
+G1 X1.65 Y4.38
+G1 X1.99 Y4.34
+G1 X2.35 Y4.21
+G1 X2.72 Y3.97
+G1 X3.08 Y3.59
+G1 X3.52 Y2.74
+G0 X3.52 Y0.00
+G1 X3.52 Y6.03
+; variant
+G0 X3.52 Y0.00
+G1 X3.52 Y6.03
+G0 X3.52 Y2.74
+G1 X3.08 Y3.59
+G1 X2.72 Y3.97
+G1 X2.35 Y4.21
+G1 X1.99 Y4.34
+G1 X1.65 Y4.38
+G1 X0.94 Y4.22
+G1 X0.43 Y3.78
+G1 X0.11 Y3.08
+G1 X0.00 Y2.18
+G1 X0.13 Y1.23
+G1 X0.49 Y0.51
+G1 X1.03 Y0.05
+G1 X1.70 Y-0.11
+G1 X2.38 Y0.01
+G1 X3.08 Y0.45
+G1 X3.52 Y0.89
\ No newline at end of file
@@ -16,4 +16,23 @@ G1 X1.99 Y-0.11
 G1 X2.60 Y-0.03
 G1 X3.11 Y0.22
 G1 X3.49 Y0.61
-G1 X3.70 Y1.15
\ No newline at end of file
+G1 X3.70 Y1.15
+; variant
+G0 X3.70 Y1.15
+G1 X3.49 Y0.61
+G1 X3.11 Y0.22
+G1 X2.60 Y-0.03
+G1 X1.99 Y-0.11
+G1 X1.17 Y0.04
+G1 X0.55 Y0.48
+G1 X0.14 Y1.19
+G1 X0.00 Y2.14
+G1 X0.14 Y3.08
+G1 X0.53 Y3.78
+G1 X1.13 Y4.23
+G1 X1.90 Y4.38
+G1 X2.69 Y4.23
+G1 X3.29 Y3.78
+G1 X3.67 Y3.08
+G1 X3.80 Y2.14
+G1 X0.00 Y2.14
\ No newline at end of file
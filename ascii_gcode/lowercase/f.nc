@@ -1,4 +1,34 @@
 (f)
+G0 X0.00 Y4.05
+G1 X1.92 Y4.05
+G0 X2.12 Y6.07
+G1 X1.85 Y6.08
+G1 X1.53 Y6.00
+G1 X1.25 Y5.77
+G1 X1.03 Y5.44
+G1 X0.89 Y4.77
+G1 X0.89 Y0.00
+; variant
+G0 X0.89 Y0.00
+G1 X0.89 Y4.77
+G1 X1.03 Y5.44
+G1 X1.25 Y5.77
+G1 X1.53 Y6.00
+G1 X1.85 Y6.08
+G1 X2.12 Y6.07
+G0 X1.92 Y4.05
+G1 X0.00 Y4.05
+; variant
+G0 X1.92 Y4.05
+G1 X0.00 Y4.05
+G0 X2.12 Y6.07
+G1 X1.85 Y6.08
+G1 X1.53 Y6.00
+G1 X1.25 Y5.77
+G1 X1.03 Y5.44
+G1 X0.89 Y4.77
+G1 X0.89 Y0.00
+; variant
 G0 X2.12 Y6.07
 G1 X1.85 Y6.08
 G1 X1.53 Y6.00
@@ -1,4 +1,14 @@
 (g)
+G0 X0.15 Y-0.46
+G1 X0.28 Y-0.97
+G1 X0.61 Y-1.33
+G1 X1.11 Y-1.56
+G1 X1.77 Y-1.64
+G1 X2.53 Y-1.54
+G1 X3.08 Y-1.21
+G1 X3.41 Y-0.62
+G1 X3.52 Y0.25
+G1 X3.52 Y4.27
 G0 X3.52 Y3.43
 G1 X3.08 Y3.87
 G1 X2.71 Y4.12
@@ -18,13 +28,93 @@ G1 X2.31 Y0.00
 G1 X2.67 Y0.22
 G1 X3.08 Y0.62
 G1 X3.52 Y1.20
-G0 X0.15 Y-0.46
-G1 X0.28 Y-0.97
-G1 X0.61 Y-1.33
-G1 X1.11 Y-1.56
-G1 X1.77 Y-1.64
-G1 X2.53 Y-1.54
+; variant
+G0 X3.52 Y1.20
+G1 X3.08 Y0.62
+G1 X2.67 Y0.22
+G1 X2.31 Y0.00
+G1 X1.97 Y-0.09
+G1 X1.65 Y-0.11
+G1 X0.94 Y0.05
+G1 X0.42 Y0.50
+G1 X0.10 Y1.20
+G1 X0.00 Y2.10
+G1 X0.13 Y3.06
+G1 X0.48 Y3.77
+G1 X1.02 Y4.22
+G1 X1.69 Y4.38
+G1 X2.01 Y4.36
+G1 X2.36 Y4.28
+G1 X2.71 Y4.12
+G1 X3.08 Y3.87
+G1 X3.52 Y3.43
+G0 X3.52 Y4.27
+G1 X3.52 Y0.25
+G1 X3.41 Y-0.62
 G1 X3.08 Y-1.21
+G1 X2.53 Y-1.54
+G1 X1.77 Y-1.64
+G1 X1.11 Y-1.56
+G1 X0.61 Y-1.33
+G1 X0.28 Y-0.97
+G1 X0.15 Y-0.46
+; variant
+G0 X3.52 Y3.43
+G1 X3.08 Y3.87
+G1 X2.71 Y4.12
+G1 X2.36 Y4.28
+G1 X2.01 Y4.36
+G1 X1.69 Y4.38
+G1 X1.02 Y4.22
+G1 X0.48 Y3.77
+G1 X0.13 Y3.06
+G1 X0.00 Y2.10
+G1 X0.10 Y1.20
+G1 X0.42 Y0.50
+G1 X0.94 Y0.05
+G1 X1.65 Y-0.11
+G1 X1.97 Y-0.09
+G1 X2.31 Y0.00
+G1 X2.67 Y0.22
+G1 X3.08 Y0.62
+G1 X3.52 Y1.20
+G0 X3.52 Y4.27
+G1 X3.52 Y0.25
 G1 X3.41 Y-0.62
+G1 X3.08 Y-1.21
+G1 X2.53 Y-1.54
+G1 X1.77 Y-1.64
+G1 X1.11 Y-1.56
+G1 X0.61 Y-1.33
+G1 X0.28 Y-0.97
+G1 X0.15 Y-0.46
+; variant
+G0 X3.52 Y4.27
 G1 X3.52 Y0.25
-G1 X3.52 Y4.27
\ No newline at end of file
+G1 X3.41 Y-0.62
+G1 X3.08 Y-1.21
+G1 X2.53 Y-1.54
+G1 X1.77 Y-1.64
+G1 X1.11 Y-1.56
+G1 X0.61 Y-1.33
+G1 X0.28 Y-0.97
+G1 X0.15 Y-0.46
+G0 X3.52 Y1.20
+G1 X3.08 Y0.62
+G1 X2.67 Y0.22
+G1 X2.31 Y0.00
+G1 X1.97 Y-0.09
+G1 X1.65 Y-0.11
+G1 X0.94 Y0.05
+G1 X0.42 Y0.50
+G1 X0.10 Y1.20
+G1 X0.00 Y2.10
+G1 X0.13 Y3.06
+G1 X0.48 Y3.77
+G1 X1.02 Y4.22
+G1 X1.69 Y4.38
+G1 X2.01 Y4.36
+G1 X2.36 Y4.28
+G1 X2.71 Y4.12
+G1 X3.08 Y3.87
+G1 X3.52 Y3.43
\ No newline at end of file
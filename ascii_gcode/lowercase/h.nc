@@ -1,4 +1,32 @@
 (h)
+G0 X0.00 Y0.00
+G1 X0.00 Y6.03
+G0 X0.00 Y3.10
+G1 X0.44 Y3.64
+G1 X0.85 Y4.02
+G1 X1.24 Y4.25
+G1 X1.60 Y4.35
+G1 X1.93 Y4.38
+G1 X2.50 Y4.26
+G1 X2.92 Y3.95
+G1 X3.10 Y3.60
+G1 X3.25 Y2.83
+G1 X3.25 Y0.00
+; variant
+G0 X3.25 Y0.00
+G1 X3.25 Y2.83
+G1 X3.10 Y3.60
+G1 X2.92 Y3.95
+G1 X2.50 Y4.26
+G1 X1.93 Y4.38
+G1 X1.60 Y4.35
+G1 X1.24 Y4.25
+G1 X0.85 Y4.02
+G1 X0.44 Y3.64
+G1 X0.00 Y3.10
+G0 X0.00 Y6.03
+G1 X0.00 Y0.00
+; variant
 G0 X0.00 Y6.03
 G1 X0.00 Y0.00
 G0 X0.00 Y3.10
@@ -11,4 +39,18 @@ G1 X2.50 Y4.26
 G1 X2.92 Y3.95
 G1 X3.10 Y3.60
 G1 X3.25 Y2.83
-G1 X3.25 Y0.00
\ No newline at end of file
+G1 X3.25 Y0.00
+; variant
+G0 X0.00 Y3.10
+G1 X0.44 Y3.64
+G1 X0.85 Y4.02
+G1 X1.24 Y4.25
+G1 X1.60 Y4.35
+G1 X1.93 Y4.38
+G1 X2.50 Y4.26
+G1 X2.92 Y3.95
+G1 X3.10 Y3.60
+G1 X3.25 Y2.83
+G1 X3.25 Y0.00
+G0 X0.00 Y0.00
+G1 X0.00 Y6.03
\ No newline at end of file
@@ -1,4 +1,14 @@
 (j)
+G0 X0.00 Y-1.63
+G1 X0.34 Y-1.64
+G1 X0.74 Y-1.59
+G1 X1.05 Y-1.37
+G1 X1.25 Y-0.92
+G1 X1.32 Y-0.18
+G1 X1.32 Y4.28
+G0 X1.32 Y6.03
+G1 X1.32 Y6.03
+; variant
 G0 X1.32 Y6.03
 G1 X1.32 Y6.03
 G0 X1.32 Y4.28
@@ -7,4 +17,14 @@ G1 X1.25 Y-0.92
 G1 X1.05 Y-1.37
 G1 X0.74 Y-1.59
 G1 X0.34 Y-1.64
-G1 X0.00 Y-1.63
\ No newline at end of file
+G1 X0.00 Y-1.63
+; variant
+G0 X1.32 Y4.28
+G1 X1.32 Y-0.18
+G1 X1.25 Y-0.92
+G1 X1.05 Y-1.37
+G1 X0.74 Y-1.59
+G1 X0.34 Y-1.64
+G1 X0.00 Y-1.63
+G0 X1.32 Y6.03
+G1 X1.32 Y6.03
\ No newline at end of file
@@ -1,7 +1,28 @@
 (k)
 G0 X0.00 Y6.03
 G1 X0.00 Y0.00
+G0 X0.00 Y1.72
+G1 X3.07 Y4.28
+G0 X1.30 Y2.80
+G1 X3.25 Y0.00
+; variant
 G0 X3.25 Y0.00
 G1 X1.30 Y2.80
-G0 X0.00 Y1.72
-G1 X3.07 Y4.28
\ No newline at end of file
+G0 X3.07 Y4.28
+G1 X0.00 Y1.72
+G0 X0.00 Y0.00
+G1 X0.00 Y6.03
+; variant
+G0 X3.07 Y4.28
+G1 X0.00 Y1.72
+G0 X1.30 Y2.80
+G1 X3.25 Y0.00
+G0 X0.00 Y0.00
+G1 X0.00 Y6.03
+; variant
+G0 X0.00 Y0.00
+G1 X0.00 Y6.03
+G0 X3.07 Y4.28
+G1 X0.00 Y1.72
+G0 X1.30 Y2.80
+G1 X3.25 Y0.00
\ No newline at end of file
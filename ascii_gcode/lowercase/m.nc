@@ -1,6 +1,6 @@
 (m)
-G0 X0.00 Y4.27
-G1 X0.00 Y0.00
+G0 X0.00 Y0.00
+G1 X0.00 Y4.27
 G0 X0.00 Y3.05
 G1 X0.44 Y3.64
 G1 X0.85 Y4.03
@@ -10,6 +10,72 @@ G1 X1.85 Y4.38
 G1 X2.56 Y4.10
 G1 X2.98 Y3.30
 G1 X2.98 Y0.00
+G0 X5.65 Y0.00
+G1 X5.65 Y2.83
+G1 X5.55 Y3.40
+G1 X5.36 Y3.99
+G1 X5.05 Y4.25
+G1 X4.47 Y4.38
+G1 X4.09 Y4.35
+G1 X3.71 Y4.22
+G1 X3.33 Y3.88
+G1 X2.98 Y3.30
+; variant
+G0 X2.98 Y3.30
+G1 X3.33 Y3.88
+G1 X3.71 Y4.22
+G1 X4.09 Y4.35
+G1 X4.47 Y4.38
+G1 X5.05 Y4.25
+G1 X5.36 Y3.99
+G1 X5.55 Y3.40
+G1 X5.65 Y2.83
+G1 X5.65 Y0.00
+G0 X2.98 Y0.00
+G1 X2.98 Y3.30
+G1 X2.56 Y4.10
+G1 X1.85 Y4.38
+G1 X1.55 Y4.36
+G1 X1.22 Y4.25
+G1 X0.85 Y4.03
+G1 X0.44 Y3.64
+G1 X0.00 Y3.05
+G0 X0.00 Y4.27
+G1 X0.00 Y0.00
+; variant
+G0 X5.65 Y0.00
+G1 X5.65 Y2.83
+G1 X5.55 Y3.40
+G1 X5.36 Y3.99
+G1 X5.05 Y4.25
+G1 X4.47 Y4.38
+G1 X4.09 Y4.35
+G1 X3.71 Y4.22
+G1 X3.33 Y3.88
+G1 X2.98 Y3.30
+G0 X2.98 Y0.00
+G1 X2.98 Y3.30
+G1 X2.56 Y4.10
+G1 X1.85 Y4.38
+G1 X1.55 Y4.36
+G1 X1.22 Y4.25
+G1 X0.85 Y4.03
+G1 X0.44 Y3.64
+G1 X0.00 Y3.05
+G0 X0.00 Y4.27
+G1 X0.00 Y0.00
+; variant
+G0 X2.98 Y0.00
+G1 X2.98 Y3.30
+G1 X2.56 Y4.10
+G1 X1.85 Y4.38
+G1 X1.55 Y4.36
+G1 X1.22 Y4.25
+G1 X0.85 Y4.03
+G1 X0.44 Y3.64
+G1 X0.00 Y3.05
+G0 X0.00 Y4.27
+G1 X0.00 Y0.00
 G0 X2.98 Y3.30
 G1 X3.33 Y3.88
 G1 X3.71 Y4.22
@@ -1,4 +1,32 @@
 (n)
+G0 X0.00 Y0.00
+G1 X0.00 Y4.04
+G0 X0.00 Y2.50
+G1 X0.42 Y3.30
+G1 X0.77 Y3.88
+G1 X1.15 Y4.22
+G1 X1.53 Y4.35
+G1 X1.91 Y4.38
+G1 X2.49 Y4.25
+G1 X2.80 Y3.99
+G1 X2.99 Y3.40
+G1 X3.09 Y2.83
+G1 X3.09 Y0.00
+; variant
+G0 X3.09 Y0.00
+G1 X3.09 Y2.83
+G1 X2.99 Y3.40
+G1 X2.80 Y3.99
+G1 X2.49 Y4.25
+G1 X1.91 Y4.38
+G1 X1.53 Y4.35
+G1 X1.15 Y4.22
+G1 X0.77 Y3.88
+G1 X0.42 Y3.30
+G1 X0.00 Y2.50
+G0 X0.00 Y4.04
+G1 X0.00 Y0.00
+; variant
 G0 X0.00 Y4.04
 G1 X0.00 Y0.00
 G0 X0.00 Y2.50
@@ -11,4 +39,18 @@ G1 X2.49 Y4.25
 G1 X2.80 Y3.99
 G1 X2.99 Y3.40
 G1 X3.09 Y2.83
-G1 X3.09 Y0.00
\ No newline at end of file
+G1 X3.09 Y0.00
+; variant
+G0 X0.00 Y2.50
+G1 X0.42 Y3.30
+G1 X0.77 Y3.88
+G1 X1.15 Y4.22
+G1 X1.53 Y4.35
+G1 X1.91 Y4.38
+G1 X2.49 Y4.25
+G1 X2.80 Y3.99
+G1 X2.99 Y3.40
+G1 X3.09 Y2.83
+G1 X3.09 Y0.00
+G0 X0.00 Y0.00
+G1 X0.00 Y4.04
\ No newline at end of file
@@ -17,4 +17,24 @@ G1 X1.14 Y4.26
 G1 X0.44 Y3.82
 G1 X0.00 Y3.38
 G1 X0.00 Y4.27
-G1 X0.00 Y-1.76
\ No newline at end of file
+G1 X0.00 Y-1.76
+; variant
+G0 X0.00 Y-1.76
+G1 X0.00 Y4.27
+G1 X0.00 Y3.38
+G1 X0.44 Y3.82
+G1 X1.14 Y4.26
+G1 X1.82 Y4.38
+G1 X2.49 Y4.22
+G1 X3.03 Y3.76
+G1 X3.39 Y3.04
+G1 X3.52 Y2.09
+G1 X3.41 Y1.19
+G1 X3.09 Y0.49
+G1 X2.58 Y0.05
+G1 X1.87 Y-0.11
+G1 X1.53 Y-0.07
+G1 X1.17 Y0.06
+G1 X0.80 Y0.30
+G1 X0.44 Y0.68
+G1 X0.00 Y1.53
\ No newline at end of file
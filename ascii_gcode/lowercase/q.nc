@@ -17,4 +17,64 @@ G1 X2.38 Y4.26
 G1 X3.08 Y3.82
 G1 X3.52 Y3.38
 G0 X3.52 Y4.27
-G1 X3.52 Y-1.76
\ No newline at end of file
+G1 X3.52 Y-1.76
+; variant
+G0 X3.52 Y-1.76
+G1 X3.52 Y4.27
+G0 X3.52 Y3.38
+G1 X3.08 Y3.82
+G1 X2.38 Y4.26
+G1 X1.70 Y4.38
+G1 X1.03 Y4.22
+G1 X0.49 Y3.76
+G1 X0.13 Y3.04
+G1 X0.00 Y2.09
+G1 X0.11 Y1.19
+G1 X0.43 Y0.49
+G1 X0.94 Y0.05
+G1 X1.65 Y-0.11
+G1 X1.99 Y-0.07
+G1 X2.35 Y0.06
+G1 X2.72 Y0.30
+G1 X3.08 Y0.68
+G1 X3.52 Y1.53
+; variant
+G0 X3.52 Y3.38
+G1 X3.08 Y3.82
+G1 X2.38 Y4.26
+G1 X1.70 Y4.38
+G1 X1.03 Y4.22
+G1 X0.49 Y3.76
+G1 X0.13 Y3.04
+G1 X0.00 Y2.09
+G1 X0.11 Y1.19
+G1 X0.43 Y0.49
+G1 X0.94 Y0.05
+G1 X1.65 Y-0.11
+G1 X1.99 Y-0.07
+G1 X2.35 Y0.06
+G1 X2.72 Y0.30
+G1 X3.08 Y0.68
+G1 X3.52 Y1.53
+G0 X3.52 Y4.27
+G1 X3.52 Y-1.76
+; variant
+G0 X3.52 Y4.27
+G1 X3.52 Y-1.76
+G0 X3.52 Y1.53
+G1 X3.08 Y0.68
+G1 X2.72 Y0.30
+G1 X2.35 Y0.06
+G1 X1.99 Y-0.07
+G1 X1.65 Y-0.11
+G1 X0.94 Y0.05
+G1 X0.43 Y0.49
+G1 X0.11 Y1.19
+G1 X0.00 Y2.09
+G1 X0.13 Y3.04
+G1 X0.49 Y3.76
+G1 X1.03 Y4.22
+G1 X1.70 Y4.38
+G1 X2.38 Y4.26
+G1 X3.08 Y3.82
+G1 X3.52 Y3.38
\ No newline at end of file
@@ -8,4 +8,37 @@ G1 X1.18 Y4.25
 G1 X1.51 Y4.36
 G1 X1.80 Y4.38
 G1 X1.88 Y4.38
+G1 X1.97 Y4.37
+; variant
+G0 X1.97 Y4.37
+G1 X1.88 Y4.38
+G1 X1.80 Y4.38
+G1 X1.51 Y4.36
+G1 X1.18 Y4.25
+G1 X0.82 Y4.04
+G1 X0.45 Y3.68
+G1 X0.00 Y3.05
+G0 X0.00 Y4.27
+G1 X0.00 Y0.00
+; variant
+G0 X0.00 Y3.05
+G1 X0.45 Y3.68
+G1 X0.82 Y4.04
+G1 X1.18 Y4.25
+G1 X1.51 Y4.36
+G1 X1.80 Y4.38
+G1 X1.88 Y4.38
+G1 X1.97 Y4.37
+G0 X0.00 Y4.27
+G1 X0.00 Y0.00
+; variant
+G0 X0.00 Y4.27
+G1 X0.00 Y0.00
+G0 X0.00 Y3.05
+G1 X0.45 Y3.68
+G1 X0.82 Y4.04
+G1 X1.18 Y4.25
+G1 X1.51 Y4.36
+G1 X1.80 Y4.38
+G1 X1.88 Y4.38
 G1 X1.97 Y4.37
\ No newline at end of file
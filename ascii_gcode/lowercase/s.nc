@@ -22,4 +22,29 @@ G1 X1.57 Y4.38
 G1 X2.18 Y4.30
 G1 X2.73 Y4.12
 G1 X3.03 Y3.81
-G1 X3.17 Y3.32
\ No newline at end of file
+G1 X3.17 Y3.32
+; variant
+G0 X3.17 Y3.32
+G1 X3.03 Y3.81
+G1 X2.73 Y4.12
+G1 X2.18 Y4.30
+G1 X1.57 Y4.38
+G1 X0.96 Y4.30
+G1 X0.49 Y4.08
+G1 X0.19 Y3.73
+G1 X0.09 Y3.27
+G1 X0.18 Y2.79
+G1 X0.46 Y2.45
+G1 X0.91 Y2.30
+G1 X2.51 Y2.15
+G1 X2.97 Y1.99
+G1 X3.23 Y1.66
+G1 X3.32 Y1.22
+G1 X3.21 Y0.69
+G1 X2.89 Y0.27
+G1 X2.38 Y-0.01
+G1 X1.72 Y-0.11
+G1 X1.06 Y-0.01
+G1 X0.50 Y0.20
+G1 X0.18 Y0.60
+G1 X0.00 Y1.15
\ No newline at end of file
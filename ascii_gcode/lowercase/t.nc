@@ -1,4 +1,24 @@
 (t)
+G0 X0.00 Y4.05
+G1 X1.92 Y4.05
+G0 X0.89 Y5.39
+G1 X0.89 Y1.25
+G1 X1.03 Y0.58
+G1 X1.25 Y0.25
+G1 X1.53 Y0.02
+G1 X1.85 Y-0.06
+G1 X2.12 Y-0.05
+; variant
+G0 X1.92 Y4.05
+G1 X0.00 Y4.05
+G0 X0.89 Y5.39
+G1 X0.89 Y1.25
+G1 X1.03 Y0.58
+G1 X1.25 Y0.25
+G1 X1.53 Y0.02
+G1 X1.85 Y-0.06
+G1 X2.12 Y-0.05
+; variant
 G0 X2.12 Y-0.05
 G1 X1.85 Y-0.06
 G1 X1.53 Y0.02
@@ -7,4 +27,14 @@ G1 X1.03 Y0.58
 G1 X0.89 Y1.25
 G1 X0.89 Y5.39
 G0 X0.00 Y4.05
-G1 X1.92 Y4.05
\ No newline at end of file
+G1 X1.92 Y4.05
+; variant
+G0 X0.89 Y5.39
+G1 X0.89 Y1.25
+G1 X1.03 Y0.58
+G1 X1.25 Y0.25
+G1 X1.53 Y0.02
+G1 X1.85 Y-0.06
+G1 X2.12 Y-0.05
+G0 X1.92 Y4.05
+G1 X0.00 Y4.05
\ No newline at end of file
@@ -11,4 +11,46 @@ G1 X2.32 Y0.39
 G1 X2.67 Y0.97
 G1 X3.09 Y1.77
 G0 X3.09 Y0.00
-G1 X3.09 Y4.27
\ No newline at end of file
+G1 X3.09 Y4.27
+; variant
+G0 X3.09 Y4.27
+G1 X3.09 Y0.00
+G0 X3.09 Y1.77
+G1 X2.67 Y0.97
+G1 X2.32 Y0.39
+G1 X1.94 Y0.05
+G1 X1.56 Y-0.08
+G1 X1.18 Y-0.11
+G1 X0.60 Y0.02
+G1 X0.29 Y0.28
+G1 X0.10 Y0.87
+G1 X0.00 Y1.44
+G1 X0.00 Y4.27
+; variant
+G0 X3.09 Y0.00
+G1 X3.09 Y4.27
+G0 X3.09 Y1.77
+G1 X2.67 Y0.97
+G1 X2.32 Y0.39
+G1 X1.94 Y0.05
+G1 X1.56 Y-0.08
+G1 X1.18 Y-0.11
+G1 X0.60 Y0.02
+G1 X0.29 Y0.28
+G1 X0.10 Y0.87
+G1 X0.00 Y1.44
+G1 X0.00 Y4.27
+; variant
+G0 X3.09 Y1.77
+G1 X2.67 Y0.97
+G1 X2.32 Y0.39
+G1 X1.94 Y0.05
+G1 X1.56 Y-0.08
+G1 X1.18 Y-0.11
+G1 X0.60 Y0.02
+G1 X0.29 Y0.28
+G1 X0.10 Y0.87
+G1 X0.00 Y1.44
+G1 X0.00 Y4.27
+G0 X3.09 Y4.27
+G1 X3.09 Y0.00
\ No newline at end of file
@@ -1,4 +1,8 @@
 (v)
 G0 X0.00 Y4.27
 G1 X1.82 Y0.00
-G1 X3.63 Y4.27
\ No newline at end of file
+G1 X3.63 Y4.27
+; variant
+G0 X3.63 Y4.27
+G1 X1.82 Y0.00
+G1 X0.00 Y4.27
\ No newline at end of file
@@ -3,4 +3,10 @@ G0 X0.00 Y4.27
 G1 X1.52 Y0.00
 G1 X2.85 Y4.27
 G1 X4.22 Y0.00
-G1 X5.70 Y4.27
\ No newline at end of file
+G1 X5.70 Y4.27
+; variant
+G0 X5.70 Y4.27
+G1 X4.22 Y0.00
+G1 X2.85 Y4.27
+G1 X1.52 Y0.00
+G1 X0.00 Y4.27
\ No newline at end of file
@@ -2,4 +2,19 @@
 G0 X0.00 Y4.27
 G1 X3.55 Y0.00
 G0 X0.00 Y0.00
-G1 X3.55 Y4.27
\ No newline at end of file
+G1 X3.55 Y4.27
+; variant
+G0 X3.55 Y0.00
+G1 X0.00 Y4.27
+G0 X3.55 Y4.27
+G1 X0.00 Y0.00
+; variant
+G0 X0.00 Y0.00
+G1 X3.55 Y4.27
+G0 X0.00 Y4.27
+G1 X3.55 Y0.00
+; variant
+G0 X3.55 Y4.27
+G1 X0.00 Y0.00
+G0 X3.55 Y0.00
+G1 X0.00 Y4.27
\ No newline at end of file
@@ -8,4 +8,37 @@ G1 X1.10 Y-1.54
 G1 X1.47 Y-1.25
 G1 X1.79 Y-0.76
 G1 X2.08 Y-0.08
-G1 X3.64 Y4.27
\ No newline at end of file
+G1 X3.64 Y4.27
+; variant
+G0 X3.64 Y4.27
+G1 X2.08 Y-0.08
+G1 X1.79 Y-0.76
+G1 X1.47 Y-1.25
+G1 X1.10 Y-1.54
+G1 X0.64 Y-1.64
+G1 X0.47 Y-1.64
+G1 X0.30 Y-1.62
+G0 X2.08 Y-0.08
+G1 X0.00 Y4.27
+; variant
+G0 X2.08 Y-0.08
+G1 X0.00 Y4.27
+G0 X3.64 Y4.27
+G1 X2.08 Y-0.08
+G1 X1.79 Y-0.76
+G1 X1.47 Y-1.25
+G1 X1.10 Y-1.54
+G1 X0.64 Y-1.64
+G1 X0.47 Y-1.64
+G1 X0.30 Y-1.62
+; variant
+G0 X0.30 Y-1.62
+G1 X0.47 Y-1.64
+G1 X0.64 Y-1.64
+G1 X1.10 Y-1.54
+G1 X1.47 Y-1.25
+G1 X1.79 Y-0.76
+G1 X2.08 Y-0.08
+G1 X3.64 Y4.27
+G0 X0.00 Y4.27
+G1 X2.08 Y-0.08
\ No newline at end of file
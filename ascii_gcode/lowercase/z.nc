@@ -2,4 +2,9 @@
 G0 X0.16 Y4.27
 G1 X3.43 Y4.27
 G1 X0.00 Y0.00
-G1 X3.56 Y0.00
\ No newline at end of file
+G1 X3.56 Y0.00
+; variant
+G0 X3.56 Y0.00
+G1 X0.00 Y0.00
+G1 X3.43 Y4.27
+G1 X0.16 Y4.27
\ No newline at end of file
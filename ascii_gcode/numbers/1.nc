@@ -3,4 +3,10 @@ G0 X0.00 Y4.47
 G1 X0.84 Y4.90
 G1 X1.49 Y5.45
 G1 X1.93 Y6.03
-G1 X1.93 Y0.00
\ No newline at end of file
+G1 X1.93 Y0.00
+; variant
+G0 X1.93 Y0.00
+G1 X1.93 Y6.03
+G1 X1.49 Y5.45
+G1 X0.84 Y4.90
+G1 X0.00 Y4.47
\ No newline at end of file
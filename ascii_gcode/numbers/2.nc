@@ -13,4 +13,20 @@ G1 X2.68 Y3.18
 G1 X1.30 Y2.06
 G1 X0.77 Y1.33
 G1 X0.07 Y0.00
-G1 X3.31 Y0.00
\ No newline at end of file
+G1 X3.31 Y0.00
+; variant
+G0 X3.31 Y0.00
+G1 X0.07 Y0.00
+G1 X0.77 Y1.33
+G1 X1.30 Y2.06
+G1 X2.68 Y3.18
+G1 X3.19 Y3.81
+G1 X3.36 Y4.50
+G1 X3.23 Y5.17
+G1 X2.90 Y5.69
+G1 X2.37 Y6.03
+G1 X1.71 Y6.14
+G1 X1.21 Y6.08
+G1 X0.75 Y5.91
+G1 X0.33 Y5.63
+G1 X0.00 Y5.25
\ No newline at end of file
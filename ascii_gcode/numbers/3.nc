@@ -1,4 +1,30 @@
 (3)
+G0 X0.00 Y1.41
+G1 X0.18 Y0.78
+G1 X0.56 Y0.30
+G1 X1.13 Y0.00
+G1 X1.85 Y-0.11
+G1 X2.60 Y0.02
+G1 X3.20 Y0.39
+G1 X3.60 Y0.97
+G1 X3.74 Y1.72
+G1 X3.55 Y2.23
+G1 X3.03 Y2.73
+G1 X2.40 Y3.02
+G1 X1.62 Y3.22
+G1 X2.40 Y3.50
+G1 X3.05 Y3.90
+G1 X3.30 Y4.21
+G1 X3.43 Y4.58
+G1 X3.31 Y5.20
+G1 X2.99 Y5.69
+G1 X2.47 Y6.02
+G1 X1.78 Y6.14
+G1 X1.17 Y6.05
+G1 X0.66 Y5.77
+G1 X0.29 Y5.31
+G1 X0.08 Y4.71
+; variant
 G0 X0.08 Y4.71
 G1 X0.29 Y5.31
 G1 X0.66 Y5.77
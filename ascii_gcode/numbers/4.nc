@@ -2,4 +2,9 @@
 G0 X3.04 Y0.00
 G1 X3.04 Y6.03
 G1 X0.00 Y2.07
-G1 X4.11 Y2.07
\ No newline at end of file
+G1 X4.11 Y2.07
+; variant
+G0 X4.11 Y2.07
+G1 X0.00 Y2.07
+G1 X3.04 Y6.03
+G1 X3.04 Y0.00
\ No newline at end of file
@@ -1,4 +1,25 @@
 (5)
+G0 X0.00 Y1.40
+G1 X0.21 Y0.75
+G1 X0.60 Y0.28
+G1 X1.15 Y-0.01
+G1 X1.82 Y-0.11
+G1 X2.70 Y0.05
+G1 X3.32 Y0.50
+G1 X3.70 Y1.17
+G1 X3.82 Y2.00
+G1 X3.68 Y2.74
+G1 X3.30 Y3.35
+G1 X2.73 Y3.75
+G1 X2.01 Y3.90
+G1 X1.66 Y3.88
+G1 X1.31 Y3.83
+G1 X0.97 Y3.70
+G1 X0.68 Y3.50
+G1 X0.17 Y2.95
+G1 X0.42 Y6.03
+G1 X3.53 Y6.03
+; variant
 G0 X3.53 Y6.03
 G1 X0.42 Y6.03
 G1 X0.17 Y2.95
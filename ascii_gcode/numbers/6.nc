@@ -1,4 +1,27 @@
 (6)
+G0 X0.00 Y2.79
+G1 X0.48 Y3.19
+G1 X1.23 Y3.64
+G1 X2.05 Y3.80
+G1 X2.76 Y3.65
+G1 X3.30 Y3.24
+G1 X3.64 Y2.63
+G1 X3.76 Y1.91
+G1 X3.65 Y1.14
+G1 X3.32 Y0.49
+G1 X2.75 Y0.05
+G1 X1.96 Y-0.11
+G1 X1.12 Y0.08
+G1 X0.51 Y0.64
+G1 X0.13 Y1.55
+G1 X0.00 Y2.79
+G1 X0.13 Y4.24
+G1 X0.49 Y5.30
+G1 X1.12 Y5.93
+G1 X2.03 Y6.14
+G1 X3.07 Y5.79
+G1 X3.63 Y4.78
+; variant
 G0 X3.63 Y4.78
 G1 X3.07 Y5.79
 G1 X2.03 Y6.14
@@ -1,4 +1,8 @@
 (7)
 G0 X0.00 Y6.03
 G1 X3.81 Y6.03
-G1 X1.08 Y0.00
\ No newline at end of file
+G1 X1.08 Y0.00
+; variant
+G0 X1.08 Y0.00
+G1 X3.81 Y6.03
+G1 X0.00 Y6.03
\ No newline at end of file
@@ -21,4 +21,28 @@ G1 X1.73 Y2.20
 G1 X2.23 Y2.25
 G1 X2.65 Y2.37
 G1 X3.00 Y2.55
-G1 X3.74 Y3.19
\ No newline at end of file
+G1 X3.74 Y3.19
+; variant
+G0 X3.74 Y3.19
+G1 X3.00 Y2.55
+G1 X2.65 Y2.37
+G1 X2.23 Y2.25
+G1 X1.73 Y2.20
+G1 X1.02 Y2.35
+G1 X0.48 Y2.76
+G1 X0.13 Y3.35
+G1 X0.00 Y4.08
+G1 X0.12 Y4.86
+G1 X0.46 Y5.52
+G1 X1.02 Y5.98
+G1 X1.78 Y6.14
+G1 X2.62 Y5.95
+G1 X3.23 Y5.38
+G1 X3.61 Y4.45
+G1 X3.74 Y3.19
+G1 X3.61 Y1.75
+G1 X3.24 Y0.71
+G1 X2.61 Y0.09
+G1 X1.70 Y-0.11
+G1 X0.65 Y0.23
+G1 X0.12 Y1.21
\ No newline at end of file
@@ -27,4 +27,34 @@ G1 X0.79 Y5.77
 G1 X0.51 Y5.38
 G1 X0.41 Y4.84
 G1 X0.62 Y4.24
-G1 X4.97 Y0.39
\ No newline at end of file
+G1 X4.97 Y0.39
+; variant
+G0 X4.97 Y0.39
+G1 X0.62 Y4.24
+G1 X0.41 Y4.84
+G1 X0.51 Y5.38
+G1 X0.79 Y5.77
+G1 X1.21 Y6.01
+G1 X1.73 Y6.09
+G1 X2.27 Y6.00
+G1 X2.70 Y5.73
+G1 X2.99 Y5.33
+G1 X3.10 Y4.84
+G1 X3.01 Y4.45
+G1 X2.76 Y4.07
+G1 X2.38 Y3.72
+G1 X1.88 Y3.55
+G1 X1.24 Y3.37
+G1 X0.78 Y3.04
+G1 X0.31 Y2.62
+G1 X0.00 Y1.63
+G1 X0.14 Y0.94
+G1 X0.53 Y0.39
+G1 X1.12 Y0.02
+G1 X1.84 Y-0.11
+G1 X2.36 Y-0.06
+G1 X2.87 Y0.11
+G1 X3.34 Y0.43
+G1 X3.79 Y0.94
+G1 X4.00 Y1.36
+G1 X4.45 Y3.21
\ No newline at end of file
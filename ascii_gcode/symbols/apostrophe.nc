@@ -1,3 +1,6 @@
 (')
 G0 X0.00 Y6.03
-G1 X0.00 Y4.35
\ No newline at end of file
+G1 X0.00 Y4.35
+; variant
+G0 X0.00 Y4.35
+G1 X0.00 Y6.03
\ No newline at end of file
@@ -1,4 +1,22 @@
 (*)
+G0 X0.00 Y2.85
+G1 X4.17 Y2.85
+G0 X3.58 Y1.34
+G1 X0.59 Y4.36
+G0 X2.09 Y4.97
+G1 X2.09 Y0.76
+G0 X0.59 Y1.34
+G1 X3.58 Y4.36
+; variant
+G0 X4.17 Y2.85
+G1 X0.00 Y2.85
+G0 X0.59 Y4.36
+G1 X3.58 Y1.34
+G0 X2.09 Y0.76
+G1 X2.09 Y4.97
+G0 X3.58 Y4.36
+G1 X0.59 Y1.34
+; variant
 G0 X0.59 Y4.36
 G1 X3.58 Y1.34
 G0 X2.09 Y0.76
@@ -6,4 +24,13 @@ G1 X2.09 Y4.97
 G0 X3.58 Y4.36
 G1 X0.59 Y1.34
 G0 X0.00 Y2.85
+G1 X4.17 Y2.85
+; variant
+G0 X0.59 Y1.34
+G1 X3.58 Y4.36
+G0 X2.09 Y4.97
+G1 X2.09 Y0.76
+G0 X3.58 Y1.34
+G1 X0.59 Y4.36
+G0 X0.00 Y2.85
 G1 X4.17 Y2.85
\ No newline at end of file
@@ -1,4 +1,42 @@
 (@)
+G0 X4.25 Y4.42
+G1 X4.26 Y1.19
+G1 X4.44 Y0.80
+G1 X4.68 Y0.54
+G1 X4.97 Y0.40
+G1 X5.28 Y0.35
+G1 X5.79 Y0.54
+G1 X6.18 Y1.05
+G1 X6.44 Y1.79
+G1 X6.53 Y2.70
+G1 X6.31 Y4.13
+G1 X5.67 Y5.24
+G1 X4.67 Y5.95
+G1 X3.34 Y6.20
+G1 X2.03 Y5.93
+G1 X0.97 Y5.17
+G1 X0.26 Y4.03
+G1 X0.00 Y2.63
+G1 X0.24 Y1.20
+G1 X0.93 Y0.06
+G1 X1.98 Y-0.68
+G1 X3.32 Y-0.95
+G1 X4.01 Y-0.92
+G1 X4.65 Y-0.82
+G0 X4.26 Y1.30
+G1 X3.65 Y0.83
+G1 X2.97 Y0.72
+G1 X2.39 Y0.85
+G1 X1.95 Y1.22
+G1 X1.67 Y1.80
+G1 X1.57 Y2.56
+G1 X1.70 Y3.29
+G1 X2.05 Y3.86
+G1 X2.56 Y4.23
+G1 X3.21 Y4.36
+G1 X3.68 Y4.27
+G1 X4.25 Y3.88
+; variant
 G0 X4.65 Y-0.82
 G1 X4.01 Y-0.92
 G1 X3.32 Y-0.95
@@ -35,4 +73,80 @@ G1 X1.95 Y1.22
 G1 X2.39 Y0.85
 G1 X2.97 Y0.72
 G1 X3.65 Y0.83
-G1 X4.26 Y1.30
\ No newline at end of file
+G1 X4.26 Y1.30
+; variant
+G0 X4.26 Y1.30
+G1 X3.65 Y0.83
+G1 X2.97 Y0.72
+G1 X2.39 Y0.85
+G1 X1.95 Y1.22
+G1 X1.67 Y1.80
+G1 X1.57 Y2.56
+G1 X1.70 Y3.29
+G1 X2.05 Y3.86
+G1 X2.56 Y4.23
+G1 X3.21 Y4.36
+G1 X3.68 Y4.27
+G1 X4.25 Y3.88
+G0 X4.25 Y4.42
+G1 X4.26 Y1.19
+G1 X4.44 Y0.80
+G1 X4.68 Y0.54
+G1 X4.97 Y0.40
+G1 X5.28 Y0.35
+G1 X5.79 Y0.54
+G1 X6.18 Y1.05
+G1 X6.44 Y1.79
+G1 X6.53 Y2.70
+G1 X6.31 Y4.13
+G1 X5.67 Y5.24
+G1 X4.67 Y5.95
+G1 X3.34 Y6.20
+G1 X2.03 Y5.93
+G1 X0.97 Y5.17
+G1 X0.26 Y4.03
+G1 X0.00 Y2.63
+G1 X0.24 Y1.20
+G1 X0.93 Y0.06
+G1 X1.98 Y-0.68
+G1 X3.32 Y-0.95
+G1 X4.01 Y-0.92
+G1 X4.65 Y-0.82
+; variant
+G0 X4.25 Y3.88
+G1 X3.68 Y4.27
+G1 X3.21 Y4.36
+G1 X2.56 Y4.23
+G1 X2.05 Y3.86
+G1 X1.70 Y3.29
+G1 X1.57 Y2.56
+G1 X1.67 Y1.80
+G1 X1.95 Y1.22
+G1 X2.39 Y0.85
+G1 X2.97 Y0.72
+G1 X3.65 Y0.83
+G1 X4.26 Y1.30
+G0 X4.65 Y-0.82
+G1 X4.01 Y-0.92
+G1 X3.32 Y-0.95
+G1 X1.98 Y-0.68
+G1 X0.93 Y0.06
+G1 X0.24 Y1.20
+G1 X0.00 Y2.63
+G1 X0.26 Y4.03
+G1 X0.97 Y5.17
+G1 X2.03 Y5.93
+G1 X3.34 Y6.20
+G1 X4.67 Y5.95
+G1 X5.67 Y5.24
+G1 X6.31 Y4.13
+G1 X6.53 Y2.70
+G1 X6.44 Y1.79
+G1 X6.18 Y1.05
+G1 X5.79 Y0.54
+G1 X5.28 Y0.35
+G1 X4.97 Y0.40
+G1 X4.68 Y0.54
+G1 X4.44 Y0.80
+G1 X4.26 Y1.19
+G1 X4.25 Y4.42
\ No newline at end of file
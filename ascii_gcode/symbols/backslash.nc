@@ -1,3 +1,6 @@
 (\)
 G0 X0.00 Y5.94
-G1 X3.58 Y-0.14
\ No newline at end of file
+G1 X3.58 Y-0.14
+; variant
+G0 X3.58 Y-0.14
+G1 X0.00 Y5.94
\ No newline at end of file
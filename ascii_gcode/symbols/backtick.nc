@@ -1,3 +1,6 @@
 (`)
 G0 X0.00 Y5.71
-G1 X0.64 Y4.68
\ No newline at end of file
+G1 X0.64 Y4.68
+; variant
+G0 X0.64 Y4.68
+G1 X0.00 Y5.71
\ No newline at end of file
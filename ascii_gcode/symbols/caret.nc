@@ -1,4 +1,8 @@
 (^)
 G0 X0.00 Y4.41
 G1 X1.06 Y5.81
-G1 X2.11 Y4.41
\ No newline at end of file
+G1 X2.11 Y4.41
+; variant
+G0 X2.11 Y4.41
+G1 X1.06 Y5.81
+G1 X0.00 Y4.41
\ No newline at end of file
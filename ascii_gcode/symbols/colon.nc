@@ -2,4 +2,9 @@
 G0 X0.00 Y2.87
 G1 X0.00 Y2.87
 G0 X0.00 Y0.40
-G1 X0.00 Y0.40
\ No newline at end of file
+G1 X0.00 Y0.40
+; variant
+G0 X0.00 Y0.40
+G1 X0.00 Y0.40
+G0 X0.00 Y2.87
+G1 X0.00 Y2.87
\ No newline at end of file
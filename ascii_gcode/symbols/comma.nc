@@ -1,4 +1,9 @@
 (,)
+G0 X0.00 Y-1.14
+G1 X0.60 Y-0.83
+G1 X0.80 Y0.00
+G1 X0.80 Y0.80
+; variant
 G0 X0.80 Y0.80
 G1 X0.80 Y0.00
 G1 X0.60 Y-0.83
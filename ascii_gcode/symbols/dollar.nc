@@ -1,4 +1,58 @@
 ($)
+G0 X0.00 Y1.46
+G1 X0.16 Y0.90
+G1 X0.51 Y0.42
+G1 X1.02 Y0.07
+G1 X1.65 Y-0.11
+G1 X1.95 Y-0.11
+G1 X2.68 Y0.03
+G1 X3.26 Y0.37
+G1 X3.65 Y0.88
+G1 X3.79 Y1.52
+G1 X3.65 Y2.15
+G1 X3.25 Y2.70
+G1 X2.67 Y3.00
+G1 X1.08 Y3.39
+G1 X0.62 Y3.63
+G1 X0.31 Y4.07
+G1 X0.19 Y4.55
+G1 X0.30 Y5.13
+G1 X0.57 Y5.65
+G1 X1.03 Y6.00
+G1 X1.65 Y6.14
+G1 X1.95 Y6.15
+G1 X2.60 Y6.04
+G1 X3.26 Y5.71
+G0 X1.80 Y6.87
+G1 X1.80 Y-0.89
+; variant
+G0 X1.80 Y-0.89
+G1 X1.80 Y6.87
+G0 X3.26 Y5.71
+G1 X2.60 Y6.04
+G1 X1.95 Y6.15
+G1 X1.65 Y6.14
+G1 X1.03 Y6.00
+G1 X0.57 Y5.65
+G1 X0.30 Y5.13
+G1 X0.19 Y4.55
+G1 X0.31 Y4.07
+G1 X0.62 Y3.63
+G1 X1.08 Y3.39
+G1 X2.67 Y3.00
+G1 X3.25 Y2.70
+G1 X3.65 Y2.15
+G1 X3.79 Y1.52
+G1 X3.65 Y0.88
+G1 X3.26 Y0.37
+G1 X2.68 Y0.03
+G1 X1.95 Y-0.11
+G1 X1.65 Y-0.11
+G1 X1.02 Y0.07
+G1 X0.51 Y0.42
+G1 X0.16 Y0.90
+G1 X0.00 Y1.46
+; variant
 G0 X3.26 Y5.71
 G1 X2.60 Y6.04
 G1 X1.95 Y6.15
@@ -24,4 +78,31 @@ G1 X0.51 Y0.42
 G1 X0.16 Y0.90
 G1 X0.00 Y1.46
 G0 X1.80 Y-0.89
-G1 X1.80 Y6.87
\ No newline at end of file
+G1 X1.80 Y6.87
+; variant
+G0 X1.80 Y6.87
+G1 X1.80 Y-0.89
+G0 X0.00 Y1.46
+G1 X0.16 Y0.90
+G1 X0.51 Y0.42
+G1 X1.02 Y0.07
+G1 X1.65 Y-0.11
+G1 X1.95 Y-0.11
+G1 X2.68 Y0.03
+G1 X3.26 Y0.37
+G1 X3.65 Y0.88
+G1 X3.79 Y1.52
+G1 X3.65 Y2.15
+G1 X3.25 Y2.70
+G1 X2.67 Y3.00
+G1 X1.08 Y3.39
+G1 X0.62 Y3.63
+G1 X0.31 Y4.07
+G1 X0.19 Y4.55
+G1 X0.30 Y5.13
+G1 X0.57 Y5.65
+G1 X1.03 Y6.00
+G1 X1.65 Y6.14
+G1 X1.95 Y6.15
+G1 X2.60 Y6.04
+G1 X3.26 Y5.71
\ No newline at end of file
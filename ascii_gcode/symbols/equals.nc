@@ -2,4 +2,19 @@
 G0 X0.00 Y3.15
 G1 X3.00 Y3.15
 G0 X3.00 Y1.89
-G1 X0.00 Y1.89
\ No newline at end of file
+G1 X0.00 Y1.89
+; variant
+G0 X3.00 Y3.15
+G1 X0.00 Y3.15
+G0 X0.00 Y1.89
+G1 X3.00 Y1.89
+; variant
+G0 X3.00 Y1.89
+G1 X0.00 Y1.89
+G0 X0.00 Y3.15
+G1 X3.00 Y3.15
+; variant
+G0 X0.00 Y1.89
+G1 X3.00 Y1.89
+G0 X3.00 Y3.15
+G1 X0.00 Y3.15
\ No newline at end of file
@@ -2,4 +2,14 @@
 G0 X0.00 Y6.03
 G1 X0.00 Y1.76
 G0 X0.00 Y0.00
+G1 X0.00 Y0.00
+; variant
+G0 X0.00 Y0.00
+G1 X0.00 Y0.00
+G0 X0.00 Y1.76
+G1 X0.00 Y6.03
+; variant
+G0 X0.00 Y1.76
+G1 X0.00 Y6.03
+G0 X0.00 Y0.00
 G1 X0.00 Y0.00
\ No newline at end of file
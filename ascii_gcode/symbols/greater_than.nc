@@ -1,4 +1,8 @@
 (>)
 G0 X0.00 Y5.25
 G1 X4.52 Y2.87
-G1 X0.00 Y0.49
\ No newline at end of file
+G1 X0.00 Y0.49
+; variant
+G0 X0.00 Y0.49
+G1 X4.52 Y2.87
+G1 X0.00 Y5.25
\ No newline at end of file
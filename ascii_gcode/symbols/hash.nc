@@ -1,9 +1,36 @@
 (#)
+G0 X0.00 Y1.94
+G1 X4.52 Y1.94
+G0 X5.03 Y4.09
+G1 X0.51 Y4.09
+G0 X2.36 Y5.98
+G1 X0.88 Y0.00
+G0 X2.67 Y0.00
+G1 X4.15 Y5.98
+; variant
+G0 X4.52 Y1.94
+G1 X0.00 Y1.94
 G0 X0.51 Y4.09
 G1 X5.03 Y4.09
 G0 X4.15 Y5.98
 G1 X2.67 Y0.00
+G0 X0.88 Y0.00
+G1 X2.36 Y5.98
+; variant
+G0 X2.36 Y5.98
+G1 X0.88 Y0.00
+G0 X2.67 Y0.00
+G1 X4.15 Y5.98
+G0 X5.03 Y4.09
+G1 X0.51 Y4.09
+G0 X0.00 Y1.94
+G1 X4.52 Y1.94
+; variant
+G0 X0.51 Y4.09
+G1 X5.03 Y4.09
 G0 X4.52 Y1.94
 G1 X0.00 Y1.94
 G0 X0.88 Y0.00
-G1 X2.36 Y5.98
\ No newline at end of file
+G1 X2.36 Y5.98
+G0 X4.15 Y5.98
+G1 X2.67 Y0.00
\ No newline at end of file
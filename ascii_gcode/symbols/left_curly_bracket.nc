@@ -17,4 +17,24 @@ G1 X1.03 Y-0.46
 G1 X1.12 Y-0.74
 G1 X1.29 Y-0.90
 G1 X1.59 Y-0.95
-G1 X2.25 Y-0.95
\ No newline at end of file
+G1 X2.25 Y-0.95
+; variant
+G0 X2.25 Y-0.95
+G1 X1.59 Y-0.95
+G1 X1.29 Y-0.90
+G1 X1.12 Y-0.74
+G1 X1.03 Y-0.46
+G1 X1.00 Y-0.05
+G1 X0.99 Y1.00
+G1 X0.87 Y1.51
+G1 X0.50 Y2.20
+G1 X0.00 Y2.54
+G1 X0.50 Y2.88
+G1 X0.87 Y3.57
+G1 X0.99 Y4.08
+G1 X1.00 Y5.13
+G1 X1.03 Y5.54
+G1 X1.12 Y5.82
+G1 X1.29 Y5.98
+G1 X1.59 Y6.03
+G1 X2.25 Y6.03
\ No newline at end of file
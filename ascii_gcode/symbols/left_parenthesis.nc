@@ -7,4 +7,14 @@ G1 X0.00 Y2.68
 G1 X0.11 Y1.72
 G1 X0.45 Y0.79
 G1 X0.96 Y-0.06
-G1 X1.63 Y-0.81
\ No newline at end of file
+G1 X1.63 Y-0.81
+; variant
+G0 X1.63 Y-0.81
+G1 X0.96 Y-0.06
+G1 X0.45 Y0.79
+G1 X0.11 Y1.72
+G1 X0.00 Y2.68
+G1 X0.11 Y3.63
+G1 X0.45 Y4.56
+G1 X0.96 Y5.41
+G1 X1.63 Y6.16
\ No newline at end of file
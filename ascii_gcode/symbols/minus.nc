@@ -1,3 +1,6 @@
 (-)
 G0 X0.00 Y2.51
-G1 X3.32 Y2.51
\ No newline at end of file
+G1 X3.32 Y2.51
+; variant
+G0 X3.32 Y2.51
+G1 X0.00 Y2.51
\ No newline at end of file
@@ -1,4 +1,6 @@
 (%)
+G0 X1.10 Y0.00
+G1 X4.79 Y6.03
 G0 X1.27 Y6.14
 G1 X1.79 Y6.03
 G1 X2.19 Y5.72
@@ -10,6 +12,62 @@ G1 X0.34 Y3.35
 G1 X0.00 Y4.53
 G1 X0.34 Y5.72
 G1 X1.27 Y6.14
+G0 X3.37 Y1.50
+G1 X3.70 Y2.67
+G1 X4.63 Y3.09
+G1 X5.56 Y2.67
+G1 X5.90 Y1.50
+G1 X5.56 Y0.31
+G1 X4.63 Y-0.11
+G1 X3.70 Y0.31
+G1 X3.37 Y1.50
+; variant
+G0 X1.27 Y6.14
+G1 X1.79 Y6.03
+G1 X2.19 Y5.72
+G1 X2.44 Y5.21
+G1 X2.53 Y4.53
+G1 X2.19 Y3.35
+G1 X1.27 Y2.94
+G1 X0.34 Y3.35
+G1 X0.00 Y4.53
+G1 X0.34 Y5.72
+G1 X1.27 Y6.14
+G0 X4.79 Y6.03
+G1 X1.10 Y0.00
+G0 X3.37 Y1.50
+G1 X3.70 Y2.67
+G1 X4.63 Y3.09
+G1 X5.56 Y2.67
+G1 X5.90 Y1.50
+G1 X5.56 Y0.31
+G1 X4.63 Y-0.11
+G1 X3.70 Y0.31
+G1 X3.37 Y1.50
+; variant
+G0 X3.37 Y1.50
+G1 X3.70 Y2.67
+G1 X4.63 Y3.09
+G1 X5.56 Y2.67
+G1 X5.90 Y1.50
+G1 X5.56 Y0.31
+G1 X4.63 Y-0.11
+G1 X3.70 Y0.31
+G1 X3.37 Y1.50
+G0 X1.10 Y0.00
+G1 X4.79 Y6.03
+G0 X1.27 Y6.14
+G1 X1.79 Y6.03
+G1 X2.19 Y5.72
+G1 X2.44 Y5.21
+G1 X2.53 Y4.53
+G1 X2.19 Y3.35
+G1 X1.27 Y2.94
+G1 X0.34 Y3.35
+G1 X0.00 Y4.53
+G1 X0.34 Y5.72
+G1 X1.27 Y6.14
+; variant
 G0 X4.79 Y6.03
 G1 X1.10 Y0.00
 G0 X3.37 Y1.50
@@ -20,4 +78,15 @@ G1 X5.90 Y1.50
 G1 X5.56 Y0.31
 G1 X4.63 Y-0.11
 G1 X3.70 Y0.31
-G1 X3.37 Y1.50
\ No newline at end of file
+G1 X3.37 Y1.50
+G0 X1.27 Y6.14
+G1 X1.79 Y6.03
+G1 X2.19 Y5.72
+G1 X2.44 Y5.21
+G1 X2.53 Y4.53
+G1 X2.19 Y3.35
+G1 X1.27 Y2.94
+G1 X0.34 Y3.35
+G1 X0.00 Y4.53
+G1 X0.34 Y5.72
+G1 X1.27 Y6.14
\ No newline at end of file
@@ -1,5 +1,20 @@
 (+)
+G0 X0.00 Y2.51
+G1 X3.31 Y2.51
+G0 X1.67 Y0.85
+G1 X1.67 Y4.17
+; variant
 G0 X1.67 Y4.17
 G1 X1.67 Y0.85
-G0 X0.00 Y2.51
-G1 X3.31 Y2.51
\ No newline at end of file
+G0 X3.31 Y2.51
+G1 X0.00 Y2.51
+; variant
+G0 X1.67 Y0.85
+G1 X1.67 Y4.17
+G0 X3.31 Y2.51
+G1 X0.00 Y2.51
+; variant
+G0 X3.31 Y2.51
+G1 X0.00 Y2.51
+G0 X1.67 Y0.85
+G1 X1.67 Y4.17
\ No newline at end of file
@@ -18,4 +18,46 @@ G1 X1.60 Y2.32
 G1 X1.46 Y1.94
 G1 X1.41 Y1.42
 G0 X1.41 Y0.00
+G1 X1.41 Y0.00
+; variant
+G0 X1.41 Y0.00
+G1 X1.41 Y0.00
+G0 X1.41 Y1.42
+G1 X1.46 Y1.94
+G1 X1.60 Y2.32
+G1 X1.85 Y2.63
+G1 X2.09 Y2.90
+G1 X2.38 Y3.16
+G1 X2.73 Y3.45
+G1 X3.01 Y3.78
+G1 X3.19 Y4.17
+G1 X3.26 Y4.66
+G1 X3.14 Y5.25
+G1 X2.81 Y5.72
+G1 X2.33 Y6.03
+G1 X1.73 Y6.14
+G1 X1.05 Y6.01
+G1 X0.51 Y5.65
+G1 X0.15 Y5.10
+G1 X0.00 Y4.41
+; variant
+G0 X1.41 Y1.42
+G1 X1.46 Y1.94
+G1 X1.60 Y2.32
+G1 X1.85 Y2.63
+G1 X2.09 Y2.90
+G1 X2.38 Y3.16
+G1 X2.73 Y3.45
+G1 X3.01 Y3.78
+G1 X3.19 Y4.17
+G1 X3.26 Y4.66
+G1 X3.14 Y5.25
+G1 X2.81 Y5.72
+G1 X2.33 Y6.03
+G1 X1.73 Y6.14
+G1 X1.05 Y6.01
+G1 X0.51 Y5.65
+G1 X0.15 Y5.10
+G1 X0.00 Y4.41
+G0 X1.41 Y0.00
 G1 X1.41 Y0.00
\ No newline at end of file
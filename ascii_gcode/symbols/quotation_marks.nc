@@ -2,4 +2,19 @@
 G0 X0.00 Y6.03
 G1 X0.00 Y4.35
 G0 X1.47 Y4.35
-G1 X1.47 Y6.03
\ No newline at end of file
+G1 X1.47 Y6.03
+; variant
+G0 X0.00 Y4.35
+G1 X0.00 Y6.03
+G0 X1.47 Y6.03
+G1 X1.47 Y4.35
+; variant
+G0 X1.47 Y4.35
+G1 X1.47 Y6.03
+G0 X0.00 Y6.03
+G1 X0.00 Y4.35
+; variant
+G0 X1.47 Y6.03
+G1 X1.47 Y4.35
+G0 X0.00 Y4.35
+G1 X0.00 Y6.03
\ No newline at end of file
@@ -17,4 +17,24 @@ G1 X1.22 Y-0.46
 G1 X1.13 Y-0.74
 G1 X0.96 Y-0.90
 G1 X0.66 Y-0.95
-G1 X0.00 Y-0.95
\ No newline at end of file
+G1 X0.00 Y-0.95
+; variant
+G0 X0.00 Y-0.95
+G1 X0.66 Y-0.95
+G1 X0.96 Y-0.90
+G1 X1.13 Y-0.74
+G1 X1.22 Y-0.46
+G1 X1.25 Y-0.05
+G1 X1.26 Y1.00
+G1 X1.38 Y1.51
+G1 X1.75 Y2.20
+G1 X2.25 Y2.54
+G1 X1.75 Y2.88
+G1 X1.38 Y3.57
+G1 X1.26 Y4.08
+G1 X1.25 Y5.13
+G1 X1.22 Y5.54
+G1 X1.13 Y5.82
+G1 X0.96 Y5.98
+G1 X0.66 Y6.03
+G1 X0.00 Y6.03
\ No newline at end of file
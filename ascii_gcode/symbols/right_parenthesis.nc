@@ -7,4 +7,14 @@ G1 X1.63 Y2.68
 G1 X1.52 Y1.72
 G1 X1.18 Y0.79
 G1 X0.67 Y-0.06
-G1 X0.00 Y-0.81
\ No newline at end of file
+G1 X0.00 Y-0.81
+; variant
+G0 X0.00 Y-0.81
+G1 X0.67 Y-0.06
+G1 X1.18 Y0.79
+G1 X1.52 Y1.72
+G1 X1.63 Y2.68
+G1 X1.52 Y3.63
+G1 X1.18 Y4.56
+G1 X0.67 Y5.41
+G1 X0.00 Y6.16
\ No newline at end of file
@@ -2,4 +2,9 @@
 G0 X0.00 Y6.03
 G1 X1.68 Y6.03
 G1 X1.68 Y-0.96
-G1 X0.00 Y-0.96
\ No newline at end of file
+G1 X0.00 Y-0.96
+; variant
+G0 X0.00 Y-0.96
+G1 X1.68 Y-0.96
+G1 X1.68 Y6.03
+G1 X0.00 Y6.03
\ No newline at end of file
@@ -1,7 +1,21 @@
 (;)
+G0 X0.00 Y-1.14
+G1 X0.60 Y-0.83
+G1 X0.80 Y0.00
+G1 X0.80 Y0.80
+G0 X0.80 Y2.87
+G1 X0.80 Y2.87
+; variant
 G0 X0.80 Y2.87
 G1 X0.80 Y2.87
 G0 X0.80 Y0.80
 G1 X0.80 Y0.00
 G1 X0.60 Y-0.83
-G1 X0.00 Y-1.14
\ No newline at end of file
+G1 X0.00 Y-1.14
+; variant
+G0 X0.80 Y0.80
+G1 X0.80 Y0.00
+G1 X0.60 Y-0.83
+G1 X0.00 Y-1.14
+G0 X0.80 Y2.87
+G1 X0.80 Y2.87
\ No newline at end of file
@@ -16,4 +16,23 @@ G1 X4.24 Y1.79
 G1 X4.64 Y2.15
 G1 X4.87 Y2.73
 G1 X4.95 Y3.51
-G1 X4.95 Y3.79
\ No newline at end of file
+G1 X4.95 Y3.79
+; variant
+G0 X4.95 Y3.79
+G1 X4.95 Y3.51
+G1 X4.87 Y2.73
+G1 X4.64 Y2.15
+G1 X4.24 Y1.79
+G1 X3.64 Y1.67
+G1 X3.20 Y1.73
+G1 X2.88 Y1.89
+G1 X2.70 Y2.16
+G1 X2.25 Y3.31
+G1 X2.07 Y3.58
+G1 X1.75 Y3.74
+G1 X1.31 Y3.80
+G1 X0.71 Y3.68
+G1 X0.31 Y3.32
+G1 X0.08 Y2.74
+G1 X0.00 Y1.96
+G1 X0.00 Y1.68
\ No newline at end of file
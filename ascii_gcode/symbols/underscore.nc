@@ -1,3 +1,6 @@
 (_)
 G0 X0.00 Y-1.09
-G1 X4.40 Y-1.09
\ No newline at end of file
+G1 X4.40 Y-1.09
+; variant
+G0 X4.40 Y-1.09
+G1 X0.00 Y-1.09
\ No newline at end of file
@@ -1,3 +1,6 @@
 (|)
 G0 X0.00 Y6.03
-G1 X0.00 Y-0.30
\ No newline at end of file
+G1 X0.00 Y-0.30
+; variant
+G0 X0.00 Y-0.30
+G1 X0.00 Y6.03
\ No newline at end of file
@@ -3,4 +3,22 @@ G0 X0.00 Y0.00
 G1 X2.71 Y6.04
 G1 X5.42 Y0.00
 G0 X4.47 Y2.12
-G1 X0.95 Y2.12
\ No newline at end of file
+G1 X0.95 Y2.12
+; variant
+G0 X5.42 Y0.00
+G1 X2.71 Y6.04
+G1 X0.00 Y0.00
+G0 X0.95 Y2.12
+G1 X4.47 Y2.12
+; variant
+G0 X4.47 Y2.12
+G1 X0.95 Y2.12
+G0 X0.00 Y0.00
+G1 X2.71 Y6.04
+G1 X5.42 Y0.00
+; variant
+G0 X0.95 Y2.12
+G1 X4.47 Y2.12
+G0 X5.42 Y0.00
+G1 X2.71 Y6.04
+G1 X0.00 Y0.00
\ No newline at end of file
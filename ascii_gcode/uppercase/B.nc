@@ -1,15 +1,26 @@
 (B)
-G0 X0.00 Y6.04
-G1 X1.73 Y6.04
-G1 X2.42 Y5.86
-G1 X2.97 Y5.51
-G1 X3.15 Y5.28
-G1 X3.38 Y4.55
-G1 X3.29 Y4.12
-G1 X3.16 Y3.69
+G0 X0.00 Y3.02
+G1 X1.80 Y3.02
 G1 X2.70 Y3.33
+G1 X3.16 Y3.69
+G1 X3.29 Y4.12
+G1 X3.38 Y4.55
+G1 X3.15 Y5.28
+G1 X2.97 Y5.51
+G1 X2.42 Y5.86
+G1 X1.73 Y6.04
+G1 X0.00 Y6.04
+G1 X0.00 Y0.00
+G1 X2.19 Y0.00
+G1 X2.88 Y0.18
+G1 X3.43 Y0.53
+G1 X3.61 Y0.76
+G1 X3.84 Y1.49
+G1 X3.75 Y1.92
+G1 X3.56 Y2.35
+G1 X3.16 Y2.71
 G1 X1.80 Y3.02
-G1 X0.00 Y3.02
+; variant
 G0 X1.80 Y3.02
 G1 X3.16 Y2.71
 G1 X3.56 Y2.35
@@ -20,4 +31,14 @@ G1 X3.43 Y0.53
 G1 X2.88 Y0.18
 G1 X2.19 Y0.00
 G1 X0.00 Y0.00
-G1 X0.00 Y6.04
\ No newline at end of file
+G1 X0.00 Y6.04
+G1 X1.73 Y6.04
+G1 X2.42 Y5.86
+G1 X2.97 Y5.51
+G1 X3.15 Y5.28
+G1 X3.38 Y4.55
+G1 X3.29 Y4.12
+G1 X3.16 Y3.69
+G1 X2.70 Y3.33
+G1 X1.80 Y3.02
+G1 X0.00 Y3.02
\ No newline at end of file
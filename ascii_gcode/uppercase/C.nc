@@ -15,4 +15,22 @@ G1 X2.76 Y-0.11
 G1 X3.59 Y0.02
 G1 X4.29 Y0.38
 G1 X4.82 Y0.92
-G1 X5.12 Y1.62
\ No newline at end of file
+G1 X5.12 Y1.62
+; variant
+G0 X5.12 Y1.62
+G1 X4.82 Y0.92
+G1 X4.29 Y0.38
+G1 X3.59 Y0.02
+G1 X2.76 Y-0.11
+G1 X1.61 Y0.11
+G1 X0.74 Y0.73
+G1 X0.19 Y1.71
+G1 X0.00 Y3.02
+G1 X0.19 Y4.33
+G1 X0.74 Y5.31
+G1 X1.61 Y5.93
+G1 X2.76 Y6.15
+G1 X3.59 Y6.02
+G1 X4.29 Y5.66
+G1 X4.82 Y5.12
+G1 X5.12 Y4.42
\ No newline at end of file
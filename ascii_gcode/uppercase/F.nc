@@ -1,6 +1,24 @@
 (F)
+G0 X0.00 Y0.00
+G1 X0.00 Y6.04
+G1 X4.21 Y6.04
+G0 X3.75 Y3.02
+G1 X0.00 Y3.02
+; variant
 G0 X4.21 Y6.04
 G1 X0.00 Y6.04
 G1 X0.00 Y0.00
 G0 X0.00 Y3.02
-G1 X3.75 Y3.02
\ No newline at end of file
+G1 X3.75 Y3.02
+; variant
+G0 X3.75 Y3.02
+G1 X0.00 Y3.02
+G0 X0.00 Y0.00
+G1 X0.00 Y6.04
+G1 X4.21 Y6.04
+; variant
+G0 X0.00 Y3.02
+G1 X3.75 Y3.02
+G0 X4.21 Y6.04
+G1 X0.00 Y6.04
+G1 X0.00 Y0.00
\ No newline at end of file
@@ -1,4 +1,25 @@
 (G)
+G0 X3.20 Y2.72
+G1 X5.55 Y2.72
+G1 X5.55 Y1.50
+G1 X5.10 Y0.80
+G1 X4.64 Y0.38
+G1 X4.10 Y0.10
+G1 X3.78 Y0.02
+G1 X2.86 Y-0.11
+G1 X1.70 Y0.11
+G1 X0.80 Y0.73
+G1 X0.21 Y1.71
+G1 X0.00 Y3.02
+G1 X0.21 Y4.33
+G1 X0.80 Y5.31
+G1 X1.70 Y5.93
+G1 X2.86 Y6.15
+G1 X3.78 Y6.02
+G1 X4.55 Y5.67
+G1 X5.10 Y5.12
+G1 X5.41 Y4.41
+; variant
 G0 X5.41 Y4.41
 G1 X5.10 Y5.12
 G1 X4.55 Y5.67
@@ -1,7 +1,28 @@
 (H)
+G0 X0.00 Y0.00
+G1 X0.00 Y6.04
+G0 X0.00 Y3.22
+G1 X4.61 Y3.22
+G0 X4.61 Y6.04
+G1 X4.61 Y0.00
+; variant
+G0 X4.61 Y0.00
+G1 X4.61 Y6.04
+G0 X4.61 Y3.22
+G1 X0.00 Y3.22
+G0 X0.00 Y6.04
+G1 X0.00 Y0.00
+; variant
 G0 X0.00 Y6.04
 G1 X0.00 Y0.00
 G0 X0.00 Y3.22
 G1 X4.61 Y3.22
-G0 X4.61 Y0.00
-G1 X4.61 Y6.04
\ No newline at end of file
+G0 X4.61 Y6.04
+G1 X4.61 Y0.00
+; variant
+G0 X4.61 Y6.04
+G1 X4.61 Y0.00
+G0 X4.61 Y3.22
+G1 X0.00 Y3.22
+G0 X0.00 Y6.04
+G1 X0.00 Y0.00
\ No newline at end of file
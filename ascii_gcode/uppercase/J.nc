@@ -9,3 +9,14 @@ G1 X2.70 Y0.34
 G1 X3.00 Y0.96
 G1 X3.10 Y1.89
 G1 X3.10 Y6.04
+; variant
+G0 X3.10 Y6.04
+G1 X3.10 Y1.89
+G1 X3.00 Y0.96
+G1 X2.70 Y0.34
+G1 X2.21 Y0.00
+G1 X1.51 Y-0.11
+G1 X0.89 Y0.00
+G1 X0.41 Y0.33
+G1 X0.10 Y0.83
+G1 X0.00 Y1.49
\ No newline at end of file
@@ -1,7 +1,28 @@
 (K)
 G0 X0.00 Y6.04
 G1 X0.00 Y0.00
+G0 X0.00 Y2.10
+G1 X4.48 Y6.04
+G0 X1.72 Y3.61
+G1 X4.38 Y0.00
+; variant
+G0 X4.48 Y6.04
+G1 X0.00 Y2.10
+G0 X0.00 Y0.00
+G1 X0.00 Y6.04
+G0 X1.72 Y3.61
+G1 X4.38 Y0.00
+; variant
 G0 X4.38 Y0.00
 G1 X1.72 Y3.61
+G0 X0.00 Y6.04
+G1 X0.00 Y0.00
 G0 X0.00 Y2.10
-G1 X4.48 Y6.04
\ No newline at end of file
+G1 X4.48 Y6.04
+; variant
+G0 X0.00 Y0.00
+G1 X0.00 Y6.04
+G0 X4.48 Y6.04
+G1 X0.00 Y2.10
+G0 X1.72 Y3.61
+G1 X4.38 Y0.00
\ No newline at end of file
@@ -1,4 +1,8 @@
 (L)
 G0 X0.00 Y6.04
 G1 X0.00 Y0.00
-G1 X3.56 Y0.00
\ No newline at end of file
+G1 X3.56 Y0.00
+; variant
+G0 X3.56 Y0.00
+G1 X0.00 Y0.00
+G1 X0.00 Y6.04
\ No newline at end of file
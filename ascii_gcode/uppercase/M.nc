@@ -3,4 +3,10 @@ G0 X0.00 Y0.00
 G1 X0.00 Y6.04
 G1 X2.85 Y0.00
 G1 X5.69 Y6.04
-G1 X5.69 Y0.00
\ No newline at end of file
+G1 X5.69 Y0.00
+; variant
+G0 X5.69 Y0.00
+G1 X5.69 Y6.04
+G1 X2.85 Y0.00
+G1 X0.00 Y6.04
+G1 X0.00 Y0.00
\ No newline at end of file
@@ -2,4 +2,9 @@
 G0 X0.00 Y0.00
 G1 X0.00 Y6.04
 G1 X4.70 Y0.00
-G1 X4.70 Y6.04
\ No newline at end of file
+G1 X4.70 Y6.04
+; variant
+G0 X4.70 Y6.04
+G1 X4.70 Y0.00
+G1 X0.00 Y6.04
+G1 X0.00 Y0.00
\ No newline at end of file
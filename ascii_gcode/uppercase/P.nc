@@ -1,6 +1,4 @@
 (P)
-G0 X0.00 Y6.04
-G1 X0.00 Y0.00
 G0 X0.00 Y3.02
 G1 X1.80 Y3.02
 G1 X3.16 Y3.33
@@ -11,4 +9,18 @@ G1 X3.61 Y5.28
 G1 X3.43 Y5.51
 G1 X2.88 Y5.86
 G1 X2.19 Y6.04
-G1 X0.00 Y6.04
\ No newline at end of file
+G1 X0.00 Y6.04
+G1 X0.00 Y0.00
+; variant
+G0 X0.00 Y0.00
+G1 X0.00 Y6.04
+G1 X2.19 Y6.04
+G1 X2.88 Y5.86
+G1 X3.43 Y5.51
+G1 X3.61 Y5.28
+G1 X3.84 Y4.55
+G1 X3.75 Y4.12
+G1 X3.56 Y3.69
+G1 X3.16 Y3.33
+G1 X1.80 Y3.02
+G1 X0.00 Y3.02
\ No newline at end of file
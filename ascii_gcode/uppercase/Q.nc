@@ -17,4 +17,44 @@ G1 X0.00 Y3.02
 G1 X0.21 Y4.32
 G1 X0.81 Y5.30
 G0 X3.56 Y1.35
-G1 X5.62 Y-0.26
\ No newline at end of file
+G1 X5.62 Y-0.26
+; variant
+G0 X5.62 Y-0.26
+G1 X3.56 Y1.35
+G0 X0.81 Y5.30
+G1 X1.71 Y5.93
+G1 X2.85 Y6.15
+G1 X3.99 Y5.93
+G1 X4.89 Y5.30
+G1 X5.49 Y4.32
+G1 X5.70 Y3.02
+G1 X5.49 Y1.72
+G1 X4.89 Y0.74
+G1 X3.99 Y0.11
+G1 X2.85 Y-0.11
+G1 X1.71 Y0.11
+G1 X0.81 Y0.74
+G1 X0.21 Y1.72
+G1 X0.00 Y3.02
+G1 X0.21 Y4.32
+G1 X0.81 Y5.30
+; variant
+G0 X3.56 Y1.35
+G1 X5.62 Y-0.26
+G0 X0.81 Y5.30
+G1 X1.71 Y5.93
+G1 X2.85 Y6.15
+G1 X3.99 Y5.93
+G1 X4.89 Y5.30
+G1 X5.49 Y4.32
+G1 X5.70 Y3.02
+G1 X5.49 Y1.72
+G1 X4.89 Y0.74
+G1 X3.99 Y0.11
+G1 X2.85 Y-0.11
+G1 X1.71 Y0.11
+G1 X0.81 Y0.74
+G1 X0.21 Y1.72
+G1 X0.00 Y3.02
+G1 X0.21 Y4.32
+G1 X0.81 Y5.30
\ No newline at end of file
@@ -20,4 +20,27 @@ G1 X2.28 Y6.15
 G1 X3.13 Y6.04
 G1 X3.81 Y5.73
 G1 X4.28 Y5.23
-G1 X4.50 Y4.57
\ No newline at end of file
+G1 X4.50 Y4.57
+; variant
+G0 X4.50 Y4.57
+G1 X4.28 Y5.23
+G1 X3.81 Y5.73
+G1 X3.13 Y6.04
+G1 X2.28 Y6.15
+G1 X1.44 Y6.03
+G1 X0.78 Y5.71
+G1 X0.36 Y5.20
+G1 X0.21 Y4.56
+G1 X0.40 Y3.99
+G1 X1.00 Y3.45
+G1 X3.95 Y2.75
+G1 X4.49 Y2.23
+G1 X4.68 Y1.65
+G1 X4.52 Y0.94
+G1 X4.07 Y0.38
+G1 X3.38 Y0.02
+G1 X2.51 Y-0.11
+G1 X1.44 Y0.02
+G1 X0.67 Y0.39
+G1 X0.19 Y0.97
+G1 X0.00 Y1.73
\ No newline at end of file
@@ -13,4 +13,20 @@ G1 X4.27 Y0.76
 G1 X4.49 Y1.31
 G1 X4.59 Y1.92
 G1 X4.61 Y2.53
-G1 X4.61 Y6.04
\ No newline at end of file
+G1 X4.61 Y6.04
+; variant
+G0 X4.61 Y6.04
+G1 X4.61 Y2.53
+G1 X4.59 Y1.92
+G1 X4.49 Y1.31
+G1 X4.27 Y0.76
+G1 X3.87 Y0.31
+G1 X3.23 Y0.00
+G1 X2.30 Y-0.11
+G1 X1.38 Y0.00
+G1 X0.74 Y0.31
+G1 X0.34 Y0.76
+G1 X0.12 Y1.31
+G1 X0.02 Y1.92
+G1 X0.00 Y2.53
+G1 X0.00 Y6.04
\ No newline at end of file
@@ -1,4 +1,8 @@
 (V)
 G0 X0.00 Y6.04
 G1 X2.64 Y0.00
-G1 X5.29 Y6.04
\ No newline at end of file
+G1 X5.29 Y6.04
+; variant
+G0 X5.29 Y6.04
+G1 X2.64 Y0.00
+G1 X0.00 Y6.04
\ No newline at end of file
@@ -3,4 +3,10 @@ G0 X0.00 Y6.04
 G1 X1.89 Y0.00
 G1 X3.85 Y6.04
 G1 X5.82 Y0.00
-G1 X7.71 Y6.04
\ No newline at end of file
+G1 X7.71 Y6.04
+; variant
+G0 X7.71 Y6.04
+G1 X5.82 Y0.00
+G1 X3.85 Y6.04
+G1 X1.89 Y0.00
+G1 X0.00 Y6.04
\ No newline at end of file
@@ -2,4 +2,19 @@
 G0 X0.00 Y6.04
 G1 X4.94 Y0.00
 G0 X0.00 Y0.00
-G1 X4.94 Y6.04
\ No newline at end of file
+G1 X4.94 Y6.04
+; variant
+G0 X4.94 Y0.00
+G1 X0.00 Y6.04
+G0 X4.94 Y6.04
+G1 X0.00 Y0.00
+; variant
+G0 X0.00 Y0.00
+G1 X4.94 Y6.04
+G0 X0.00 Y6.04
+G1 X4.94 Y0.00
+; variant
+G0 X4.94 Y6.04
+G1 X0.00 Y0.00
+G0 X4.94 Y0.00
+G1 X0.00 Y6.04
\ No newline at end of file
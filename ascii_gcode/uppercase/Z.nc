@@ -2,4 +2,9 @@
 G0 X0.35 Y6.04
 G1 X4.52 Y6.04
 G1 X0.00 Y0.00
-G1 X4.64 Y0.00
\ No newline at end of file
+G1 X4.64 Y0.00
+; variant
+G0 X4.64 Y0.00
+G1 X0.00 Y0.00
+G1 X4.52 Y6.04
+G1 X0.35 Y6.04
\ No newline at end of file
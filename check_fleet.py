@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+"""Prints a batch of jobs on simulated plotters and checks that every one completes.
+
+Several SimulatedPlotter devices on pseudo terminals are driven by one
+DeviceManager with checksummed lines, while the simulators reject a share of
+the lines on purpose. Every job must end up done and the manager's lock must
+be free whenever on_update is called. Only runs where os.openpty exists.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+
+from plotter_fleet import DONE, DeviceManager
+from plotter_sim import SimulatedPlotter
+from text_to_gcode import FontRegistry, textToGcode
+
+SAMPLE_TEXTS = (
+    "The quick brown fox jumps over the lazy dog",
+    "Pack my box with five dozen liquor jugs",
+    "How vexingly quick daft zebras jump",
+    "Sphinx of black quartz, judge my vow",
+    "Hello plotter",
+)
+
+
+def write_jobs(directory, count):
+    """Generate count G-code files from the sample texts, returning their paths"""
+    letters = FontRegistry()
+    letters.register(os.path.join(os.path.dirname(os.path.abspath(__file__)), "ascii_gcode"))
+    paths = []
+    for number in range(count):
+        text = SAMPLE_TEXTS[number % len(SAMPLE_TEXTS)]
+        path = os.path.join(directory, f"job{number + 1}.nc")
+        with open(path, "w") as f:
+            f.write(textToGcode(letters, text, 140, 8.0, 1.5, 210, 297, 0.5))
+        paths.append(path)
+    return paths
+
+
+def main():
+    argParser = argparse.ArgumentParser(description="Checks the device manager against simulated plotters")
+    argParser.add_argument("--devices", type=int, default=3,
+                           help="Number of simulated plotters (default: 3)")
+    argParser.add_argument("--jobs", type=int, default=5,
+                           help="Number of jobs to print (default: 5)")
+    argParser.add_argument("--error-rate", type=float, default=0.05,
+                           help="Share of lines the plotters reject as corrupted (default: 0.05)")
+    argParser.add_argument("--timeout", type=float, default=120,
+                           help="Seconds to wait for the jobs (default: 120)")
+    args = argParser.parse_args()
+
+    plotters = [SimulatedPlotter(error_rate=args.error_rate) for _ in range(args.devices)]
+    locked_updates = []
+    manager = None
+
+    def on_update():
+        # Another thread must be able to take the manager's lock while on_update runs
+        probe = threading.Thread(target=lambda: locked_updates.append(
+            not manager.condition.acquire(timeout=1) or manager.condition.release()))
+        probe.start()
+        probe.join()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        manager = DeviceManager(on_update)
+        try:
+            for number, plotter in enumerate(plotters, 1):
+                manager.add_device(f"plotter{number}", plotter.port, checksums=True, boot_timeout=0)
+            jobs = [manager.submit(path) for path in write_jobs(directory, args.jobs)]
+            if not manager.wait(args.timeout):
+                print(f"Jobs did not finish within {args.timeout:.0f}s")
+                failed = True
+        finally:
+            manager.close()
+            for plotter in plotters:
+                plotter.close()
+
+        for job in jobs:
+            print(f"{job.name}: {job.state} on {job.device}" + (f" ({job.error})" if job.error else ""))
+            failed = failed or job.state != DONE
+    resends = sum(status["resends"] for status in manager.status())
+    print(f"{len(jobs)} jobs on {len(plotters)} plotters, {resends} resends")
+    if any(locked_updates):
+        print("on_update was called with the manager's lock held")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
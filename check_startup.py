@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+"""Guards the cold start of main.py using `python -X importtime`.
+
+Importing main.py must stay within STARTUP_BUDGET_MS and must not pull in any
+of the heavy dependencies, which are loaded on first use instead.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+STARTUP_BUDGET_MS = 150
+HEAVY_MODULES = ("google.generativeai", "matplotlib", "serial", "PIL")
+
+
+def measure_import(module="main"):
+    """Return ({module: cumulative_us}, total_us) for a cold import of module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    cumulative = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        # import time: <self us> | <cumulative us> | <indented module name>
+        _, cumulative_us, name = line.split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+        if not name.startswith("  "):
+            total_us += int(cumulative_us)
+    return cumulative, total_us
+
+
+def main():
+    argParser = argparse.ArgumentParser(
+        description="Checks the import time of main.py against the startup budget")
+    argParser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS,
+                           help=f"Maximum cold import time (default: {STARTUP_BUDGET_MS}ms)")
+    args = argParser.parse_args()
+
+    cumulative, total_us = measure_import()
+    heavy = sorted(name for name in cumulative
+                   if any(name == m or name.startswith(m + ".") for m in HEAVY_MODULES))
+    total_ms = total_us / 1000
+
+    print(f"Cold import of main.py: {total_ms:.1f}ms (budget {args.budget_ms:.0f}ms)")
+    failed = False
+    if heavy:
+        print("Heavy modules imported at startup: " + ", ".join(heavy))
+        failed = True
+    if total_ms > args.budget_ms:
+        print("Startup budget exceeded")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/python3
+"""Headless preview of G-code files as PNG (drawn with PIL) or SVG, without Tk or Matplotlib."""
+
+import argparse
+import math
+import os
+
+PEN_COLOR = "#1f3fbf"
+PAPER_COLOR = "#F2F0EF"
+
+# PNG previews are palette images: a quarter of the RGB size, and much faster to encode
+BACKGROUND, PAPER, PEN, OUTLINE = range(4)
+PALETTE = [255, 255, 255, 0xF2, 0xF0, 0xEF, 0x1f, 0x3f, 0xbf, 0, 0, 0]
+
+
+def interpolate_arc(x0, y0, x1, y1, i, j, clockwise, max_step=math.radians(10), max_length=0.5):
+    """Approximate a G2/G3 arc from (x0, y0) to (x1, y1) by points along it."""
+    cx, cy = x0 + i, y0 + j
+    radius = math.hypot(i, j)
+    start = math.atan2(y0 - cy, x0 - cx)
+    sweep = math.atan2(y1 - cy, x1 - cx) - start
+    if clockwise and sweep >= 0:
+        sweep -= 2 * math.pi
+    elif not clockwise and sweep <= 0:
+        sweep += 2 * math.pi
+
+    steps = max(1, int(abs(sweep) / max_step), int(radius * abs(sweep) / max_length))
+    xs = [cx + radius * math.cos(start + sweep * k / steps) for k in range(1, steps)]
+    ys = [cy + radius * math.sin(start + sweep * k / steps) for k in range(1, steps)]
+    return xs + [x1], ys + [y1]
+
+
+def parse_gcode_paths(lines, pen_up_moves=False):
+    """Return the pen-down strokes of G-code lines as lists of (x, y) points.
+
+    The pen is down while Z is at or below 0. G90/G91 and G2/G3 arcs are
+    followed; every other command is ignored. With pen_up_moves, travel is
+    kept too, giving one path of every point visited after each G28.
+    """
+    paths = []
+    current = None
+    x = y = 0.0
+    z = None
+    relative = False
+
+    for line in lines:
+        words = line.split(';', 1)[0].split()
+        if not words:
+            continue
+        code = words[0]
+        if code == "G90":
+            relative = False
+            continue
+        if code == "G91":
+            relative = True
+            continue
+        if code == "G28":
+            x = y = 0.0
+            z = None
+            current = None
+            continue
+        if code not in ("G0", "G1", "G2", "G3"):
+            continue
+
+        values = {}
+        for word in words[1:]:
+            if word[0] in "XYZIJ":
+                values[word[0]] = float(word[1:])
+
+        if "Z" in values:
+            z = z + values["Z"] if relative and z is not None else values["Z"]
+        pen_down = z is not None and z <= 0
+        drawing = pen_down or pen_up_moves
+        if not drawing:
+            current = None
+
+        if "X" in values or "Y" in values:
+            new_x = values.get("X", 0.0 if relative else x)
+            new_y = values.get("Y", 0.0 if relative else y)
+            if relative:
+                new_x, new_y = x + new_x, y + new_y
+
+            if drawing:
+                if current is None:
+                    # After G28 the path starts at the first move, as the home position is not drawn
+                    current = [] if pen_up_moves else [(x, y)]
+                    paths.append(current)
+                if code in ("G2", "G3"):
+                    arc_x, arc_y = interpolate_arc(x, y, new_x, new_y, values.get("I", 0.0),
+                                                   values.get("J", 0.0), code == "G2")
+                    current.extend(zip(arc_x, arc_y))
+                else:
+                    current.append((new_x, new_y))
+            x, y = new_x, new_y
+        elif pen_down and current is None:
+            # Pen lowered without moving: start a stroke here, so dots are drawn too
+            current = [(x, y)]
+            paths.append(current)
+
+    return paths
+
+
+def read_gcode_paths(gcode_path):
+    with open(gcode_path, 'r') as f:
+        return parse_gcode_paths(f)
+
+
+def page_bounds(paths, paper_width=None, paper_height=None, margin=5.0):
+    """(xmin, ymin, xmax, ymax) covering the paper and every stroke, plus a margin"""
+    xs = [px for path in paths for px, _ in path]
+    ys = [py for path in paths for _, py in path]
+    if paper_width is not None:
+        xs += [0.0, paper_width]
+    if paper_height is not None:
+        ys += [0.0, paper_height]
+    if not xs or not ys:
+        return 0.0, 0.0, 1.0, 1.0
+    return min(xs) - margin, min(ys) - margin, max(xs) + margin, max(ys) + margin
+
+
+def render_png(paths, output, paper_width=None, paper_height=None, scale=4.0, line_width=1):
+    """Rasterize strokes to an image at scale pixels per mm"""
+    from PIL import Image, ImageDraw
+
+    xmin, ymin, xmax, ymax = page_bounds(paths, paper_width, paper_height)
+    width = max(1, int(math.ceil((xmax - xmin) * scale)))
+    height = max(1, int(math.ceil((ymax - ymin) * scale)))
+    image = Image.new("P", (width, height), BACKGROUND)
+    image.putpalette(PALETTE)
+    draw = ImageDraw.Draw(image)
+
+    def pixel(px, py):
+        return (px - xmin) * scale, (ymax - py) * scale
+
+    if paper_width is not None and paper_height is not None:
+        draw.rectangle([pixel(0, paper_height), pixel(paper_width, 0)],
+                       fill=PAPER, outline=OUTLINE)
+
+    for path in paths:
+        points = [pixel(px, py) for px, py in path]
+        if len(set(points)) > 1:
+            draw.line(points, fill=PEN, width=line_width)
+        else:
+            cx, cy = points[0]
+            radius = max(line_width, 1)
+            draw.ellipse([cx - radius, cy - radius, cx + radius, cy + radius], fill=PEN)
+
+    if not output.lower().endswith((".png", ".gif", ".bmp")):
+        image = image.convert("RGB")
+    image.save(output)
+
+
+def render_svg(paths, output, paper_width=None, paper_height=None, line_width=0.3):
+    """Write strokes as a single SVG path, in mm"""
+    xmin, ymin, xmax, ymax = page_bounds(paths, paper_width, paper_height)
+    parts = []
+    for path in paths:
+        points = [f"{px - xmin:.2f} {ymax - py:.2f}" for px, py in path]
+        parts.append("M" + points[0] + ("L" + " ".join(points[1:]) if len(points) > 1 else "h0"))
+
+    width, height = xmax - xmin, ymax - ymin
+    with open(output, 'w') as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.2f}mm" height="{height:.2f}mm" '
+                f'viewBox="0 0 {width:.2f} {height:.2f}">\n')
+        if paper_width is not None and paper_height is not None:
+            f.write(f'<rect x="{-xmin:.2f}" y="{ymax - paper_height:.2f}" width="{paper_width:.2f}" '
+                    f'height="{paper_height:.2f}" fill="{PAPER_COLOR}" stroke="black" stroke-width="0.3"/>\n')
+        f.write(f'<path fill="none" stroke="{PEN_COLOR}" stroke-width="{line_width}" '
+                f'stroke-linecap="round" stroke-linejoin="round" d="{"".join(parts)}"/>\n')
+        f.write('</svg>\n')
+
+
+def render_preview(paths, output, paper_width=None, paper_height=None, scale=4.0):
+    """Render to SVG if output ends with .svg, otherwise to an image format PIL knows"""
+    if output.lower().endswith(".svg"):
+        render_svg(paths, output, paper_width, paper_height)
+    else:
+        render_png(paths, output, paper_width, paper_height, scale)
+
+
+def render_file(gcode_path, output, paper_width=None, paper_height=None, scale=4.0):
+    render_preview(read_gcode_paths(gcode_path), output, paper_width, paper_height, scale)
+    return output
+
+
+def main():
+    argParser = argparse.ArgumentParser(description="Renders previews of G-code files without a display")
+    argParser.add_argument("files", nargs="+", metavar="FILE",
+                           help="G-code files to preview")
+    argParser.add_argument("-o", "--output-dir", type=str, default=".", metavar="DIR",
+                           help="Directory to write the previews to (default: current directory)")
+    argParser.add_argument("-f", "--format", choices=["png", "svg"], default="png",
+                           help="Preview format (default: png)")
+    argParser.add_argument("-s", "--scale", type=float, default=4.0,
+                           help="Pixels per mm of PNG previews (default: 4)")
+    argParser.add_argument("--paper-width", type=float, default=None,
+                           help="Width of the paper to draw in the preview")
+    argParser.add_argument("--paper-height", type=float, default=None,
+                           help="Height of the paper to draw in the preview")
+    argParser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                           help="Number of files rendered in parallel (default: number of CPUs)")
+    args = argParser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    outputs = [os.path.join(args.output_dir, os.path.splitext(os.path.basename(path))[0] + "." + args.format)
+               for path in args.files]
+    tasks = [(path, output, args.paper_width, args.paper_height, args.scale)
+             for path, output in zip(args.files, outputs)]
+
+    if args.jobs == 1 or len(tasks) == 1:
+        for task in tasks:
+            print(render_file(*task))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            for output in executor.map(render_file, *zip(*tasks)):
+                print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,511 @@
+#!/usr/bin/python3
+"""Serial sending, indexed access to G-code files and checkpoints for resuming interrupted prints."""
+
+from array import array
+from collections import OrderedDict
+import json
+import mmap
+import os
+import re
+import threading
+import time
+
+# Save a checkpoint after this many acknowledged lines
+CHECKPOINT_INTERVAL = 25
+
+DEFAULT_TRAVEL_SPEED = 8000
+DEFAULT_Z_SPEED = 2000
+DEFAULT_LOWER_SPEED = 500
+
+
+def send_line(ser, command, timeout=30, echo=False):
+    """Write one command to an open serial port and wait for its "ok".
+
+    Blank lines and comments are skipped. Returns False on timeout; serial
+    errors are left to the caller.
+    """
+    command = command.strip()
+    if not command or command.startswith(';'):
+        return True
+
+    ser.write(f"{command}\n".encode())
+
+    response = ""
+    start_time = time.time()
+
+    while "ok" not in response.lower():
+        if ser.in_waiting:
+            new_data = ser.read(ser.in_waiting).decode(
+                'utf-8', errors='ignore')
+            response += new_data
+            if echo:
+                print(f"Received: {new_data}")
+
+        if time.time() - start_time > timeout:
+            if echo:
+                print(
+                    f"Timeout while waiting for 'ok' after command: {command}")
+            return False
+
+        time.sleep(0.01)
+
+    return True
+
+
+def wait_for_start(ser, timeout=3, echo=False):
+    """Wait for the "start" line Marlin prints when the board has booted.
+
+    Most Arduino based boards reset when the port is opened and drop what is
+    sent before they are up. Returns False if no banner came within timeout,
+    e.g. because the board does not reset on open.
+    """
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        line = ser.readline().decode('utf-8', errors='ignore').strip()
+        if line and echo:
+            print(f"Received: {line}")
+        if line.lower().startswith("start"):
+            return True
+    return False
+
+
+def checksum(data):
+    """Marlin line checksum: the XOR of all bytes before the '*'"""
+    result = 0
+    for byte in data.encode():
+        result ^= byte
+    return result
+
+
+class LineProtocol:
+    """Marlin-style framed sending: N<line> <command>*<checksum>, one line in flight.
+
+    The printer rejects lines with a bad checksum or an unexpected line number
+    and asks for them again with "Resend: <line>"; those lines are resent from
+    a ring buffer of the last history_size lines. "busy" replies extend the
+    wait for a line's "ok", but to no more than max_busy seconds in all.
+    reset() numbers lines from
+    the start again with M110; it is done before the first command and again
+    after a failed one, whose line number the printer may or may not have
+    taken.
+    """
+
+    def __init__(self, ser, timeout=30, history_size=128, max_resends=10, echo=False, max_busy=120):
+        self.ser = ser
+        self.timeout = timeout
+        self.max_busy = max_busy
+        self.history_size = history_size
+        self.max_resends = max_resends
+        self.echo = echo
+        self.line_number = 0
+        self.history = OrderedDict()
+        self.resends = 0
+        self.synced = False
+
+    def frame(self, n, command):
+        body = f"N{n} {command}"
+        return f"{body}*{checksum(body)}"
+
+    def _write(self, n):
+        self.ser.write(f"{self.history[n]}\n".encode())
+
+    def _readline(self):
+        line = self.ser.readline().decode('utf-8', errors='ignore').strip()
+        if line and self.echo:
+            print(f"Received: {line}")
+        return line
+
+    def reset(self, attempts=3, timeout=5):
+        """Make the printer expect line numbers from 1 again, trying M110 up to attempts times"""
+        self.history.clear()
+        self.history[0] = self.frame(0, "M110 N0")
+        self.line_number = 0
+        for _ in range(attempts):
+            if self._transmit(0, timeout):
+                self.synced = True
+                return True
+        self.synced = False
+        return False
+
+    def send(self, command):
+        """Send one command and wait until it is acknowledged, resending it as requested.
+
+        Returns False on timeout or when the printer keeps rejecting lines.
+        """
+        command = command.split(';', 1)[0].strip()
+        if not command:
+            return True
+        if not self.synced and not self.reset():
+            return False
+
+        self.line_number += 1
+        self.history[self.line_number] = self.frame(self.line_number, command)
+        while len(self.history) > self.history_size:
+            self.history.popitem(last=False)
+        if not self._transmit(self.line_number):
+            # Renumber before the next command, so the printer cannot ask for this line again
+            self.synced = False
+            return False
+        return True
+
+    def _transmit(self, n, timeout=None):
+        timeout = timeout or self.timeout
+        pending = n
+        resend_from = None
+        resends = 0
+        self._write(pending)
+        deadline = time.time() + timeout
+        busy_limit = time.time() + self.max_busy
+
+        while True:
+            # Checked on every pass, as temperature reports and echo lines can keep coming
+            if time.time() > deadline:
+                if self.echo:
+                    print(f"Timeout while waiting for 'ok' after line {pending}")
+                return False
+            line = self._readline()
+            if not line:
+                continue
+
+            lowered = line.lower()
+            if lowered.startswith(("resend:", "rs")):
+                digits = ''.join(c for c in lowered.split(':', 1)[-1] if c.isdigit())
+                if digits:
+                    # While resetting, the printer asks for the line after its old number; only M110 fits
+                    resend_from = 0 if n == 0 else int(digits)
+            elif lowered.startswith("ok"):
+                if resend_from is not None:
+                    if resend_from not in self.history or resends >= self.max_resends:
+                        return False
+                    pending, resend_from = resend_from, None
+                    resends += 1
+                    self.resends += 1
+                elif pending >= n:
+                    return True
+                else:
+                    pending += 1
+                self._write(pending)
+                deadline = time.time() + timeout
+                busy_limit = time.time() + self.max_busy
+            elif "busy" in lowered:
+                # The printer is alive but still working on the previous command
+                deadline = max(deadline, min(time.time() + timeout, busy_limit))
+
+
+class CommandQueue:
+    """Sends manual commands from a background thread, one line and one "ok" at a time.
+
+    send(line) is called for every line and returns whether the line was
+    acknowledged. A jog is sent as G91, the move and G90; jogs still waiting
+    in the queue are merged with further jogs of the same axis, and each jog
+    is held back jog_delay seconds after its last click so that a burst of
+    clicks becomes one longer move. lock, if given, is held while the lines
+    of one command are sent, so other senders cannot interleave with a jog.
+    When a line fails, the rest of the queue is dropped and on_error, if set,
+    is called from the worker thread.
+    """
+
+    def __init__(self, send, jog_delay=0.15, on_error=None, lock=None):
+        self.send = send
+        self.jog_delay = jog_delay
+        self.on_error = on_error
+        self.lock = lock or threading.Lock()
+        self.condition = threading.Condition()
+        self.pending = []
+        self.busy = False
+        self.lines_acknowledged = 0
+        self.jogs_merged = 0
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def submit(self, command):
+        """Queue a command; several lines are sent and acknowledged one by one"""
+        with self.condition:
+            for line in command.splitlines():
+                line = line.split(';', 1)[0].strip()
+                if line:
+                    self.pending.append({"command": line, "axis": None, "ready_at": 0.0})
+            self.condition.notify_all()
+
+    def jog(self, axis, distance):
+        """Queue a relative move of one axis, merged into the previous jog if it is still queued"""
+        with self.condition:
+            last = self.pending[-1] if self.pending else None
+            if last is not None and last["axis"] == axis:
+                last["distance"] += distance
+                self.jogs_merged += 1
+            else:
+                last = {"command": None, "axis": axis, "distance": distance}
+                self.pending.append(last)
+            last["ready_at"] = time.time() + self.jog_delay
+            self.condition.notify_all()
+
+    def clear(self):
+        """Drop every command not sent yet; the one being sent is finished"""
+        with self.condition:
+            self.pending.clear()
+            self.condition.notify_all()
+
+    def wait(self, timeout=None):
+        """Wait until every queued command was sent; returns False on timeout"""
+        deadline = None if timeout is None else time.time() + timeout
+        with self.condition:
+            while self.pending or self.busy:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+        return True
+
+    def _next(self):
+        # Must be called with the condition held
+        while True:
+            if not self.pending:
+                self.condition.wait()
+                continue
+            delay = self.pending[0]["ready_at"] - time.time()
+            if delay <= 0:
+                self.busy = True
+                return self.pending.pop(0)
+            self.condition.wait(delay)
+
+    def _run(self):
+        while True:
+            with self.condition:
+                entry = self._next()
+
+            if entry["axis"] is None:
+                lines = [entry["command"]]
+            elif round(entry["distance"], 3) == 0:
+                # Clicks in opposite directions cancelled out
+                lines = []
+            else:
+                lines = ["G91", f"G0 {entry['axis']}{round(entry['distance'], 3)}", "G90"]
+
+            try:
+                with self.lock:
+                    self._send_lines(lines)
+            except Exception as e:
+                self.clear()
+                if self.on_error:
+                    self.on_error(e)
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+    def _send_lines(self, lines):
+        for line in lines:
+            error = None
+            try:
+                acknowledged = self.send(line)
+            except Exception as e:
+                acknowledged, error = False, e
+            if not acknowledged:
+                if lines[0] == "G91":
+                    # The printer may have run G91 even if it was not acknowledged;
+                    # do not leave it in relative mode
+                    try:
+                        self.send("G90")
+                    except Exception:
+                        pass
+                raise error or IOError(f"Timeout while waiting for 'ok' after command: {line}")
+            self.lines_acknowledged += 1
+
+
+class GcodeIndex:
+    """Memory mapped G-code file with the byte offset of every command line.
+
+    Blank lines and comment lines are not indexed, so index n is the n-th
+    command that is actually sent to the printer.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offsets = array('Q')
+        self._file = open(path, 'rb')
+        self._map = None
+        if os.fstat(self._file.fileno()).st_size == 0:
+            return
+
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        offset = 0
+        for line in iter(self._map.readline, b""):
+            command = line.strip()
+            if command and not command.startswith(b';'):
+                self.offsets.append(offset)
+            offset += len(line)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, n):
+        start = self.offsets[n]
+        end = self._map.find(b'\n', start)
+        if end == -1:
+            end = len(self._map)
+        return self._map[start:end].decode('utf-8', errors='ignore').strip()
+
+    def lines(self, start=0):
+        """Yield (n, command) for every command from line start on"""
+        for n in range(start, len(self)):
+            yield n, self[n]
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MachineState:
+    """Position, pen height and speeds of the plotter, tracked from sent commands"""
+
+    WORD_RE = re.compile(r'([GXYZF])(-?[\d.]+)')
+
+    def __init__(self, x=0.0, y=0.0, z=None, lift_z=None, travel_speed=None,
+                 z_speed=None, absolute=True):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.lift_z = lift_z
+        self.travel_speed = travel_speed
+        self.z_speed = z_speed
+        self.absolute = absolute
+
+    @property
+    def pen_down(self):
+        return self.z is not None and self.z <= 0
+
+    def update(self, command):
+        words = self.WORD_RE.findall(command.split(';', 1)[0].upper())
+        if not words:
+            return
+        codes = {letter: float(value) for letter, value in words}
+        g = codes.get('G')
+
+        if g == 28:
+            # Homed: the pen height is unknown until the next Z move
+            self.x, self.y, self.z = 0.0, 0.0, None
+            return
+        if g == 90:
+            self.absolute = True
+            return
+        if g == 91:
+            self.absolute = False
+            return
+
+        for axis in ('X', 'Y', 'Z'):
+            if axis in codes:
+                current = getattr(self, axis.lower()) or 0.0
+                value = codes[axis] if self.absolute else current + codes[axis]
+                setattr(self, axis.lower(), value)
+
+        if 'Z' in codes and self.z > 0:
+            self.lift_z = self.z
+            if 'F' in codes:
+                self.z_speed = codes['F']
+        elif g == 0 and 'F' in codes and ('X' in codes or 'Y' in codes):
+            self.travel_speed = codes['F']
+
+    def resume_commands(self):
+        """Commands that bring a freshly homed plotter back to this state: lift, travel, lower.
+
+        The positioning mode is restored last, so a print interrupted inside a
+        block of relative moves continues correctly.
+        """
+        lift_z = self.lift_z if self.lift_z is not None else 2.0
+        z_speed = self.z_speed or DEFAULT_Z_SPEED
+        travel_speed = self.travel_speed or DEFAULT_TRAVEL_SPEED
+        commands = [
+            "G90",
+            f"G0 Z{lift_z} F{z_speed} ; Lift pen",
+            f"G0 X{self.x:.2f} Y{self.y:.2f} F{travel_speed} ; Return to checkpoint",
+        ]
+        if self.pen_down:
+            commands.append(f"G1 Z{self.z} F{DEFAULT_LOWER_SPEED} ; Lower pen")
+        if not self.absolute:
+            commands.append("G91")
+        return commands
+
+    def to_dict(self):
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+def checkpoint_path(gcode_path, name=None):
+    if name:
+        return f"{gcode_path}.{name}.checkpoint"
+    return gcode_path + ".checkpoint"
+
+
+class Checkpoint:
+    """The number of acknowledged lines of a print and the machine state after them.
+
+    Checkpoints are stored next to the G-code file and are only valid for the
+    exact file they were taken from; regenerating the file invalidates them.
+    Prints of the same file on several machines each need their own name.
+    """
+
+    def __init__(self, gcode_path, line=0, state=None, name=None):
+        self.gcode_path = gcode_path
+        self.name = name
+        self.line = line
+        self.state = state or MachineState()
+        self.saved_line = None
+
+    def _file_signature(self):
+        stat = os.stat(self.gcode_path)
+        return [stat.st_size, stat.st_mtime]
+
+    def acknowledge(self, n, command):
+        """Record that line n was acknowledged, saving every CHECKPOINT_INTERVAL lines"""
+        self.state.update(command)
+        self.line = n + 1
+        if self.saved_line is None or self.line - self.saved_line >= CHECKPOINT_INTERVAL:
+            self.save()
+
+    def save(self):
+        path = checkpoint_path(self.gcode_path, self.name)
+        data = {
+            "gcode_path": self.gcode_path,
+            "file": self._file_signature(),
+            "line": self.line,
+            "state": self.state.to_dict(),
+            "updated_at": time.time(),
+        }
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+        self.saved_line = self.line
+
+    def delete(self):
+        path = checkpoint_path(self.gcode_path, self.name)
+        if os.path.exists(path):
+            os.remove(path)
+
+    @classmethod
+    def load(cls, gcode_path, name=None):
+        """Return the saved checkpoint of gcode_path, or None if there is no valid one"""
+        path = checkpoint_path(gcode_path, name)
+        if not os.path.exists(path) or not os.path.exists(gcode_path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            checkpoint = cls(gcode_path, data["line"], MachineState.from_dict(data["state"]), name)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if data.get("file") != checkpoint._file_signature():
+            return None
+        checkpoint.saved_line = checkpoint.line
+        return checkpoint
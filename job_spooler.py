@@ -0,0 +1,215 @@
+#!/usr/bin/python3
+"""Persistent print job queue that generates G-code ahead of printing."""
+
+import json
+import os
+import threading
+import time
+import uuid
+
+from gcode_stream import checkpoint_path
+from text_to_gcode import FontRegistry, textToGcode
+
+QUEUED = "queued"
+GENERATING = "generating"
+READY = "ready"
+PRINTING = "printing"
+DONE = "done"
+FAILED = "failed"
+
+
+class Job:
+    def __init__(self, text, params, job_id=None, state=QUEUED, created_at=None,
+                 updated_at=None, gcode_path=None, error=None):
+        self.id = job_id or uuid.uuid4().hex[:8]
+        self.text = text
+        self.params = params
+        self.state = state
+        self.created_at = created_at or time.time()
+        self.updated_at = updated_at or self.created_at
+        self.gcode_path = gcode_path
+        self.error = error
+
+    def __repr__(self):
+        return "Job(%s, %s)" % (self.id, self.state)
+
+    def summary(self, length=40):
+        """One line description of the job for lists"""
+        text = " ".join(self.text.split())
+        if len(text) > length:
+            text = text[:length - 3] + "..."
+        return f"[{self.state}] {text}"
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "text": self.text,
+            "params": self.params,
+            "state": self.state,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "gcode_path": self.gcode_path,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["text"], data["params"], job_id=data["id"], state=data["state"],
+                   created_at=data["created_at"], updated_at=data["updated_at"],
+                   gcode_path=data.get("gcode_path"), error=data.get("error"))
+
+
+class JobSpooler:
+    """Keeps the job queue in spool_dir/jobs.json and pre-generates G-code.
+
+    A background worker turns queued jobs into G-code files as soon as they are
+    added, so the next job is ready while the current one is plotting. Jobs
+    that were interrupted by a restart are put back in the queue.
+    """
+
+    def __init__(self, spool_dir="spool", gcode_directory="./ascii_gcode/"):
+        self.spool_dir = spool_dir
+        self.path = os.path.join(spool_dir, "jobs.json")
+        self.letters = FontRegistry()
+        self.letters.register(gcode_directory)
+        self.condition = threading.Condition()
+        self.jobs = []
+        self.worker = None
+        self.on_change = None
+        os.makedirs(spool_dir, exist_ok=True)
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            self.jobs = [Job.from_dict(data) for data in json.load(f)]
+        for job in self.jobs:
+            if job.state == GENERATING:
+                job.state = QUEUED
+            elif job.state == PRINTING:
+                job.state = READY
+            if job.state == READY and not (job.gcode_path and os.path.exists(job.gcode_path)):
+                job.state = QUEUED
+
+    def save(self):
+        """Write the queue atomically, so a crash never leaves it half written"""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump([job.to_dict() for job in self.jobs], f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def _changed(self):
+        # Must be called with the condition held; call _notify() once it is released
+        self.save()
+        self.condition.notify_all()
+
+    def _notify(self):
+        # on_change is never called with the lock held, so it may wait for
+        # another thread that is itself waiting for the queue
+        if self.on_change:
+            self.on_change()
+
+    def _delete_gcode(self, job):
+        if not job.gcode_path:
+            return
+        for path in (job.gcode_path, checkpoint_path(job.gcode_path)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def add(self, text, params):
+        job = Job(text, params)
+        with self.condition:
+            self.jobs.append(job)
+            self._changed()
+        self._notify()
+        return job
+
+    def remove(self, job_id):
+        with self.condition:
+            job = next((j for j in self.jobs if j.id == job_id), None)
+            if job is None or job.state in (GENERATING, PRINTING):
+                return False
+            self.jobs.remove(job)
+            self._delete_gcode(job)
+            self._changed()
+        self._notify()
+        return True
+
+    def clear_finished(self):
+        with self.condition:
+            for job in self.jobs:
+                if job.state in (DONE, FAILED):
+                    self._delete_gcode(job)
+            self.jobs = [job for job in self.jobs if job.state not in (DONE, FAILED)]
+            self._changed()
+        self._notify()
+
+    def snapshot(self):
+        with self.condition:
+            return list(self.jobs)
+
+    def set_state(self, job, state, error=None):
+        with self.condition:
+            job.state = state
+            job.error = error
+            job.updated_at = time.time()
+            self._changed()
+        self._notify()
+
+    def start(self):
+        if self.worker is None or not self.worker.is_alive():
+            self.worker = threading.Thread(target=self._generate_loop, daemon=True)
+            self.worker.start()
+
+    def _generate_loop(self):
+        while True:
+            with self.condition:
+                job = next((j for j in self.jobs if j.state == QUEUED), None)
+                while job is None:
+                    self.condition.wait()
+                    job = next((j for j in self.jobs if j.state == QUEUED), None)
+                job.state = GENERATING
+                job.updated_at = time.time()
+                self._changed()
+            self._notify()
+
+            try:
+                gcode_path = self.generate(job)
+            except Exception as e:
+                self.set_state(job, FAILED, f"G-code generation failed: {e}")
+            else:
+                with self.condition:
+                    job.gcode_path = gcode_path
+                self.set_state(job, READY)
+
+    def generate(self, job):
+        p = job.params
+        gcode = textToGcode(self.letters, job.text, p["line_length"], p["line_spacing"],
+                            p["padding"], p["paper_width"], p["paper_height"], p["font_size"],
+                            p["z_height"], p["travel_speed"], p["write_speed"], p["z_speed"],
+                            p.get("arc_tolerance", 0))
+        gcode_path = os.path.abspath(os.path.join(self.spool_dir, f"{job.id}.nc"))
+        with open(gcode_path, "w") as f:
+            f.write(gcode)
+        return gcode_path
+
+    def next_ready(self, timeout=None):
+        """Wait for the oldest job that is ready to print.
+
+        Jobs are printed in queue order, so this waits while an earlier job is
+        still being generated. Returns None once no job is left to print or
+        when the timeout expires.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self.condition:
+            while True:
+                pending = [j for j in self.jobs if j.state in (QUEUED, GENERATING, READY)]
+                if not pending:
+                    return None
+                if pending[0].state == READY:
+                    return pending[0]
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self.condition.wait(remaining)
@@ -1,39 +1,97 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, PanedWindow
-import serial
-from serial import SerialException
-import google.generativeai as genai
 import sys
 import subprocess
 import os
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.patches import Rectangle
-from PIL import Image, ImageTk
-import re
+import queue
 import threading
 import time
 
-# Configure Gemini API
-genai.configure(api_key='AIzaSy************TSrI7vgTb0aI') #Replace with you Gemini Api Key
-model = genai.GenerativeModel('gemini-2.0-flash')
+from gcode_preview import parse_gcode_paths
+
+# Heavy dependencies (google.generativeai, matplotlib, serial) are imported on
+# first use and warmed in a background thread once the window is shown.
+GEMINI_API_KEY = 'AIzaSy************TSrI7vgTb0aI' #Replace with you Gemini Api Key
+GEMINI_MODEL = 'gemini-2.0-flash'
+WARMUP_MODULES = (
+    "serial",
+    "matplotlib.pyplot",
+    "matplotlib.backends.backend_tkagg",
+    "matplotlib.collections",
+    "matplotlib.patches",
+    "google.generativeai",
+)
 
 # Global variables
 ser = None
+protocol = None
+# Held while a line is sent, so manual commands never interleave with a print
+serial_lock = threading.RLock()
+command_queue = None
 current_gcode_path = None
 printing = False
 stop_flag = False
 current_response_text = ""
 current_figure = None
+model = None
+model_lock = threading.Lock()
+spooler = None
+# Set by the spooler's worker thread; the Tk thread polls it, as Tk must only be used from its own thread
+queue_changed = threading.Event()
+# Ids of the jobs shown in the queue list, row by row
+queue_job_ids = []
+# Calls that worker threads need run on the Tk thread, see run_in_tk()
+tk_calls = queue.Queue()
+letters = None
+
+# Full screen view: spatial index cell size and level-of-detail tolerances (mm)
+GRID_CELL_SIZE = 10.0
+LOD_TOLERANCES = (0.0, 0.25, 0.5, 1.0, 2.0)
+
+# How often the print queue list checks for changes (ms)
+QUEUE_POLL_INTERVAL = 250
+
+# Lazy loading
+def get_model():
+    """Configure the Gemini API on first use and return the shared model."""
+    global model
+    with model_lock:
+        if model is None:
+            import google.generativeai as genai
+            genai.configure(api_key=GEMINI_API_KEY)
+            model = genai.GenerativeModel(GEMINI_MODEL)
+    return model
+
+
+def warm_up_imports():
+    """Import the heavy dependencies so the first plot, print or question is fast."""
+    for module_name in WARMUP_MODULES:
+        try:
+            __import__(module_name)
+        except Exception as e:
+            print(f"Background import of {module_name} failed: {e}")
+    try:
+        get_model()
+    except Exception as e:
+        print(f"Failed to configure Gemini: {e}")
 
 # Serial connection functions
 def connect_printer():
-    global ser
+    global ser, protocol
+    import serial
     port = port_entry.get()
     baud = baud_entry.get()
 
     try:
         ser = serial.Serial(port, baudrate=int(baud), timeout=1)
+        protocol = None
+        if checksum_var.get():
+            from gcode_stream import LineProtocol, wait_for_start
+            # Boards that reset when the port opens ignore M110 until they are up
+            wait_for_start(ser, echo=True)
+            protocol = LineProtocol(ser, echo=True)
+            if not protocol.reset():
+                raise Exception("Printer did not acknowledge M110 line number reset")
         enable_controls(True)
         messagebox.showinfo("Connected", f"Successfully connected to {port}")
     except Exception as e:
@@ -44,14 +102,90 @@ def connect_printer():
 
 def disconnect_printer():
     global ser
+    if command_queue:
+        command_queue.clear()
     if ser and ser.is_open:
         ser.close()
     enable_controls(False)
     messagebox.showinfo("Disconnected", "Printer disconnected")
 
 # G-code file handling
-def send_gcode_file():
-    global printing, stop_flag, ser
+def output_gcode_path():
+    """The file Update G-code writes to, so its checkpoint is found again after a restart."""
+    return os.path.join(os.getcwd(), "output.nc")
+
+
+def print_gcode_file(gcode_path, checkpoint=None):
+    """Home the printer and stream a G-code file to it.
+
+    Progress is checkpointed next to the file. If a checkpoint is given, the
+    pen is brought back to its position and the print continues from its line.
+    Returns False if the print was stopped by the user and raises if a command
+    could not be sent.
+    """
+    global printing
+    from gcode_stream import Checkpoint, GcodeIndex
+
+    if command_queue:
+        command_queue.clear()
+    with serial_lock:
+        ser.reset_input_buffer()
+        ser.reset_output_buffer()
+
+    progress_label.config(text="Homing printer...")
+    progress_bar['value'] = 0
+    root.update()
+
+    if not send_gcode("G28"):
+        raise Exception("Homing failed")
+
+    time.sleep(2)
+
+    if checkpoint is None:
+        checkpoint = Checkpoint(gcode_path)
+    else:
+        progress_label.config(text=f"Returning to line {checkpoint.line + 1}...")
+        root.update()
+        for command in checkpoint.state.resume_commands():
+            if not send_gcode(command):
+                raise Exception(f"Failed to restore position: {command}")
+
+    with GcodeIndex(gcode_path) as index:
+        printing = True
+        total_lines = len(index)
+
+        progress_label.config(
+            text=f"Starting print: {checkpoint.line}/{total_lines} lines")
+        root.update()
+
+        for i, line in index.lines(checkpoint.line):
+            if stop_flag:
+                checkpoint.save()
+                progress_label.config(text=f"Print stopped by user at line {i+1}")
+                return False
+
+            progress_percent = int((i / total_lines) * 100)
+            progress_bar['value'] = progress_percent
+            progress_label.config(
+                text=f"Printing: {i+1}/{total_lines} lines ({progress_percent}%)")
+            root.update()
+
+            if not send_gcode(line):
+                checkpoint.save()
+                raise Exception(f"Failed to send command: {line}")
+            checkpoint.acknowledge(i, line)
+
+        checkpoint.delete()
+        progress_label.config(text="Print completed successfully")
+        progress_bar['value'] = 100
+    return True
+
+
+def send_gcode_file(resume=False):
+    global printing, stop_flag, current_gcode_path
+    if resume and not current_gcode_path:
+        # Resume the last print of a previous session; regenerating would invalidate its checkpoint
+        current_gcode_path = output_gcode_path()
     if not current_gcode_path or not os.path.exists(current_gcode_path):
         messagebox.showwarning("Error", "No G-code file generated yet")
         return
@@ -60,55 +194,149 @@ def send_gcode_file():
         messagebox.showwarning("Error", "Not connected to printer")
         return
 
+    checkpoint = None
+    if resume:
+        from gcode_stream import Checkpoint
+        checkpoint = Checkpoint.load(current_gcode_path)
+        if checkpoint is None:
+            messagebox.showwarning("Error", "No interrupted print to resume for this G-code")
+            return
+        if not messagebox.askyesno("Resume Print", f"Resume the print from line {checkpoint.line + 1}?"):
+            return
+
     try:
-        ser.reset_input_buffer()
-        ser.reset_output_buffer()
+        printing = True
         enable_print_controls(False)
+        stop_flag = False
+        completed = print_gcode_file(current_gcode_path, checkpoint)
+        printing = False
+        if completed:
+            messagebox.showinfo("Success", "Print completed successfully")
+    except Exception as e:
+        messagebox.showerror("Error", f"Printing failed: {str(e)}")
+        progress_label.config(text=f"Error: {str(e)}")
+    finally:
+        enable_print_controls(True)
+        printing = False
+        stop_flag = False
 
-        progress_label.config(text="Homing printer...")
-        progress_bar['value'] = 0
-        root.update()
+# Print queue
+def get_spooler():
+    """Load the persisted print queue on first use and start its G-code worker."""
+    global spooler
+    if spooler is None:
+        from job_spooler import JobSpooler
+        spooler = JobSpooler(os.path.join(os.getcwd(), "spool"))
+        spooler.on_change = queue_changed.set
+        spooler.start()
+    return spooler
+
+
+def refresh_queue_list():
+    queue_listbox.delete(0, tk.END)
+    queue_job_ids.clear()
+    for job in get_spooler().snapshot():
+        queue_listbox.insert(tk.END, job.summary())
+        queue_job_ids.append(job.id)
+
+
+def run_in_tk(func):
+    """Run func on the Tk thread and return its result; for worker threads."""
+    done = threading.Event()
+    outcome = {}
+    tk_calls.put((func, outcome, done))
+    done.wait()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
+
+
+def poll_queue_changes():
+    if queue_changed.is_set():
+        queue_changed.clear()
+        refresh_queue_list()
+    while not tk_calls.empty():
+        func, outcome, done = tk_calls.get_nowait()
+        try:
+            outcome["result"] = func()
+        except Exception as e:
+            outcome["error"] = e
+        done.set()
+    root.after(QUEUE_POLL_INTERVAL, poll_queue_changes)
 
-        if not send_gcode("G28"):
-            raise Exception("Homing failed")
 
-        time.sleep(2)
+def add_to_queue():
+    text = response_text.get("1.0", tk.END).strip()
+    if not text:
+        messagebox.showwarning("Error", "Response is empty")
+        return
 
-        with open(current_gcode_path, 'r') as f:
-            stop_flag = False
-            printing = True
-            lines = [line.strip() for line in f if line.strip()
-                     and not line.strip().startswith(';')]
-            total_lines = len(lines)
+    try:
+        params = read_gcode_params()
+    except ValueError as e:
+        messagebox.showerror("Error", f"Failed to queue job: {str(e)}")
+        return
 
-            progress_label.config(
-                text=f"Starting print: 0/{total_lines} lines")
-            root.update()
+    get_spooler().add(text, params)
+
+
+def remove_queued_job():
+    selection = queue_listbox.curselection()
+    if not selection:
+        return
+    # The list may be a moment behind the queue, so remove the job shown rather than the row index
+    if not get_spooler().remove(queue_job_ids[selection[0]]):
+        messagebox.showwarning("Error", "A job cannot be removed while it is being generated or printed")
 
-            for i, line in enumerate(lines):
-                if stop_flag:
-                    progress_label.config(text="Print stopped by user")
-                    break
 
-                progress_percent = int((i / total_lines) * 100)
-                progress_bar['value'] = progress_percent
-                progress_label.config(
-                    text=f"Printing: {i+1}/{total_lines} lines ({progress_percent}%)")
-                root.update()
+def run_queue():
+    """Print the queued jobs back to back, as soon as their G-code is ready."""
+    global printing, stop_flag
+    from job_spooler import PRINTING, READY, DONE, FAILED
+    from gcode_stream import Checkpoint
 
-                if not send_gcode(line):
-                    raise Exception(f"Failed to send command: {line}")
+    if not ser or not ser.is_open:
+        messagebox.showwarning("Error", "Not connected to printer")
+        return
 
-            if not stop_flag:
-                progress_label.config(text="Print completed successfully")
-                progress_bar['value'] = 100
+    job_spooler = get_spooler()
+    printed = 0
+    try:
+        printing = True
+        enable_print_controls(False)
+        stop_flag = False
+        while not stop_flag:
+            run_in_tk(lambda: progress_label.config(text="Waiting for the next job..."))
+            job = job_spooler.next_ready()
+            if job is None or stop_flag:
+                break
+
+            # This runs on a worker thread, so the prompt is shown by the Tk thread
+            if printed and run_in_tk(pause_for_paper_var.get):
+                if not run_in_tk(lambda: messagebox.askokcancel(
+                        "Paper Change", f"Load fresh paper for the next job, then press OK.\n\n{job.summary()}")):
+                    break
+
+            job_spooler.set_state(job, PRINTING)
+            try:
+                # A job stopped earlier continues from its checkpoint instead of from the start
+                completed = print_gcode_file(job.gcode_path, Checkpoint.load(job.gcode_path))
+            except Exception as e:
+                job_spooler.set_state(job, FAILED, str(e))
+                raise
+            if not completed:
+                # Stopped jobs stay in the queue so they can be printed again
+                job_spooler.set_state(job, READY)
+                break
+            job_spooler.set_state(job, DONE)
+            printed += 1
 
         printing = False
         if not stop_flag:
-            messagebox.showinfo("Success", "Print completed successfully")
+            run_in_tk(lambda: messagebox.showinfo("Queue Finished", f"Printed {printed} job(s)"))
     except Exception as e:
-        messagebox.showerror("Error", f"Printing failed: {str(e)}")
-        progress_label.config(text=f"Error: {str(e)}")
+        run_in_tk(lambda: messagebox.showerror("Error", f"Printing failed: {str(e)}"))
+        run_in_tk(lambda: progress_label.config(text=f"Error: {str(e)}"))
     finally:
         enable_print_controls(True)
         printing = False
@@ -123,7 +351,8 @@ def generate_response():
         return
 
     try:
-        response = model.generate_content(
+        import google.generativeai as genai
+        response = get_model().generate_content(
             question +
             " (Answer in plain text without markdown formatting. Maintain proper line breaks and formatting.)",
             generation_config=genai.types.GenerationConfig(
@@ -165,6 +394,68 @@ def update_response():
     messagebox.showinfo("Success", "Response updated successfully!")
 
 # G-code generation
+def read_gcode_params():
+    """Read the G-code parameter entries as floats, raising ValueError on bad input."""
+    params = {
+        "line_length": line_length_entry.get(),
+        "line_spacing": line_spacing_entry.get(),
+        "padding": padding_entry.get(),
+        "paper_width": paper_width_entry.get(),
+        "paper_height": paper_height_entry.get(),
+        "font_size": font_size_entry.get(),
+        "z_height": z_height_entry.get(),
+        "z_speed": z_speed_entry.get(),
+        "travel_speed": travel_speed_entry.get(),
+        "write_speed": write_speed_entry.get(),
+        "arc_tolerance": arc_tolerance_entry.get(),
+    }
+
+    for key, value in params.items():
+        if not value.replace('.', '', 1).isdigit():
+            raise ValueError(f"Invalid value for {key.replace('_', ' ')}")
+        params[key] = float(value)
+    return params
+
+
+def get_letters():
+    """Load the glyph registry used for layout on first use."""
+    global letters
+    if letters is None:
+        from text_to_gcode import FontRegistry
+        letters = FontRegistry()
+        letters.register(os.path.join(os.getcwd(), "ascii_gcode"))
+    return letters
+
+
+def auto_fit_font_size():
+    """Set the font size to the largest one at which the response fits the paper."""
+    from text_to_gcode import fitFontSize, measureText
+
+    text = response_text.get("1.0", tk.END).strip()
+    if not text:
+        messagebox.showwarning("Error", "Response is empty")
+        return
+
+    try:
+        params = read_gcode_params()
+    except ValueError as e:
+        messagebox.showerror("Error", f"Failed to fit text: {str(e)}")
+        return
+
+    font_size = fitFontSize(get_letters(), text, params)
+    if font_size is None:
+        messagebox.showwarning("Auto Fit", "The text does not fit the paper at any font size")
+        return
+
+    font_size = int(font_size * 100) / 100  # round down so it still fits
+    font_size_entry.delete(0, tk.END)
+    font_size_entry.insert(0, f"{font_size:.2f}")
+    measure = measureText(get_letters(), text, dict(params, font_size=font_size))
+    progress_label.config(
+        text=f"Font size {font_size:.2f}: {measure['lines']} lines, "
+             f"{measure['used_height']:.0f} of {measure['available_height']:.0f} mm")
+
+
 def update_gcode():
     if not current_response_text:
         messagebox.showwarning("Error", "Generate a response first")
@@ -181,26 +472,10 @@ def update_gcode():
         with open("ai_response.txt", "w", encoding="utf-8") as file:
             file.write(updated_response)
 
-        params = {
-            "line_length": line_length_entry.get(),
-            "line_spacing": line_spacing_entry.get(),
-            "padding": padding_entry.get(),
-            "paper_width": paper_width_entry.get(),
-            "paper_height": paper_height_entry.get(),
-            "font_size": font_size_entry.get(),
-            "z_height": z_height_entry.get(),
-            "z_speed": z_speed_entry.get(),
-            "travel_speed": travel_speed_entry.get(),
-            "write_speed": write_speed_entry.get(),
-        }
-
-        for key, value in params.items():
-            if not value.replace('.', '', 1).isdigit():
-                raise ValueError(f"Invalid value for {key.replace('_', ' ')}")
-            params[key] = float(value)
+        params = read_gcode_params()
 
         global current_gcode_path
-        current_gcode_path = os.path.join(os.getcwd(), "output.nc")
+        current_gcode_path = output_gcode_path()
         venv_python = sys.executable
 
         command = [
@@ -217,6 +492,7 @@ def update_gcode():
             "--z-speed", str(params["z_speed"]),
             "--travel-speed", str(params["travel_speed"]),
             "--write-speed", str(params["write_speed"]),
+            "--arc-tolerance", str(params["arc_tolerance"]),
         ]
 
         result = subprocess.run(command, capture_output=True, text=True)
@@ -232,8 +508,76 @@ def update_gcode():
         messagebox.showerror("Error", f"Failed to update G-code: {str(e)}")
 
 # Visualization functions
+def parse_gcode_points(gcode_path):
+    """Return the X and Y coordinates visited by the moves of a G-code file."""
+    with open(gcode_path, 'r') as f:
+        paths = parse_gcode_paths(f, pen_up_moves=True)
+    points = [point for path in paths for point in path]
+    return [px for px, _ in points], [py for _, py in points]
+
+
+def decimate_points(x, y, tolerance):
+    """Drop points closer than tolerance (mm) to the previously kept point."""
+    if tolerance <= 0 or len(x) < 3:
+        return list(x), list(y)
+
+    tolerance_sq = tolerance * tolerance
+    kept_x, kept_y = [x[0]], [y[0]]
+    for px, py in zip(x[1:-1], y[1:-1]):
+        if (px - kept_x[-1]) ** 2 + (py - kept_y[-1]) ** 2 >= tolerance_sq:
+            kept_x.append(px)
+            kept_y.append(py)
+    kept_x.append(x[-1])
+    kept_y.append(y[-1])
+    return kept_x, kept_y
+
+
+class SegmentGrid:
+    """Uniform grid index over the segments of a polyline."""
+
+    def __init__(self, x, y, cell_size):
+        self.cell_size = cell_size
+        self.segments = [((x[i], y[i]), (x[i + 1], y[i + 1]))
+                         for i in range(len(x) - 1)]
+        self.cells = {}
+        self.bounds = None
+        if x:
+            self.bounds = (min(x), max(x), min(y), max(y))
+
+        for index, ((x0, y0), (x1, y1)) in enumerate(self.segments):
+            col_min, row_min = self._cell(min(x0, x1), min(y0, y1))
+            col_max, row_max = self._cell(max(x0, x1), max(y0, y1))
+            for col in range(col_min, col_max + 1):
+                for row in range(row_min, row_max + 1):
+                    self.cells.setdefault((col, row), []).append(index)
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def query(self, xmin, xmax, ymin, ymax):
+        """Return the segments whose cells overlap the given rectangle."""
+        if self.bounds is None:
+            return []
+
+        bx_min, bx_max, by_min, by_max = self.bounds
+        if xmin <= bx_min and xmax >= bx_max and ymin <= by_min and ymax >= by_max:
+            return self.segments
+
+        col_min, row_min = self._cell(max(xmin, bx_min), max(ymin, by_min))
+        col_max, row_max = self._cell(min(xmax, bx_max), min(ymax, by_max))
+        visible = set()
+        for col in range(col_min, col_max + 1):
+            for row in range(row_min, row_max + 1):
+                visible.update(self.cells.get((col, row), ()))
+        return [self.segments[index] for index in sorted(visible)]
+
+
 def plot_gcode(gcode_path, paper_width, paper_height):
     global current_figure
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.patches import Rectangle
+
     if current_figure:
         plt.close(current_figure)
 
@@ -247,19 +591,8 @@ def plot_gcode(gcode_path, paper_width, paper_height):
     ax.add_patch(Rectangle((0, 0), paper_width, paper_height+5,
                  edgecolor='black', facecolor='none', linewidth=1.5))
 
-    x, y = [], []
     try:
-        with open(gcode_path, 'r') as f:
-            for line in f:
-                if line.startswith(('G0', 'G1')):
-                    x_match = re.search(r'X([\d.]+)', line)
-                    y_match = re.search(r'Y([\d.]+)', line)
-                    if x_match and y_match:
-                        x.append(float(x_match.group(1)))
-                        y.append(float(y_match.group(1)))
-                    elif len(x) > 0 and len(y) > 0:
-                        x.append(x[-1])
-                        y.append(y[-1])
+        x, y = parse_gcode_points(gcode_path)
     except Exception as e:
         messagebox.showerror("Plot Error", f"Failed to parse G-code: {str(e)}")
         return
@@ -285,6 +618,11 @@ def plot_gcode(gcode_path, paper_width, paper_height):
 
 
 def show_fullscreen_plot():
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.collections import LineCollection
+    from matplotlib.patches import Rectangle
+
     top = tk.Toplevel()
     top.title("G-code Visualization - Full Screen")
     top.state('zoomed')
@@ -292,20 +630,18 @@ def show_fullscreen_plot():
     fig = plt.figure(figsize=(16, 9))
     ax = fig.add_subplot(111)
 
-    with open(current_gcode_path, 'r') as f:
-        x, y = [], []
-        for line in f:
-            if line.startswith(('G0', 'G1')):
-                x_match = re.search(r'X([\d.]+)', line)
-                y_match = re.search(r'Y([\d.]+)', line)
-                if x_match and y_match:
-                    x.append(float(x_match.group(1)))
-                    y.append(float(y_match.group(1)))
-                elif len(x) > 0 and len(y) > 0:
-                    x.append(x[-1])
-                    y.append(y[-1])
+    x, y = parse_gcode_points(current_gcode_path)
+
+    # One spatial index per level of detail, finest first
+    levels = []
+    for tolerance in LOD_TOLERANCES:
+        lod_x, lod_y = decimate_points(x, y, tolerance)
+        cell_size = max(GRID_CELL_SIZE, tolerance * 20)
+        levels.append((tolerance, SegmentGrid(lod_x, lod_y, cell_size)))
+
+    path_lines = LineCollection([], colors='b', linewidths=1)
+    ax.add_collection(path_lines)
 
-    ax.plot(x, y, 'b-', linewidth=1)
     paper_width = float(paper_width_entry.get())
     paper_height = float(paper_height_entry.get())
     ax.add_patch(Rectangle((0, 0), paper_width, paper_height,
@@ -315,12 +651,44 @@ def show_fullscreen_plot():
     ax.set_aspect('equal', adjustable='box')
 
     canvas = FigureCanvasTkAgg(fig, master=top)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    refresh_pending = False
+
+    def refresh_visible_segments():
+        """Render only the segments inside the view, decimated to the zoom level."""
+        nonlocal refresh_pending
+        refresh_pending = False
+        xmin, xmax = sorted(ax.get_xlim())
+        ymin, ymax = sorted(ax.get_ylim())
+        mm_per_pixel = (xmax - xmin) / max(ax.bbox.width, 1)
+
+        grid = levels[0][1]
+        for tolerance, level_grid in levels:
+            if tolerance <= mm_per_pixel:
+                grid = level_grid
+        path_lines.set_segments(grid.query(xmin, xmax, ymin, ymax))
+        canvas.draw_idle()
+
+    def schedule_refresh(_ax):
+        # Both limits change on every pan or zoom; refresh once, before the next draw
+        nonlocal refresh_pending
+        if not refresh_pending:
+            refresh_pending = True
+            top.after_idle(refresh_visible_segments)
+
+    ax.callbacks.connect('xlim_changed', schedule_refresh)
+    ax.callbacks.connect('ylim_changed', schedule_refresh)
+    refresh_visible_segments()
 
     close_btn = ttk.Button(top, text="Close", command=top.destroy)
     close_btn.pack(side=tk.BOTTOM, pady=10)
 
+    toolbar = NavigationToolbar2Tk(canvas, top)
+    toolbar.update()
+    toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+
+    canvas.draw()
+    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
 # Control function
 def enable_controls(state):
     state = tk.NORMAL if state else tk.DISABLED
@@ -330,55 +698,66 @@ def enable_controls(state):
 
 def enable_print_controls(state):
     send_btn.config(state=tk.NORMAL if state else tk.DISABLED)
+    resume_btn.config(state=tk.NORMAL if state else tk.DISABLED)
+    queue_btn.config(state=tk.NORMAL if state else tk.DISABLED)
     stop_btn.config(state=tk.NORMAL if not state else tk.DISABLED)
+    # Manual commands would be sent between the lines of the print
+    enable_controls(state and ser is not None and ser.is_open)
 
-def send_gcode(command):
-    if ser and ser.is_open:
-        try:
-            command = command.strip()
-            if not command or command.startswith(';'):
-                return True
-
-            ser.write(f"{command}\n".encode())
-
-            response = ""
-            timeout = 30
-            start_time = time.time()
-
-            while "ok" not in response.lower():
-                if ser.in_waiting:
-                    new_data = ser.read(ser.in_waiting).decode(
-                        'utf-8', errors='ignore')
-                    response += new_data
-                    print(f"Received: {new_data}")
+def write_gcode(command):
+    """Send one line and wait for its "ok"; serial errors are raised, safe from any thread."""
+    from gcode_stream import send_line
 
-                if time.time() - start_time > timeout:
-                    print(
-                        f"Timeout while waiting for 'ok' after command: {command}")
-                    return False
-
-                time.sleep(0.01)
+    with serial_lock:
+        if not ser or not ser.is_open:
+            return False
+        if protocol:
+            return protocol.send(command)
+        return send_line(ser, command, echo=True)
 
-            return True
+def send_gcode(command):
+    from serial import SerialException
 
-        except SerialException as e:
-            messagebox.showerror("Error", f"Connection lost: {str(e)}")
-            return False
-    return False
+    try:
+        return write_gcode(command)
+    except SerialException as e:
+        messagebox.showerror("Error", f"Connection lost: {str(e)}")
+        return False
+
+# Manual commands are sent from a background queue, so the UI never waits for "ok"
+def get_command_queue():
+    global command_queue
+    if command_queue is None:
+        from gcode_stream import CommandQueue
+        command_queue = CommandQueue(write_gcode, lock=serial_lock,
+                                     on_error=lambda e: root.after(0, manual_command_failed, e))
+    return command_queue
+
+def manual_command_failed(error):
+    messagebox.showerror("Error", f"Manual command failed: {str(error)}")
 
 def home_all():
-    send_gcode("G28")
+    if not printing:
+        get_command_queue().submit("G28")
 
 def move_axis(axis, distance):
-    send_gcode(f"G91\nG0 {axis}{distance}\nG90")
+    if not printing:
+        get_command_queue().jog(axis, distance)
 
 def stop_printing():
     global stop_flag
     stop_flag = True
-    try:
-        send_gcode("M0")
-    except Exception as e:
-        pass
+    if command_queue:
+        command_queue.clear()
+
+    def send_pause():
+        try:
+            write_gcode("M0")
+        except Exception:
+            pass
+
+    # A paused printer answers "busy" until its button is pressed, so do not wait for M0 here
+    threading.Thread(target=send_pause, daemon=True).start()
     messagebox.showinfo("Stopped", "Printing stopped")
 
 def create_axis_control(parent, axis, col):
@@ -402,12 +781,13 @@ def create_axis_control(parent, axis, col):
 
 # UI setup
 def create_ui():
-    global root, port_entry, baud_entry, question_entry, response_text
+    global root, port_entry, baud_entry, checksum_var, question_entry, response_text
     global line_length_entry, line_spacing_entry, padding_entry, paper_width_entry
     global paper_height_entry, font_size_entry, z_height_entry, z_speed_entry
-    global travel_speed_entry, write_speed_entry, progress_label, progress_bar
-    global home_btn, send_btn, stop_btn, x_plus_btn, x_minus_btn, y_plus_btn
+    global travel_speed_entry, write_speed_entry, arc_tolerance_entry, progress_label, progress_bar
+    global home_btn, send_btn, resume_btn, stop_btn, x_plus_btn, x_minus_btn, y_plus_btn
     global y_minus_btn, z_plus_btn, z_minus_btn, viz_frame
+    global queue_listbox, queue_btn, pause_for_paper_var
 
     root = tk.Tk()
     root.title("AI Plot Bot")
@@ -444,6 +824,10 @@ def create_ui():
     baud_entry.grid(row=0, column=3, padx=5)
     baud_entry.insert(0, "115200")
 
+    checksum_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(conn_frame, text="Checksums",
+                    variable=checksum_var).grid(row=1, column=0, columnspan=2, sticky=tk.W)
+
     connect_btn = ttk.Button(
         conn_frame, text="Connect", command=connect_printer)
     connect_btn.grid(row=0, column=4, padx=5)
@@ -486,6 +870,10 @@ def create_ui():
         btn_frame, text="Update AI Response", command=update_response)
     update_response_btn.pack(side=tk.LEFT, padx=5)
 
+    auto_fit_btn = ttk.Button(
+        btn_frame, text="Auto Fit", command=auto_fit_font_size)
+    auto_fit_btn.pack(side=tk.LEFT, padx=5)
+
     update_btn = ttk.Button(
         btn_frame, text="Update G-code", command=update_gcode)
     update_btn.pack(side=tk.LEFT, padx=5)
@@ -517,6 +905,7 @@ def create_ui():
         ("Z Speed:", "z_speed", "5000", 2, 4),
         ("Travel Speed:", "travel_speed", "12000", 2, 6),
         ("Write Speed:", "write_speed", "4000", 2, 8),
+        ("Arc Tolerance:", "arc_tolerance", "0", 4, 0),
     ]
 
     # for label_text, var_name, default, row in parameters:
@@ -552,6 +941,9 @@ def create_ui():
     send_btn = ttk.Button(print_btn_frame, text="Start Print",
                           command=lambda: threading.Thread(target=send_gcode_file).start())
     send_btn.pack(side=tk.LEFT, padx=5)
+    resume_btn = ttk.Button(print_btn_frame, text="Resume",
+                            command=lambda: threading.Thread(target=send_gcode_file, args=(True,)).start())
+    resume_btn.pack(side=tk.LEFT, padx=5)
     stop_btn = ttk.Button(print_btn_frame, text="STOP",
                           command=stop_printing, state=tk.DISABLED)
     stop_btn.pack(side=tk.LEFT, padx=5)
@@ -561,6 +953,35 @@ def create_ui():
         right_frame, text="G-code Visualization", padding=10)
     viz_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+    # Print queue
+    queue_frame = ttk.LabelFrame(right_frame, text="Print Queue", padding=10)
+    queue_frame.pack(fill=tk.X, padx=5, pady=5)
+
+    queue_listbox = tk.Listbox(queue_frame, height=5)
+    queue_listbox.pack(fill=tk.X, pady=5)
+
+    queue_btn_frame = ttk.Frame(queue_frame)
+    queue_btn_frame.pack()
+    ttk.Button(queue_btn_frame, text="Add to Queue",
+               command=add_to_queue).pack(side=tk.LEFT, padx=5)
+    ttk.Button(queue_btn_frame, text="Remove",
+               command=remove_queued_job).pack(side=tk.LEFT, padx=5)
+    ttk.Button(queue_btn_frame, text="Clear Finished",
+               command=lambda: get_spooler().clear_finished()).pack(side=tk.LEFT, padx=5)
+    queue_btn = ttk.Button(queue_btn_frame, text="Start Queue",
+                           command=lambda: threading.Thread(target=run_queue).start())
+    queue_btn.pack(side=tk.LEFT, padx=5)
+
+    pause_for_paper_var = tk.BooleanVar(value=True)
+    ttk.Checkbutton(queue_frame, text="Pause for paper change between jobs",
+                    variable=pause_for_paper_var).pack(anchor=tk.W)
+
+    # Load the heavy dependencies once the window is on screen
+    root.after_idle(lambda: threading.Thread(
+        target=warm_up_imports, daemon=True).start())
+    root.after_idle(refresh_queue_list)
+    root.after(QUEUE_POLL_INTERVAL, poll_queue_changes)
+
     root.mainloop()
 
 
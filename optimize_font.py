@@ -0,0 +1,188 @@
+#!/usr/bin/python3
+"""Optimizes the stroke order of every glyph of a font.
+
+Strokes that share an endpoint are chained so the pen is not lifted between
+them, then the order and direction of the strokes that minimizes pen-up
+travel is searched for every possible entry point. The best of these are
+written back to the glyph file as variants, separated by "; variant" lines,
+so that textToGcode can choose the cheapest one given the previous pen
+position.
+"""
+
+from functools import lru_cache
+import argparse
+import math
+import os
+
+from text_to_gcode import Instr, Letter
+
+# Glyphs with more strokes than this are ordered greedily instead of exactly
+MAX_EXACT_STROKES = 10
+
+
+def strokes(letter):
+    """Split a letter into pen-down polylines, each a list of (x, y) points"""
+    result = []
+    for instr in letter.instructions:
+        if instr.type == Instr.Type.move:
+            result.append([(instr.x, instr.y)])
+        elif instr.type == Instr.Type.write and result:
+            result[-1].append((instr.x, instr.y))
+        else:
+            raise ValueError("only glyphs made of G0 and G1 moves can be optimized")
+    return [stroke for stroke in result if len(stroke) > 1]
+
+
+def chainStrokes(strokes):
+    """Join strokes that share an endpoint, reversing them where needed"""
+    strokes = [list(stroke) for stroke in strokes]
+    joined = True
+    while joined:
+        joined = False
+        for a in range(len(strokes)):
+            for b in range(len(strokes)):
+                if a == b:
+                    continue
+                first, second = strokes[a], strokes[b]
+                if first[-1] == second[0]:
+                    chained = first + second[1:]
+                elif first[-1] == second[-1]:
+                    chained = first + second[-2::-1]
+                elif first[0] == second[-1]:
+                    chained = second + first[1:]
+                elif first[0] == second[0]:
+                    chained = second[::-1] + first[1:]
+                else:
+                    continue
+                strokes[a] = chained
+                del strokes[b]
+                joined = True
+                break
+            if joined:
+                break
+    return strokes
+
+
+def orderStrokes(strokes, first):
+    """Order and orient strokes to minimize pen-up travel, starting with strokes[first] as given.
+
+    Returns (travel, [(stroke index, reversed), ...]).
+    """
+    def entry(k, backwards):
+        return strokes[k][-1] if backwards else strokes[k][0]
+
+    def exit(k, backwards):
+        return strokes[k][0] if backwards else strokes[k][-1]
+
+    def distance(p, q):
+        return math.hypot(q[0] - p[0], q[1] - p[1])
+
+    full = (1 << len(strokes)) - 1
+
+    if len(strokes) > MAX_EXACT_STROKES:
+        order, travel, mask = [(first, False)], 0.0, 1 << first
+        while mask != full:
+            position = exit(*order[-1])
+            step = min(((distance(position, entry(k, d)), k, d) for k in range(len(strokes))
+                        if not mask & (1 << k) for d in (False, True)))
+            travel += step[0]
+            order.append(step[1:])
+            mask |= 1 << step[1]
+        return travel, order
+
+    @lru_cache(maxsize=None)
+    def remaining(mask, k, backwards):
+        if mask == full:
+            return 0.0, ()
+        best = None
+        for other in range(len(strokes)):
+            if mask & (1 << other):
+                continue
+            for d in (False, True):
+                travel, rest = remaining(mask | (1 << other), other, d)
+                travel += distance(exit(k, backwards), entry(other, d))
+                if best is None or travel < best[0]:
+                    best = (travel, ((other, d),) + rest)
+        return best
+
+    travel, rest = remaining(1 << first, first, False)
+    return travel, [(first, False)] + list(rest)
+
+
+def optimizeLetter(letter, max_variants=4):
+    """Return the letter with its best stroke orders, distinct by entry point, as variants"""
+    chained = chainStrokes(strokes(letter))
+    if not chained:
+        return letter
+
+    # Every stroke can be entered from either end
+    candidates = []
+    for first in range(len(chained)):
+        for backwards in (False, True):
+            oriented = list(chained)
+            if backwards:
+                oriented[first] = oriented[first][::-1]
+            travel, order = orderStrokes(oriented, first)
+            candidates.append((travel, [oriented[k][::-1] if d else oriented[k] for k, d in order]))
+
+    candidates.sort(key=lambda candidate: candidate[0])
+    # Letters are written left to right, so always keep the best leftmost entry
+    leftmost = min(candidates, key=lambda candidate: (candidate[1][0][0][0], candidate[0]))
+    chosen = [leftmost]
+    for candidate in candidates:
+        if len(chosen) >= max_variants:
+            break
+        if all(candidate[1][0][0] != other[1][0][0] for other in chosen):
+            chosen.append(candidate)
+
+    variants = []
+    for _, ordered in chosen:
+        instructions = []
+        for stroke in ordered:
+            instructions.append(Instr(Instr.Type.move, *map(float, stroke[0])))
+            instructions.extend(Instr(Instr.Type.write, *map(float, point)) for point in stroke[1:])
+        variants.append(Letter(instructions, letter.width))
+    return Letter(variants[0].instructions, letter.width, variants[1:])
+
+
+def liftsAndTravel(letter):
+    return len(strokes(letter)), letter.travelLength()
+
+
+def main():
+    argParser = argparse.ArgumentParser(description="Optimizes the stroke order of the glyphs of a font")
+    argParser.add_argument("-g", "--gcode-directory", type=str, default="./ascii_gcode/", metavar="DIR",
+                           help="Directory containing the glyphs to optimize")
+    argParser.add_argument("-o", "--output", type=str, default=None, metavar="DIR",
+                           help="Directory to write the optimized glyphs to (default: in place)")
+    argParser.add_argument("--max-variants", type=int, default=4,
+                           help="Maximum number of stroke orders stored per glyph (default: 4)")
+    args = argParser.parse_args()
+    output = args.output or args.gcode_directory
+
+    before, after = [0, 0.0], [0, 0.0]
+    for root, _, filenames in os.walk(args.gcode_directory):
+        for filename in sorted(filenames):
+            path = os.path.join(root, filename)
+            with open(path, "r") as file:
+                header = file.readline().rstrip("\n")
+                letter = Letter(file.read())
+            # Variants of an already optimized glyph are derived again from the first one
+            letter = Letter(letter.instructions, letter.width)
+            optimized = optimizeLetter(letter, args.max_variants)
+
+            for totals, glyph in ((before, letter), (after, optimized)):
+                lifts, travel = liftsAndTravel(glyph)
+                totals[0] += lifts
+                totals[1] += travel
+
+            out_dir = os.path.join(output, os.path.relpath(root, args.gcode_directory))
+            os.makedirs(out_dir, exist_ok=True)
+            with open(os.path.join(out_dir, filename), "w") as file:
+                file.write(header + "\n" + repr(optimized).rstrip("\n"))
+
+    print(f"Strokes: {before[0]} -> {after[0]}, pen-up travel: {before[1]:.1f} -> {after[1]:.1f}")
+
+
+if __name__ == '__main__':
+    main()
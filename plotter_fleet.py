@@ -0,0 +1,317 @@
+#!/usr/bin/python3
+"""Drives several serial plotters at once, dispatching G-code jobs to whichever is idle."""
+
+import argparse
+import os
+import threading
+import time
+
+from gcode_stream import Checkpoint, GcodeIndex, LineProtocol, send_line, wait_for_start
+
+OFFLINE = "offline"
+IDLE = "idle"
+BUSY = "busy"
+ERROR = "error"
+
+QUEUED = "queued"
+PRINTING = "printing"
+DONE = "done"
+FAILED = "failed"
+STOPPED = "stopped"
+
+
+class FleetJob:
+    def __init__(self, gcode_path, name=None):
+        self.gcode_path = gcode_path
+        self.name = name or os.path.basename(gcode_path)
+        self.state = QUEUED
+        self.device = None
+        self.error = None
+
+    def __repr__(self):
+        return "FleetJob(%s, %s)" % (self.name, self.state)
+
+
+class Device:
+    """One plotter on a serial port, streaming its current job from a worker thread"""
+
+    def __init__(self, name, port, baudrate=115200, timeout=30, checksums=False, boot_timeout=3):
+        self.name = name
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.checksums = checksums
+        self.boot_timeout = boot_timeout
+        self.ser = None
+        self.protocol = None
+        self.state = OFFLINE
+        self.job = None
+        self.error = None
+        self.lines_sent = 0
+        self.total_lines = 0
+        self.started_at = None
+        self.jobs_completed = 0
+        self.lines_completed = 0
+        self.busy_seconds = 0.0
+        self._stop = False
+
+    def open(self):
+        import serial
+        self.ser = serial.Serial(self.port, baudrate=self.baudrate, timeout=1)
+        if self.checksums:
+            # Boards that reset when the port opens ignore M110 until they are up
+            if self.boot_timeout:
+                wait_for_start(self.ser, self.boot_timeout)
+            self.protocol = LineProtocol(self.ser, self.timeout)
+            if not self.protocol.reset():
+                self.ser.close()
+                raise IOError(f"{self.port} did not acknowledge M110 line number reset")
+        self.state = IDLE
+
+    def close(self):
+        if self.ser and self.ser.is_open:
+            self.ser.close()
+        self.state = OFFLINE
+
+    def status(self):
+        elapsed = time.time() - self.started_at if self.state == BUSY and self.started_at else 0.0
+        return {
+            "name": self.name,
+            "port": self.port,
+            "state": self.state,
+            "job": self.job.name if self.job else None,
+            "lines_sent": self.lines_sent,
+            "total_lines": self.total_lines,
+            "percent": int(self.lines_sent / self.total_lines * 100) if self.total_lines else 0,
+            "lines_per_second": self.lines_sent / elapsed if elapsed else 0.0,
+            "jobs_completed": self.jobs_completed,
+            "average_lines_per_second": self.lines_completed / self.busy_seconds if self.busy_seconds else 0.0,
+            "resends": self.protocol.resends if self.protocol else 0,
+            "error": self.error,
+        }
+
+    def start(self, job, on_finish):
+        self.state = BUSY
+        self.job = job
+        self.error = None
+        self.lines_sent = 0
+        self.total_lines = 0
+        self.started_at = time.time()
+        self._stop = False
+        job.state = PRINTING
+        job.device = self.name
+        threading.Thread(target=self._run, args=(job, on_finish), daemon=True).start()
+
+    def stop(self):
+        self._stop = True
+
+    def _run(self, job, on_finish):
+        # Several devices may print the same file, so each keeps its own checkpoint
+        checkpoint = Checkpoint(job.gcode_path, name=self.name)
+        try:
+            if not self.protocol:
+                self.ser.reset_input_buffer()
+            with GcodeIndex(job.gcode_path) as index:
+                self.total_lines = len(index)
+                for i, line in index.lines():
+                    if self._stop:
+                        checkpoint.save()
+                        job.state = STOPPED
+                        break
+                    if self.protocol:
+                        sent = self.protocol.send(line)
+                    else:
+                        sent = send_line(self.ser, line, self.timeout)
+                    if not sent:
+                        checkpoint.save()
+                        raise Exception(f"Timeout while waiting for 'ok' after command: {line}")
+                    checkpoint.acknowledge(i, line)
+                    self.lines_sent = i + 1
+                else:
+                    checkpoint.delete()
+                    job.state = DONE
+                    self.jobs_completed += 1
+        except Exception as e:
+            job.state = FAILED
+            job.error = self.error = str(e)
+            self.state = ERROR
+        finally:
+            self.lines_completed += self.lines_sent
+            self.busy_seconds += time.time() - self.started_at
+            # The device stays busy until on_finish releases it under the manager's lock
+            on_finish(self, job)
+
+
+class DeviceManager:
+    """Opens several plotters and feeds queued jobs to whichever one is idle.
+
+    A device that fails a job is left in the error state, and gets no more
+    jobs, until reset_device() is called for it. on_update, if set, is called
+    whenever a job starts or finishes, from worker threads and never with the
+    manager's lock held.
+    """
+
+    def __init__(self, on_update=None):
+        self.devices = {}
+        self.jobs = []
+        self.on_update = on_update
+        self.condition = threading.Condition()
+
+    def add_device(self, name, port, baudrate=115200, timeout=30, checksums=False, boot_timeout=3):
+        device = Device(name, port, baudrate, timeout, checksums, boot_timeout)
+        device.open()
+        with self.condition:
+            self.devices[name] = device
+            started = self._dispatch()
+        if started:
+            self._updated()
+        return device
+
+    def remove_device(self, name):
+        with self.condition:
+            device = self.devices[name]
+            if device.state == BUSY:
+                raise RuntimeError(f"{name} is busy")
+            del self.devices[name]
+        device.close()
+
+    def reset_device(self, name):
+        started = False
+        with self.condition:
+            device = self.devices[name]
+            if device.state == ERROR:
+                device.state = IDLE
+                device.error = None
+                started = self._dispatch()
+        if started:
+            self._updated()
+
+    def submit(self, gcode_path, name=None):
+        job = FleetJob(gcode_path, name)
+        with self.condition:
+            self.jobs.append(job)
+            started = self._dispatch()
+        if started:
+            self._updated()
+        return job
+
+    def _dispatch(self):
+        # Must be called with the condition held; returns whether a job was started
+        started = False
+        for device in self.devices.values():
+            if device.state != IDLE:
+                continue
+            job = next((j for j in self.jobs if j.state == QUEUED), None)
+            if job is None:
+                break
+            device.start(job, self._finished)
+            started = True
+        self.condition.notify_all()
+        return started
+
+    def _finished(self, device, job):
+        with self.condition:
+            if device.state == BUSY:
+                device.state = IDLE
+            device.job = None
+            self._dispatch()
+        self._updated()
+
+    def _updated(self):
+        if self.on_update:
+            self.on_update()
+
+    def status(self):
+        with self.condition:
+            return [device.status() for device in self.devices.values()]
+
+    def pending(self):
+        with self.condition:
+            return [job for job in self.jobs if job.state in (QUEUED, PRINTING)]
+
+    def wait(self, timeout=None):
+        """Wait until no job is queued or printing; returns False on timeout.
+
+        Queued jobs that no device can take, because every device is in the
+        error state, are not waited for.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self.condition:
+            while True:
+                printing = any(job.state == PRINTING for job in self.jobs)
+                queued = any(job.state == QUEUED for job in self.jobs)
+                usable = any(device.state in (IDLE, BUSY) for device in self.devices.values())
+                if not printing and not (queued and usable):
+                    return True
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+
+    def stop_all(self):
+        with self.condition:
+            for job in self.jobs:
+                if job.state == QUEUED:
+                    job.state = STOPPED
+            for device in self.devices.values():
+                device.stop()
+
+    def close(self):
+        self.stop_all()
+        self.wait(timeout=5)
+        for device in list(self.devices.values()):
+            device.close()
+
+
+def main():
+    argParser = argparse.ArgumentParser(description="Prints G-code files on several plotters at once")
+    argParser.add_argument("files", nargs="+", metavar="FILE",
+                           help="G-code files to print")
+    argParser.add_argument("-p", "--port", action="append", default=[], metavar="PORT",
+                           help="Serial port of a plotter; repeat for each plotter")
+    argParser.add_argument("-b", "--baud", type=int, default=115200,
+                           help="Baud rate of the plotters (default: 115200)")
+    argParser.add_argument("--simulate", type=int, default=0, metavar="N",
+                           help="Add N simulated plotters on pseudo terminals")
+    argParser.add_argument("--checksums", action="store_true",
+                           help="Send line numbered, checksummed lines and resend the ones the plotter rejects")
+    argParser.add_argument("--simulate-error-rate", type=float, default=0.0, metavar="RATE",
+                           help="Share of framed lines the simulated plotters reject as corrupted")
+    args = argParser.parse_args()
+
+    simulated = []
+    if args.simulate:
+        from plotter_sim import SimulatedPlotter
+        simulated = [SimulatedPlotter(error_rate=args.simulate_error_rate) for _ in range(args.simulate)]
+    ports = args.port + [plotter.port for plotter in simulated]
+    if not ports:
+        argParser.error("no plotter given, use --port or --simulate")
+
+    manager = DeviceManager()
+    for number, port in enumerate(ports, 1):
+        # Simulated plotters are up at once, real boards may reset when the port opens
+        manager.add_device(f"plotter{number}", port, args.baud, checksums=args.checksums,
+                           boot_timeout=0 if number > len(args.port) else 3)
+    jobs = [manager.submit(path) for path in args.files]
+
+    try:
+        while not manager.wait(timeout=1):
+            for status in manager.status():
+                print(f"{status['name']} ({status['port']}): {status['state']} {status['job'] or ''} "
+                      f"{status['lines_sent']}/{status['total_lines']} lines, "
+                      f"{status['lines_per_second']:.0f} lines/s")
+    except KeyboardInterrupt:
+        manager.stop_all()
+
+    for job in jobs:
+        print(f"{job.name}: {job.state} on {job.device}" + (f" ({job.error})" if job.error else ""))
+    for status in manager.status():
+        print(f"{status['name']}: {status['jobs_completed']} jobs, "
+              f"{status['average_lines_per_second']:.0f} lines/s, {status['resends']} resends")
+    manager.close()
+    for plotter in simulated:
+        plotter.close()
+
+
+if __name__ == '__main__':
+    main()
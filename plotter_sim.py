@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+"""Simulated plotters on pseudo terminals, for trying out the serial code without hardware.
+
+Every simulated plotter answers each received line with "ok" after an
+optional delay. Like Marlin, it checks the line number and checksum of
+framed lines (N<line> <command>*<checksum>) and asks for rejected lines
+again with "Resend:"; error_rate corrupts that share of framed lines on
+purpose. Only available where the os module provides openpty.
+"""
+
+import argparse
+import os
+import random
+import threading
+import time
+import tty
+
+
+class SimulatedPlotter:
+    def __init__(self, line_delay=0.0, error_rate=0.0):
+        self.line_delay = line_delay
+        self.error_rate = error_rate
+        self.received = []
+        self.last_line = 0
+        self.rejected = 0
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._master)
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def reply(self, line):
+        """The response to one received line"""
+        if not line.startswith("N"):
+            return "ok\n"
+
+        from gcode_stream import checksum
+        body, _, received_checksum = line.rpartition("*")
+        number, _, command = body.partition(" ")
+        corrupted = random.random() < self.error_rate
+        if not received_checksum.isdigit() or int(received_checksum) != checksum(body) or corrupted:
+            return self._reject("checksum mismatch")
+
+        n = int(number[1:])
+        if command.startswith("M110"):
+            self.last_line = int(command.split("N", 1)[1]) if "N" in command else n
+            return "ok\n"
+        if n != self.last_line + 1:
+            return self._reject("Line Number is not Last Line Number+1")
+        self.last_line = n
+        return "ok\n"
+
+    def _reject(self, reason):
+        self.rejected += 1
+        return f"Error:{reason}, Last Line: {self.last_line}\nResend: {self.last_line + 1}\nok\n"
+
+    def _serve(self):
+        buffer = b""
+        while self._running:
+            try:
+                data = os.read(self._master, 4096)
+            except OSError:
+                break
+            buffer += data
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                line = line.decode("utf-8", errors="ignore").strip()
+                self.received.append(line)
+                if self.line_delay:
+                    time.sleep(self.line_delay)
+                os.write(self._master, self.reply(line).encode())
+
+    def close(self):
+        self._running = False
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def main():
+    argParser = argparse.ArgumentParser(description="Serves simulated plotters on pseudo terminals")
+    argParser.add_argument("-n", "--count", type=int, default=1,
+                           help="Number of plotters to simulate (default: 1)")
+    argParser.add_argument("--line-delay", type=float, default=0.0,
+                           help="Seconds each plotter takes to acknowledge a line (default: 0)")
+    argParser.add_argument("--error-rate", type=float, default=0.0,
+                           help="Share of framed lines to reject as corrupted (default: 0)")
+    args = argParser.parse_args()
+
+    plotters = [SimulatedPlotter(args.line_delay, args.error_rate) for _ in range(args.count)]
+    for plotter in plotters:
+        print(plotter.port)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        for plotter in plotters:
+            plotter.close()
+
+
+if __name__ == '__main__':
+    main()
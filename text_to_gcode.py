@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 # pylint: disable=no-member
 
+from collections import OrderedDict
 from enum import Enum
 import os
 import math
@@ -11,58 +12,218 @@ class Instr:
     class Type(Enum):
         move = 0,
         write = 1,
+        arc_cw = 2,
+        arc_ccw = 3,
 
     def __init__(self, *args):
+        self.i, self.j = 0.0, 0.0
         if len(args) == 1 and type(args[0]) is str:  # args must be a data str
             attributes = args[0].split(' ')
-            # G_ X__ Y__
-            self.type = Instr.Type.move if attributes[0][1] == '0' else Instr.Type.write
+            # G_ X__ Y__ [I__ J__]
+            self.type = {'0': Instr.Type.move, '2': Instr.Type.arc_cw,
+                         '3': Instr.Type.arc_ccw}.get(attributes[0][1], Instr.Type.write)
             self.x = float(attributes[1][1:])
             self.y = float(attributes[2][1:])
+            if self.isArc():
+                self.i = float(attributes[3][1:])
+                self.j = float(attributes[4][1:])
         elif len(args) == 3 and type(args[0]) is Instr.Type and type(args[1]) is float and type(args[2]) is float:
             self.type, self.x, self.y = args
+        elif len(args) == 5 and type(args[0]) is Instr.Type and all(type(arg) is float for arg in args[1:]):
+            self.type, self.x, self.y, self.i, self.j = args
         else:
             raise TypeError(
-                "Instr() takes one (str) or three (Instr.Type, float, float) arguments")
+                "Instr() takes one (str), three (Instr.Type, float, float) or five "
+                "(Instr.Type, float, float, float, float) arguments")
 
     def __repr__(self):
+        if self.isArc():
+            return "G%d X%.2f Y%.2f I%.3f J%.3f" % (self.type.value[0], self.x, self.y, self.i, self.j)
         return "G%d X%.2f Y%.2f" % (self.type.value[0], self.x, self.y)
 
+    def isArc(self):
+        return self.type in (Instr.Type.arc_cw, Instr.Type.arc_ccw)
+
     def translated(self, x, y):
-        return Instr(self.type, self.x + x, self.y + y)
+        # I and J are relative to the start of the move, so they do not change
+        return Instr(self.type, self.x + x, self.y + y, self.i, self.j)
         
     def scaled(self, scale_factor):
         """Apply scaling to the instruction coordinates"""
-        return Instr(self.type, self.x * scale_factor, self.y * scale_factor)
+        return Instr(self.type, self.x * scale_factor, self.y * scale_factor,
+                     self.i * scale_factor, self.j * scale_factor)
+
+
+# Arcs larger than this (mm) are left as straight segments
+MAX_ARC_RADIUS = 1000.0
+
+
+def fitArc(points, start, end, tolerance):
+    """Fit a circular arc through points[start..end].
+
+    Returns (Instr.Type, i, j), with i and j the offset of the center from
+    points[start], if every point and every segment midpoint lies within
+    tolerance of the arc and the points turn consistently in one direction.
+    Returns None otherwise.
+    """
+    (ax, ay), (bx, by), (cx, cy) = points[start], points[(start + end) // 2], points[end]
+    if math.hypot(cx - ax, cy - ay) < tolerance:
+        return None  # closed loops are left to be split into several arcs
+
+    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    if abs(d) < 1e-12:
+        return None
+    ux = ((ax * ax + ay * ay) * (by - cy) + (bx * bx + by * by) * (cy - ay) + (cx * cx + cy * cy) * (ay - by)) / d
+    uy = ((ax * ax + ay * ay) * (cx - bx) + (bx * bx + by * by) * (ax - cx) + (cx * cx + cy * cy) * (bx - ax)) / d
+    radius = math.hypot(ax - ux, ay - uy)
+    if radius > MAX_ARC_RADIUS:
+        return None
+
+    sweep = 0.0
+    for k in range(start, end):
+        (px, py), (qx, qy) = points[k], points[k + 1]
+        mx, my = (px + qx) / 2, (py + qy) / 2
+        if (abs(math.hypot(qx - ux, qy - uy) - radius) > tolerance
+                or abs(math.hypot(mx - ux, my - uy) - radius) > tolerance):
+            return None
+        cross = (px - ux) * (qy - uy) - (py - uy) * (qx - ux)
+        dot = (px - ux) * (qx - ux) + (py - uy) * (qy - uy)
+        step = math.atan2(cross, dot)
+        if step == 0 or (sweep and (step > 0) != (sweep > 0)):
+            return None
+        sweep += step
+
+    if abs(sweep) >= 2 * math.pi - 1e-6:
+        return None
+    arcType = Instr.Type.arc_ccw if sweep > 0 else Instr.Type.arc_cw
+    return arcType, ux - ax, uy - ay
+
+
+def arcOffsets(start, end, center):
+    """I and J of an arc from start to end as they are emitted, rounded to 0.01.
+
+    The center is moved onto the perpendicular bisector of the rounded
+    endpoints, so that both are equally far from it: controllers such as
+    GRBL reject arcs whose start and end radii differ.
+    """
+    (sx, sy), (ex, ey) = [(round(x, 2), round(y, 2)) for x, y in (start, end)]
+    mx, my = (sx + ex) / 2, (sy + ey) / 2
+    nx, ny = sy - ey, ex - sx
+    length2 = nx * nx + ny * ny
+    if length2 == 0:
+        return center[0] - sx, center[1] - sy
+    t = ((center[0] - mx) * nx + (center[1] - my) * ny) / length2
+    return mx + t * nx - sx, my + t * ny - sy
 
 
 class Letter:
     def __init__(self, *args):
         if len(args) == 1 and type(args[0]) is str:
-            self.instructions = []
+            # A line starting with ';' separates alternative stroke orders of the glyph
+            chunks = [[]]
             for line in args[0].split('\n'):
-                if line != "":
-                    self.instructions.append(Instr(line))
+                if line.startswith(';'):
+                    chunks.append([])
+                elif line != "":
+                    chunks[-1].append(Instr(line))
+            self.instructions = chunks[0]
             pointsOnX = [instr.x for instr in self.instructions]
             self.width = max(pointsOnX) - min(pointsOnX)
-        elif len(args) == 2 and type(args[0]) is list and type(args[1]) is float:
+            self.variants = [Letter(instructions, self.width) for instructions in chunks[1:] if instructions]
+            self._costTerms = None
+        elif 2 <= len(args) <= 3 and type(args[0]) is list and type(args[1]) is float:
             self.instructions = args[0]
             self.width = args[1]
+            self.variants = args[2] if len(args) == 3 else []
+            self._costTerms = None
         else:
             raise TypeError(
-                "Letter() takes one (str) or two (list, float) arguments")
+                "Letter() takes one (str) or two or three (list, float[, list]) arguments")
 
     def __repr__(self):
-        return "\n".join([repr(instr) for instr in self.instructions]) + "\n"
+        return "; variant\n".join(
+            "\n".join([repr(instr) for instr in letter.instructions]) + "\n"
+            for letter in [self] + self.variants)
 
     def translated(self, x, y):
-        return Letter([instr.translated(x, y) for instr in self.instructions], self.width)
+        return Letter([instr.translated(x, y) for instr in self.instructions], self.width,
+                      [variant.translated(x, y) for variant in self.variants])
         
     def scaled(self, scale_factor):
         """Apply scaling to all instructions and width of the letter"""
         scaled_instructions = [instr.scaled(scale_factor) for instr in self.instructions]
         scaled_width = self.width * scale_factor
-        return Letter(scaled_instructions, scaled_width)
+        return Letter(scaled_instructions, scaled_width,
+                      [variant.scaled(scale_factor) for variant in self.variants])
+
+    def travelLength(self):
+        """Distance travelled with the pen up between the first and the last point"""
+        length = 0.0
+        for previous, instr in zip(self.instructions, self.instructions[1:]):
+            if instr.type == Instr.Type.move:
+                length += math.hypot(instr.x - previous.x, instr.y - previous.y)
+        return length
+
+    def emissionCost(self, x, y):
+        """Estimated pen-up travel to draw this letter with the pen starting at (x, y).
+
+        Besides reaching the first point and the travel inside the letter, this
+        counts how far the last point is left of the letter's right edge, since
+        the next letter is placed to the right.
+        """
+        if not self.instructions:
+            return 0.0
+        if self._costTerms is None:
+            right = max(instr.x for instr in self.instructions)
+            self._costTerms = self.travelLength() + (right - self.instructions[-1].x)
+        first = self.instructions[0]
+        return math.hypot(first.x - x, first.y - y) + self._costTerms
+
+    def cheapestVariant(self, x, y):
+        """The stroke order of this letter that is cheapest to draw from (x, y)"""
+        if not self.variants:
+            return self
+        return min([self] + self.variants, key=lambda letter: letter.emissionCost(x, y))
+
+    def arcFitted(self, tolerance):
+        """Replace runs of writing segments that lie on a circular arc with G2/G3 arcs"""
+        instructions = []
+        run = []  # points of the current run of writing segments
+
+        def flushRun():
+            k = 0
+            while k < len(run) - 1:
+                fitted = None
+                end = k + 3  # only worth it when an arc replaces three or more segments
+                while end < len(run):
+                    arc = fitArc(run, k, end, tolerance)
+                    if arc is None:
+                        break
+                    fitted = (end, arc)
+                    end += 1
+
+                if fitted:
+                    end, (arcType, i, j) = fitted
+                    instructions.append(Instr(arcType, run[end][0], run[end][1], i, j))
+                    k = end
+                else:
+                    instructions.append(Instr(Instr.Type.write, run[k + 1][0], run[k + 1][1]))
+                    k += 1
+            run.clear()
+
+        position = None
+        for instr in self.instructions:
+            if instr.type == Instr.Type.write and position is not None:
+                if not run:
+                    run.append(position)
+                run.append((instr.x, instr.y))
+            else:
+                flushRun()
+                instructions.append(instr)
+            position = (instr.x, instr.y)
+        flushRun()
+        return Letter(instructions, self.width,
+                      [variant.arcFitted(tolerance) for variant in self.variants])
 
 
 def readLetters(directory):
@@ -79,16 +240,173 @@ def readLetters(directory):
     return letters
 
 
+class Font:
+    """A directory of glyph files, indexed and parsed only when first needed"""
+
+    def __init__(self, directory, name=None):
+        self.directory = directory
+        self.name = name or os.path.basename(os.path.normpath(directory))
+        self._paths = None
+
+    def __repr__(self):
+        return "Font(%r, %r)" % (self.directory, self.name)
+
+    def paths(self):
+        """Map each character to its glyph file, reading only the header lines"""
+        if self._paths is None:
+            self._paths = {}
+            for root, _, filenames in os.walk(self.directory):
+                for filename in filenames:
+                    path = os.path.join(root, filename)
+                    with open(path, "r") as file:
+                        header = file.readline()
+                    if len(header) > 1:
+                        self._paths[header[1]] = path
+        return self._paths
+
+    def load(self, char):
+        """Parse the glyph for char, or return None if this font does not have it"""
+        path = self.paths().get(char)
+        if path is None:
+            return None
+        with open(path, "r") as file:
+            file.readline()
+            return Letter(file.read())
+
+
+class FontRegistry:
+    """Resolves characters through a chain of fonts, caching parsed glyphs.
+
+    Fonts are searched in registration order, so later fonts act as fallbacks
+    and are only indexed once a character is missing from the earlier ones.
+    Characters missing from every font resolve to fallback_char, if given.
+    At most cache_size glyphs are kept parsed; the least recently used ones
+    are dropped first.
+    """
+
+    def __init__(self, cache_size=512, fallback_char=None):
+        self.fonts = []
+        self.cache_size = cache_size
+        self.fallback_char = fallback_char
+        self._builtin = {
+            " ": Letter([], 4.0),
+            "\n": Letter([], math.inf)
+        }
+        self._cache = OrderedDict()
+
+    def register(self, directory, name=None):
+        font = Font(directory, name)
+        self.fonts.append(font)
+        self._cache.clear()
+        return font
+
+    def _resolve(self, char):
+        if char in self._builtin:
+            return self._builtin[char]
+        if char in self._cache:
+            self._cache.move_to_end(char)
+            return self._cache[char]
+
+        letter = None
+        for font in self.fonts:
+            letter = font.load(char)
+            if letter is not None:
+                break
+
+        # Misses are cached too, so the chain is not walked again for them
+        self._cache[char] = letter
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return letter
+
+    def get(self, char, default=None):
+        letter = self._resolve(char)
+        if letter is None and self.fallback_char is not None and char != self.fallback_char:
+            letter = self._resolve(self.fallback_char)
+        return default if letter is None else letter
+
+    def __getitem__(self, char):
+        letter = self.get(char)
+        if letter is None:
+            raise KeyError(char)
+        return letter
+
+    def __contains__(self, char):
+        return self.get(char) is not None
+
+
 def textToGcode(letters, text, lineLength, lineSpacing, padding, paperWidth, paperHeight, font_size=7.0, 
-                z_height=2, travel_speed=8000, write_speed=4000, z_speed=2000):
+                z_height=2, travel_speed=8000, write_speed=4000, z_speed=2000, arc_tolerance=0,
+                relative_glyphs=False):
+    gcodeLettersArray, _ = layoutText(letters, text, lineLength, lineSpacing, padding, paperWidth, paperHeight,
+                                      font_size, z_height, travel_speed, write_speed, z_speed, arc_tolerance,
+                                      relative_glyphs)
+    return "\n".join(gcodeLettersArray)
+
+
+def measureText(letters, text, params):
+    """Lay out text without producing any G-code.
+
+    params holds the same keys as the GUI parameters (line_length, line_spacing,
+    padding, paper_width, paper_height, font_size). Returns a dict with the
+    number of lines, the height they use (from the first to the last baseline),
+    the height available on the paper and whether the text overflows it.
+    """
+    _, measure = layoutText(letters, text, params["line_length"], params["line_spacing"], params["padding"],
+                            params["paper_width"], params["paper_height"], params["font_size"], emit=False)
+    return measure
+
+
+def fitFontSize(letters, text, params, min_size=0.05, max_size=5.0, precision=0.005):
+    """Find the largest font size in [min_size, max_size] at which text fits the paper, by bisection.
+
+    Returns None if the text does not even fit at min_size.
+    """
+    def fits(font_size):
+        return not measureText(letters, text, dict(params, font_size=font_size))["overflow"]
+
+    if fits(max_size):
+        return max_size
+    if not fits(min_size):
+        return None
+
+    low, high = min_size, max_size
+    while high - low > precision:
+        middle = (low + high) / 2
+        if fits(middle):
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def layoutText(letters, text, lineLength, lineSpacing, padding, paperWidth, paperHeight, font_size=7.0,
+               z_height=2, travel_speed=8000, write_speed=4000, z_speed=2000, arc_tolerance=0,
+               relative_glyphs=False, emit=True):
+    """Lay out text on the paper, returning (G-code lines, measure).
+
+    When emit is False only the layout is computed: glyphs are not scaled,
+    translated or formatted and the G-code lines are not meaningful.
+    """
     gcodeLettersArray = []
     offsetX, offsetY = padding, paperHeight - padding
     current_pen_up = True
 
-    # Apply font scaling to letters
+    # Apply font scaling to the letters used by the text only, so that glyphs
+    # are loaded lazily when letters is a FontRegistry
     scaled_letters = {}
-    for char, letter in letters.items():
-        scaled_letters[char] = letter.scaled(font_size)
+    for char in set(text) | {" "}:
+        letter = letters.get(char)
+        if letter is None:
+            continue
+        if not emit:
+            scaled_letters[char] = Letter([], letter.width * font_size)
+        else:
+            scaled_letters[char] = letter.scaled(font_size)
+            if arc_tolerance > 0:
+                scaled_letters[char] = scaled_letters[char].arcFitted(arc_tolerance)
+
+    placed_chars, lowest_line = 0, None
     
     # Adjust line spacing based on font size
     adjusted_line_spacing = lineSpacing * font_size
@@ -99,6 +417,103 @@ def textToGcode(letters, text, lineLength, lineSpacing, padding, paperWidth, pap
     # Calculate the maximum effective line length based on paper width
     max_line_length = min(lineLength, paperWidth - (2 * padding))
 
+    pen_x, pen_y = offsetX, offsetY
+
+    def moveTo(x, y, comment):
+        nonlocal pen_x, pen_y
+        gcodeLettersArray.append(f"G0 X{x} Y{y} F{travel_speed} ; {comment}")
+        pen_x, pen_y = x, y
+
+    glyphTemplates = {}
+
+    def glyphTemplate(letter):
+        """Render a letter once as a block of relative (G91) moves after its first point.
+
+        Returns (block, pen_up_at_end). The block assumes the pen is up at the
+        letter's first point; Z moves are relative to z_height. Offsets are
+        taken between points rounded to 0.01, so they add up without drift.
+        """
+        cached = glyphTemplates.get(id(letter))
+        if cached is not None:
+            return cached
+
+        lines = ["G91"]
+        pen_up = True
+        previous = (round(letter.instructions[0].x * 100), round(letter.instructions[0].y * 100))
+        for before, instr in zip(letter.instructions, letter.instructions[1:]):
+            point = (round(instr.x * 100), round(instr.y * 100))
+            dx, dy = (point[0] - previous[0]) / 100, (point[1] - previous[1]) / 100
+            if instr.type == Instr.Type.move:
+                if not pen_up:
+                    lines.append(f"G0 Z{z_height} F{z_speed} ; Lift pen")
+                    pen_up = True
+                lines.append(f"G0 X{dx:.2f} Y{dy:.2f} F{travel_speed}")
+            else:
+                if pen_up:
+                    lines.append(f"G1 Z{-z_height} F500 ; Lower pen")
+                    pen_up = False
+                if instr.type == Instr.Type.write:
+                    lines.append(f"G1 X{dx:.2f} Y{dy:.2f} F{write_speed}")
+                else:
+                    i, j = arcOffsets((previous[0] / 100, previous[1] / 100), (point[0] / 100, point[1] / 100),
+                                      (before.x + instr.i, before.y + instr.j))
+                    lines.append(f"G{instr.type.value[0]} X{dx:.2f} Y{dy:.2f} "
+                                 f"I{i:.3f} J{j:.3f} F{write_speed}")
+            previous = point
+        lines.append("G90")
+        glyphTemplates[id(letter)] = ("\n".join(lines), pen_up)
+        return glyphTemplates[id(letter)]
+
+    def emitLetter(letter, x, y):
+        """Append the moves of a letter placed at (x, y), lifting and lowering the pen as needed.
+
+        If the font stores several stroke orders for the letter, the one that
+        is cheapest to reach from the current pen position is drawn.
+        """
+        nonlocal current_pen_up, pen_x, pen_y, placed_chars, lowest_line
+        placed_chars += 1
+        lowest_line = y if lowest_line is None else min(lowest_line, y)
+        if not emit:
+            return
+
+        letter = letter.cheapestVariant(pen_x - x, pen_y - y)
+        if not letter.instructions:
+            return
+        pen_x, pen_y = letter.instructions[-1].x + x, letter.instructions[-1].y + y
+
+        if relative_glyphs and letter.instructions[0].type == Instr.Type.move:
+            if not current_pen_up:
+                gcodeLettersArray.append(f"G0 Z{z_height} F{z_speed} ; Lift pen")
+                current_pen_up = True
+            first = letter.instructions[0]
+            gcodeLettersArray.append(
+                f"G0 X{first.x + x:.2f} Y{first.y + y:.2f} F{travel_speed}")
+            block, current_pen_up = glyphTemplate(letter)
+            gcodeLettersArray.append(block)
+            return
+
+        placed = letter.translated(x, y).instructions
+        for before, instr in zip([None] + placed, placed):
+            if instr.type == Instr.Type.move:
+                if not current_pen_up:
+                    gcodeLettersArray.append(f"G0 Z{z_height} F{z_speed} ; Lift pen")
+                    current_pen_up = True
+                gcodeLettersArray.append(
+                    f"G0 X{instr.x:.2f} Y{instr.y:.2f} F{travel_speed}")
+            else:
+                if current_pen_up:
+                    gcodeLettersArray.append("G1 Z0 F500 ; Lower pen")
+                    current_pen_up = False
+                if instr.type == Instr.Type.write:
+                    gcodeLettersArray.append(
+                        f"G1 X{instr.x:.2f} Y{instr.y:.2f} F{write_speed}")
+                else:
+                    i, j = arcOffsets((before.x, before.y), (instr.x, instr.y),
+                                      (before.x + instr.i, before.y + instr.j))
+                    gcodeLettersArray.append(
+                        f"G{instr.type.value[0]} X{instr.x:.2f} Y{instr.y:.2f} "
+                        f"I{i:.3f} J{j:.3f} F{write_speed}")
+
     # Initial setup commands
     gcodeLettersArray.extend([
         "G28 ; Home all axes",
@@ -145,26 +560,10 @@ def textToGcode(letters, text, lineLength, lineSpacing, padding, paperWidth, pap
                             line_x = padding
                             
                             # Now move to the new line position
-                            gcodeLettersArray.append(
-                                f"G0 X{line_x} Y{offsetY} F{travel_speed} ; New line")
+                            moveTo(line_x, offsetY, "New line")
 
                         # Print the character
-                        letter = scaled_letters[char].translated(line_x, offsetY)
-                        for instr in letter.instructions:
-                            if instr.type == Instr.Type.write:
-                                if current_pen_up:
-                                    gcodeLettersArray.append(
-                                        "G1 Z0 F500 ; Lower pen")
-                                    current_pen_up = False
-                                gcodeLettersArray.append(
-                                    f"G1 X{instr.x:.2f} Y{instr.y:.2f} F{write_speed}")
-                            else:
-                                if not current_pen_up:
-                                    gcodeLettersArray.append(
-                                        f"G0 Z{z_height} F{z_speed} ; Lift pen")
-                                    current_pen_up = True
-                                gcodeLettersArray.append(
-                                    f"G0 X{instr.x:.2f} Y{instr.y:.2f} F{travel_speed}")
+                        emitLetter(scaled_letters[char], line_x, offsetY)
 
                         line_x += char_width
                 else:
@@ -182,23 +581,7 @@ def textToGcode(letters, text, lineLength, lineSpacing, padding, paperWidth, pap
                             if char not in scaled_letters:
                                 continue
 
-                            letter = scaled_letters[char].translated(line_x, offsetY)
-
-                            for instr in letter.instructions:
-                                if instr.type == Instr.Type.write:
-                                    if current_pen_up:
-                                        gcodeLettersArray.append(
-                                            "G1 Z0 F500 ; Lower pen")
-                                        current_pen_up = False
-                                    gcodeLettersArray.append(
-                                        f"G1 X{instr.x:.2f} Y{instr.y:.2f} F{write_speed}")
-                                else:
-                                    if not current_pen_up:
-                                        gcodeLettersArray.append(
-                                            f"G0 Z{z_height} F{z_speed} ; Lift pen")
-                                        current_pen_up = True
-                                    gcodeLettersArray.append(
-                                        f"G0 X{instr.x:.2f} Y{instr.y:.2f} F{travel_speed}")
+                            emitLetter(scaled_letters[char], line_x, offsetY)
 
                             line_x += scaled_letters[char].width + adjusted_padding
 
@@ -217,8 +600,7 @@ def textToGcode(letters, text, lineLength, lineSpacing, padding, paperWidth, pap
                     offsetX = padding
                     
                     # Now move to the new line position
-                    gcodeLettersArray.append(
-                        f"G0 X{offsetX} Y{offsetY} F{travel_speed} ; New line")
+                    moveTo(offsetX, offsetY, "New line")
 
                     # Reset for new line
                     if word_width > max_line_length:
@@ -243,26 +625,10 @@ def textToGcode(letters, text, lineLength, lineSpacing, padding, paperWidth, pap
                                 line_x = padding
                                 
                                 # Now move to the new position
-                                gcodeLettersArray.append(
-                                    f"G0 X{line_x} Y{offsetY} F{travel_speed} ; New line")
+                                moveTo(line_x, offsetY, "New line")
 
                             # Print the character
-                            letter = scaled_letters[char].translated(line_x, offsetY)
-                            for instr in letter.instructions:
-                                if instr.type == Instr.Type.write:
-                                    if current_pen_up:
-                                        gcodeLettersArray.append(
-                                            "G1 Z0 F500 ; Lower pen")
-                                        current_pen_up = False
-                                    gcodeLettersArray.append(
-                                        f"G1 X{instr.x:.2f} Y{instr.y:.2f} F{write_speed}")
-                                else:
-                                    if not current_pen_up:
-                                        gcodeLettersArray.append(
-                                            f"G0 Z{z_height} F{z_speed} ; Lift pen")
-                                        current_pen_up = True
-                                    gcodeLettersArray.append(
-                                        f"G0 X{instr.x:.2f} Y{instr.y:.2f} F{travel_speed}")
+                            emitLetter(scaled_letters[char], line_x, offsetY)
 
                             line_x += char_width
 
@@ -285,21 +651,7 @@ def textToGcode(letters, text, lineLength, lineSpacing, padding, paperWidth, pap
                     if char not in scaled_letters:
                         continue
 
-                    letter = scaled_letters[char].translated(line_x, offsetY)
-
-                    for instr in letter.instructions:
-                        if instr.type == Instr.Type.write:
-                            if current_pen_up:
-                                gcodeLettersArray.append("G1 Z0 F500 ; Lower pen")
-                                current_pen_up = False
-                            gcodeLettersArray.append(
-                                f"G1 X{instr.x:.2f} Y{instr.y:.2f} F{write_speed}")
-                        else:
-                            if not current_pen_up:
-                                gcodeLettersArray.append(f"G0 Z{z_height} F{z_speed} ; Lift pen")
-                                current_pen_up = True
-                            gcodeLettersArray.append(
-                                f"G0 X{instr.x:.2f} Y{instr.y:.2f} F{travel_speed}")
+                    emitLetter(scaled_letters[char], line_x, offsetY)
 
                     line_x += scaled_letters[char].width + adjusted_padding
 
@@ -316,8 +668,7 @@ def textToGcode(letters, text, lineLength, lineSpacing, padding, paperWidth, pap
             break
 
         offsetX = padding
-        gcodeLettersArray.append(
-            f"G0 X{offsetX} Y{offsetY} F{travel_speed} ; New paragraph")
+        moveTo(offsetX, offsetY, "New paragraph")
 
     # Lift pen at end
     if not current_pen_up:
@@ -325,8 +676,17 @@ def textToGcode(letters, text, lineLength, lineSpacing, padding, paperWidth, pap
     
     # Move to home position at end
     gcodeLettersArray.append("G28 ; Return to home position")
-    
-    return "\n".join(gcodeLettersArray)
+
+    top_line = paperHeight - padding
+    lines = 0 if lowest_line is None else round((top_line - lowest_line) / adjusted_line_spacing) + 1
+    expected_chars = sum(1 for word in text.split() for char in word if char in scaled_letters)
+    measure = {
+        "lines": lines,
+        "used_height": 0.0 if lowest_line is None else top_line - lowest_line,
+        "available_height": paperHeight - 2 * padding,
+        "overflow": placed_chars < expected_chars or (lowest_line is not None and lowest_line < padding),
+    }
+    return gcodeLettersArray, measure
 
 def parseArgs(namespace):
     argParser = argparse.ArgumentParser(fromfile_prefix_chars="@",
@@ -337,8 +697,14 @@ def parseArgs(namespace):
                            help="File to read characters from")
     argParser.add_argument("-o", "--output", type=argparse.FileType('w'), required=True, metavar="FILE",
                            help="File in which to save the gcode result")
-    argParser.add_argument("-g", "--gcode-directory", type=str, default="./ascii_gcode/", metavar="DIR",
-                           help="Directory containing the gcode information for all used characters")
+    argParser.add_argument("-g", "--gcode-directory", type=str, action="append", metavar="DIR",
+                           help="Directory containing the gcode information for the used characters; "
+                                "repeat to add fallback fonts, searched in order (default: ./ascii_gcode/)")
+    argParser.add_argument("--fallback-char", type=str, default=None, metavar="CHAR",
+                           help="Character drawn in place of characters missing from every font "
+                                "(default: skip them)")
+    argParser.add_argument("--glyph-cache-size", type=int, default=512,
+                           help="Maximum number of parsed glyphs kept in memory (default: 512)")
 
     # Text options
     argParser.add_argument("-l", "--line-length", type=float, required=True,
@@ -349,6 +715,8 @@ def parseArgs(namespace):
                            help="Empty space between characters")
     argParser.add_argument("-f", "--font-size", type=float, default=1.0,
                            help="Font size scaling factor (default: 1.0)")
+    argParser.add_argument("--auto-fit", action="store_true",
+                           help="Use the largest font size at which the text fits the paper, ignoring --font-size")
 
     # Paper dimension options
     argParser.add_argument("--paper-width", type=float, default=210.0,
@@ -365,6 +733,14 @@ def parseArgs(namespace):
                            help="Writing speed when pen is down (default: 2000mm/min)")
     argParser.add_argument("--z-speed", type=float, default=2000,
                            help="Z-axis movement speed (default: 2000mm/min)")
+    argParser.add_argument("--relative-glyphs", action="store_true",
+                           help="Emit each character as one absolute move followed by a pre-rendered "
+                                "block of relative (G91) moves")
+    argParser.add_argument("--arc-tolerance", type=float, default=0.0,
+                           help="Replace curves with G2/G3 arcs where they deviate less than this "
+                                "from a circle (default: 0, disabled)")
+    argParser.add_argument("--preview", type=str, default=None, metavar="FILE",
+                           help="Also render the result to a PNG or SVG preview, chosen by extension")
 
     argParser.parse_args(namespace=namespace)
 
@@ -373,13 +749,26 @@ def main():
     class Args:
         pass
     parseArgs(Args)
-    letters = readLetters(Args.gcode_directory)
+    letters = FontRegistry(Args.glyph_cache_size, Args.fallback_char)
+    for directory in Args.gcode_directory or ["./ascii_gcode/"]:
+        letters.register(directory)
     data = Args.input.read()
+    if Args.auto_fit:
+        font_size = fitFontSize(letters, data, {
+            "line_length": Args.line_length, "line_spacing": Args.line_spacing, "padding": Args.padding,
+            "paper_width": Args.paper_width, "paper_height": Args.paper_height})
+        if font_size is None:
+            raise SystemExit("Text does not fit the paper at any font size")
+        Args.font_size = font_size
     # Pass the additional parameters to textToGcode
     gcode = textToGcode(letters, data, Args.line_length, Args.line_spacing, Args.padding,
                         Args.paper_width, Args.paper_height, Args.font_size,
-                        Args.z_height, Args.travel_speed, Args.write_speed, Args.z_speed)
+                        Args.z_height, Args.travel_speed, Args.write_speed, Args.z_speed,
+                        Args.arc_tolerance, Args.relative_glyphs)
     Args.output.write(gcode)
+    if Args.preview:
+        from gcode_preview import parse_gcode_paths, render_preview
+        render_preview(parse_gcode_paths(gcode.split('\n')), Args.preview, Args.paper_width, Args.paper_height)
 
 
 if __name__ == '__main__':